@@ -0,0 +1,514 @@
+"""
+Benchmarks of the DAO and service hot paths on synthetic ledgers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench
+    python -m benchmarks.bench --sizes 1000 100000 1000000 --storage json
+    python -m benchmarks.bench --json new.json --compare old.json
+
+Each benchmark is repeated until `--repeat` calls or `--time-limit`
+seconds, whichever comes first, after one untimed warm-up call. The peak
+memory of one more call is measured separately with tracemalloc, which
+would otherwise slow the timed calls down.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from statistics import quantiles
+from typing import Any, Callable, Optional, TextIO
+from uuid import UUID
+
+from business_logic.dto import OperationDTO
+from business_logic.services import (
+    get_all_operation_paginate,
+    get_balance,
+    get_period_report,
+)
+from data_access.columns import ColumnarLedger
+from data_access.dao import DBJsonDAO, db_provider
+from data_access.dates import from_timestamp, to_timestamp
+
+
+SIZES = (1_000, 100_000, 1_000_000)
+
+STORAGES = {
+    "json": {"data_type": ".json", "cache": False},
+    "cached": {"data_type": ".json", "cache": True},
+    "journal": {"data_type": ".json", "journal": True},
+    "sqlite": {"data_type": ".sqlite3"},
+}
+
+DESCRIPTIONS = (
+    "salary",
+    "groceries",
+    "rent",
+    "transport",
+    "coffee",
+    "utilities",
+    "gift",
+    "restaurant",
+)
+
+START_DATE = datetime(2023, 1, 1)
+DAYS = 730
+
+
+def generate_ledger(
+    size: int, seed: int
+) -> dict[str, dict[str, str | float]]:
+    """
+    Generate a reproducible ledger of operations spread over two years.
+
+    Args:
+        size (int): The number of operations.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        dict[str, dict[str, str | float]]: Operations keyed by ID.
+    """
+    rng = random.Random(seed)
+    ledger: dict[str, dict[str, str | float]] = {}
+    for _ in range(size):
+        date = START_DATE + timedelta(seconds=rng.randrange(DAYS * 86_400))
+        ledger[str(UUID(int=rng.getrandbits(128), version=4))] = {
+            "date": to_timestamp(date),
+            "category": "income" if rng.random() < 0.3 else "expense",
+            "amount": round(rng.uniform(1, 5_000), 2),
+            "description": rng.choice(DESCRIPTIONS),
+        }
+    return ledger
+
+
+def create_database(
+    directory: str,
+    storage: str,
+    ledger: dict[str, dict[str, str | float]],
+) -> DBJsonDAO:
+    """
+    Write a ledger to a new database and open it.
+
+    The operations are created with a single `create_many()` call, so the
+    database and its maintained views are written as the application
+    writes them.
+
+    Args:
+        directory (str): The directory of the database files.
+        storage (str): The kind of database, see `STORAGES`.
+        ledger (dict[str, dict[str, str | float]]): Operations keyed by ID.
+
+    Returns:
+        DBJsonDAO: The DAO of the database.
+    """
+    data_name = os.path.join(directory, "bench")
+    options = dict(STORAGES[storage])
+    data_type = options.pop("data_type")
+
+    if data_type == ".json":
+        with open(data_name + data_type, "w") as file:
+            file.write("{}")
+    dao = db_provider(data_name=data_name, data_type=data_type, **options)
+    dao.create_many(
+        OperationDTO(
+            id=operation_id,
+            date=from_timestamp(operation["date"]),
+            category=operation["category"],
+            amount=operation["amount"],
+            description=operation["description"],
+        )
+        for operation_id, operation in ledger.items()
+    )
+    return dao
+
+
+def measure(
+    func: Callable[[], Any], repeat: int, time_limit: float
+) -> dict[str, float | int]:
+    """
+    Time repeated calls of a function and measure its peak memory.
+
+    Args:
+        func (Callable[[], Any]): The benchmarked call.
+        repeat (int): The maximum number of timed calls.
+        time_limit (float): Stop timing after this many seconds, once at
+            least three calls have been made.
+
+    Returns:
+        dict[str, float | int]: The number of calls, throughput (calls per
+            second), latency percentiles and maximum (seconds) and peak
+            memory (bytes).
+    """
+    func()
+
+    latencies: list[float] = []
+    gc.collect()
+    started = time.perf_counter()
+    while len(latencies) < repeat:
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+        if len(latencies) >= 3 and start - started > time_limit:
+            break
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    percentiles = (
+        quantiles(latencies, n=100, method="inclusive")
+        if len(latencies) > 1
+        else latencies * 99
+    )
+    return {
+        "calls": len(latencies),
+        "throughput": len(latencies) / sum(latencies),
+        "p50": percentiles[49],
+        "p90": percentiles[89],
+        "p99": percentiles[98],
+        "max": max(latencies),
+        "peak_memory": peak,
+    }
+
+
+def benchmarks(
+    dao: DBJsonDAO, ledger: dict[str, dict[str, str | float]], seed: int
+) -> dict[str, Callable[[], Any]]:
+    """
+    Build the benchmarked calls for a database holding `ledger`.
+
+    Args:
+        dao (DBJsonDAO): The DAO of the database.
+        ledger (dict[str, dict[str, str | float]]): Its operations.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        dict[str, Callable[[], Any]]: The calls keyed by benchmark name.
+    """
+    rng = random.Random(seed)
+    ids = list(ledger)
+    sample = ledger[ids[len(ids) // 2]]
+    day = from_timestamp(sample["date"])
+    pages = max(len(ids) // 5, 1)
+    cursor = {"after": None}
+
+    def read_by_id() -> None:
+        dao.read(operation_id=rng.choice(ids))
+
+    def paginate_next() -> None:
+        # Walk the pages with the cursor, as the interactive UI does.
+        _, page_ids, _ = get_all_operation_paginate(
+            per_page=5, page_number=2, dao=dao, after=cursor["after"]
+        )
+        cursor["after"] = page_ids[-1] if page_ids else None
+
+    snapshot: dict[str, ColumnarLedger] = {}
+
+    def columns() -> ColumnarLedger:
+        # Loaded once; the columnar benchmarks measure the aggregations.
+        if "ledger" not in snapshot:
+            snapshot["ledger"] = dao.columns()
+        return snapshot["ledger"]
+
+    created: list[UUID] = []
+
+    def create() -> None:
+        created.append(
+            dao.create(
+                OperationDTO(
+                    category="expense",
+                    amount=round(rng.uniform(1, 5_000), 2),
+                    description="benchmark",
+                )
+            )
+        )
+
+    def update() -> None:
+        dao.update(
+            operation_id=rng.choice(ids),
+            data=OperationDTO(
+                category="",
+                amount=round(rng.uniform(1, 5_000), 2),
+                description="",
+            ),
+        )
+
+    def delete() -> None:
+        # Delete the operations created by the create benchmark, so the
+        # ledger keeps its size.
+        if created:
+            dao.delete(operation_id=created.pop())
+        else:
+            dao.create(
+                OperationDTO(
+                    category="expense", amount=1, description="benchmark"
+                )
+            )
+
+    return {
+        "read_all": lambda: dao.read(),
+        "read_by_id": read_by_id,
+        "read_category": lambda: dao.read(filter=("category", "income")),
+        "read_amount": lambda: dao.read(filter=("amount", sample["amount"])),
+        "read_date": lambda: dao.read(filter=("date", day)),
+        "read_date_range": lambda: dao.read(
+            filter=("date", day, day + timedelta(days=30))
+        ),
+        "read_amount_range": lambda: dao.read(
+            filter=("amount", 100, 200)
+        ),
+        "read_compound": lambda: dao.read(
+            filter=[
+                ("category", "expense"),
+                ("date", day, day + timedelta(days=30)),
+                ("amount", 100, None),
+            ]
+        ),
+        "get_balance": lambda: get_balance(dao=dao),
+        "balance_as_of": lambda: get_balance(as_of=day, dao=dao),
+        "monthly_report": lambda: get_period_report(dao=dao),
+        "columns_load": lambda: dao.columns(),
+        "columns_balance": lambda: columns().balance(),
+        "columns_monthly": lambda: columns().monthly_sums(),
+        "columns_count": lambda: columns().count(
+            category="expense",
+            start=day,
+            end=day + timedelta(days=30),
+            min_amount=100,
+        ),
+        "paginate_first": lambda: get_all_operation_paginate(
+            per_page=5, page_number=1, dao=dao
+        ),
+        "paginate_middle": lambda: get_all_operation_paginate(
+            per_page=5, page_number=pages // 2, dao=dao
+        ),
+        "paginate_last": lambda: get_all_operation_paginate(
+            per_page=5, page_number=pages, dao=dao
+        ),
+        "paginate_next": paginate_next,
+        "create": create,
+        "update": update,
+        "delete": delete,
+    }
+
+
+WRITES = ("create", "update", "delete")
+
+
+def run_benchmarks(
+    sizes: tuple[int, ...],
+    storage: str,
+    repeat: int,
+    write_repeat: int,
+    time_limit: float,
+    seed: int,
+    only: Optional[list[str]] = None,
+    log: Optional[TextIO] = None,
+) -> dict[str, Any]:
+    """
+    Run the benchmarks on a fresh synthetic ledger of every size.
+
+    Args:
+        sizes (tuple[int, ...]): The numbers of operations.
+        storage (str): The kind of database, see `STORAGES`.
+        repeat (int): The maximum number of calls of a read benchmark.
+        write_repeat (int): The maximum number of calls of a write
+            benchmark.
+        time_limit (float): The time budget of a benchmark in seconds.
+        seed (int): The seed of the random generator.
+        only (Optional[list[str]]): Run only these benchmarks.
+        log (Optional[TextIO]): Where to report progress.
+
+    Returns:
+        dict[str, Any]: The environment and the results keyed by size and
+            benchmark name.
+    """
+    report: dict[str, Any] = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "storage": storage,
+        "seed": seed,
+        "results": {},
+    }
+
+    for size in sizes:
+        directory = tempfile.mkdtemp(prefix="cashflow-bench-")
+        try:
+            ledger = generate_ledger(size, seed)
+            dao = create_database(directory, storage, ledger)
+            results = report["results"][str(size)] = {}
+
+            for name, func in benchmarks(dao, ledger, seed).items():
+                if only and name not in only:
+                    continue
+                if log:
+                    log.write(f"{size:>9} {name}...\n")
+                    log.flush()
+                results[name] = measure(
+                    func,
+                    write_repeat if name in WRITES else repeat,
+                    time_limit,
+                )
+
+            if hasattr(dao, "close"):
+                dao.close()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    return report
+
+
+def git_commit() -> Optional[str]:
+    """
+    Return the commit of the working tree, marked "+dirty" if it differs.
+
+    Returns:
+        Optional[str]: The commit, or None outside a git repository.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+dirty" if dirty else "")
+
+
+def format_report(
+    report: dict[str, Any], baseline: Optional[dict[str, Any]] = None
+) -> str:
+    """
+    Format benchmark results as a table.
+
+    Args:
+        report (dict[str, Any]): The results of `run_benchmarks()`.
+        baseline (Optional[dict[str, Any]]): Earlier results to compare the
+            median latency with.
+
+    Returns:
+        str: The table.
+    """
+    lines = [
+        f"commit {report['commit']}, Python {report['python']}, "
+        f"{report['platform']}, storage {report['storage']}, "
+        f"seed {report['seed']}"
+    ]
+    if baseline:
+        lines.append(
+            f"compared with commit {baseline['commit']} "
+            "(p50 ratio, < 1 is faster)"
+        )
+
+    header = (
+        f"{'size':>9} {'benchmark':<18} {'calls':>6} {'ops/s':>11} "
+        f"{'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'max ms':>10} "
+        f"{'peak MiB':>9}"
+    )
+    if baseline:
+        header += f" {'vs base':>8}"
+    lines.append(header)
+
+    for size, results in report["results"].items():
+        for name, result in results.items():
+            line = (
+                f"{size:>9} {name:<18} {result['calls']:>6} "
+                f"{result['throughput']:>11.1f} "
+                f"{result['p50'] * 1e3:>10.3f} {result['p90'] * 1e3:>10.3f} "
+                f"{result['p99'] * 1e3:>10.3f} {result['max'] * 1e3:>10.3f} "
+                f"{result['peak_memory'] / 2**20:>9.2f}"
+            )
+            base = (baseline or {}).get("results", {}).get(size, {}).get(name)
+            if base:
+                line += f" {result['p50'] / base['p50']:>8.2f}"
+            lines.append(line)
+
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = ArgumentParser(description="CashFlowTracker benchmarks.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=SIZES,
+        help="Ledger sizes (default: 1000 100000 1000000).",
+    )
+    parser.add_argument(
+        "--storage", choices=tuple(STORAGES), default="cached"
+    )
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--write-repeat", type=int, default=20)
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=5.0,
+        help="Seconds spent timing one benchmark (default: 5).",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--only", nargs="+", help="Run only these benchmarks."
+    )
+    parser.add_argument(
+        "--output", help="Also write the table to this file."
+    )
+    parser.add_argument("--json", help="Also save the results as JSON.")
+    parser.add_argument(
+        "--compare", help="JSON results of an earlier run to compare with."
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    report = run_benchmarks(
+        sizes=tuple(args.sizes),
+        storage=args.storage,
+        repeat=args.repeat,
+        write_repeat=args.write_repeat,
+        time_limit=args.time_limit,
+        seed=args.seed,
+        only=args.only,
+        log=sys.stderr,
+    )
+
+    table = format_report(report, baseline)
+    sys.stdout.write(table)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(table)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
-from .operation import OperationDTO
+from .operation import OperationDTO, OperationRecord
+from .report import PeriodTotalsDTO
 
-__all__ = ["OperationDTO"]
+__all__ = ["OperationDTO", "OperationRecord", "PeriodTotalsDTO"]
@@ -4,11 +4,13 @@ from uuid import UUID
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationDTO:
     """
     Data class representing an operation.
 
+    Instances have no `__dict__`, which keeps bulk imports light.
+
     Attributes:
         category (str): The category of the operation (e.g., "income" or "expense").
         amount (float): The amount of the operation.
@@ -22,3 +24,26 @@ class OperationDTO:
     description: str
     id: Optional[UUID] = None
     date: Optional[datetime] = None
+
+
+@dataclass(frozen=True, slots=True)
+class OperationRecord:
+    """
+    Immutable operation read from the database.
+
+    Returned by the bulk read paths (see `FileDB.iter_records()`) with the
+    ID and date already parsed, and without a per-instance `__dict__`.
+
+    Attributes:
+        id (UUID): The unique identifier of the operation.
+        date (datetime): The date of the operation.
+        category (str): The category of the operation.
+        amount (float): The amount of the operation.
+        description (str): The description of the operation.
+    """
+
+    id: UUID
+    date: datetime
+    category: str
+    amount: float
+    description: str
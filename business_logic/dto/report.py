@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodTotalsDTO:
+    """
+    Totals of the operations of one period of a report.
+
+    Attributes:
+        start (date): The first day of the period.
+        amounts (dict[str, float]): The sum of the amounts per category.
+        counts (dict[str, int]): The number of operations per category.
+        net (float): The income minus the expenses of the period.
+        balance (float): The balance at the end of the period, including
+            the operations before the report.
+    """
+
+    start: date
+    amounts: dict[str, float]
+    counts: dict[str, int]
+    net: float
+    balance: float
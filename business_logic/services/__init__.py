@@ -1,17 +1,52 @@
 from .operation import (
+    list_operations,
+    find_operation,
     get_all_operation_paginate,
     get_operation,
     delete_operation,
     update_operation,
     create_operation,
+    import_operations,
+    export_operations,
+    operation_batch,
+)
+from .balance import (
+    get_balance,
+    verify_balance,
+    rebuild_balance,
+)
+from .report import get_period_report, get_period_report_text
+from .storage import (
+    convert_storage,
+    migrate_storage,
+    partition_storage,
+)
+from .parallel import (
+    find_parallel_operations,
+    get_parallel_balance,
+    get_parallel_period_report,
 )
-from .balance import get_balance
 
 __all__ = [
+    "list_operations",
+    "find_operation",
     "get_all_operation_paginate",
     "get_operation",
     "delete_operation",
     "update_operation",
     "get_balance",
+    "verify_balance",
+    "rebuild_balance",
+    "get_period_report",
+    "get_period_report_text",
     "create_operation",
+    "import_operations",
+    "export_operations",
+    "operation_batch",
+    "convert_storage",
+    "migrate_storage",
+    "partition_storage",
+    "get_parallel_balance",
+    "find_parallel_operations",
+    "get_parallel_period_report",
 ]
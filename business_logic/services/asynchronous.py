@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from data_access.async_dao import AsyncDAO
+from data_access.dao import db_provider
+from business_logic.services import balance, operation
+
+if TYPE_CHECKING:
+    from datetime import date, datetime
+    from uuid import UUID
+    from business_logic.dto import OperationDTO
+
+from config import DB_NAME, DB_EXTENSION
+
+
+async_dao = AsyncDAO(db_provider(DB_NAME, DB_EXTENSION))
+
+
+async def get_balance(
+    dao: AsyncDAO = async_dao, as_of: Optional[datetime | date] = None
+) -> float:
+    """
+    Asynchronous `get_balance()`.
+
+    Args:
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+        as_of (Optional[datetime | date]): Count only the operations up to
+            the end of this day. Defaults to None, the current balance.
+
+    Returns:
+        float: The calculated balance.
+    """
+    return await dao.run(balance.get_balance, as_of=as_of, dao=dao.dao)
+
+
+async def verify_balance(dao: AsyncDAO = async_dao) -> bool:
+    """
+    Asynchronous `verify_balance()`.
+
+    Args:
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+
+    Returns:
+        bool: True if the maintained totals match the operations.
+    """
+    return await dao.run(balance.verify_balance, dao=dao.dao)
+
+
+async def get_all_operation_paginate(
+    per_page: int = 5,
+    page_number: int = 1,
+    filter: Optional[tuple | list[tuple]] = None,
+    dao: AsyncDAO = async_dao,
+    after: Optional[UUID] = None,
+    before: Optional[UUID] = None,
+    order_by: str = "date",
+    descending: bool = False,
+) -> tuple[str, list[str], set[Optional[str]]]:
+    """
+    Asynchronous `get_all_operation_paginate()`.
+
+    Args:
+        per_page (int): Number of operations per page (default is 5).
+        page_number (int): Page number (default is 1).
+        filter (Optional[tuple | list[tuple]]): Optional filter for
+            operations (see `split_filter()`).
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+        after (Optional[UUID]): ID of the last operation of the previous
+            page.
+        before (Optional[UUID]): ID of the first operation of the next page.
+        order_by (str): Field to sort by (default is "date").
+        descending (bool): Sort from the largest value to the smallest
+            (default is False).
+
+    Returns:
+        tuple[str, list[str], set[Optional[str]]]: The text of the page, the
+            IDs of its operations and the navigation buttons.
+    """
+    return await dao.run(
+        operation.get_all_operation_paginate,
+        per_page=per_page,
+        page_number=page_number,
+        filter=filter,
+        dao=dao.dao,
+        after=after,
+        before=before,
+        order_by=order_by,
+        descending=descending,
+    )
+
+
+async def get_operation(
+    operation_id: UUID, dao: AsyncDAO = async_dao
+) -> Optional[str]:
+    """
+    Asynchronous `get_operation()`.
+
+    Args:
+        operation_id (UUID): The unique identifier of the operation.
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+
+    Returns:
+        Optional[str]: A formatted text representing the operation.
+
+    Raises:
+        OperationDoesNotExistError: If the operation does not exist.
+    """
+    return await dao.run(
+        operation.get_operation, operation_id=operation_id, dao=dao.dao
+    )
+
+
+async def create_operation(
+    data: OperationDTO, dao: AsyncDAO = async_dao
+) -> UUID:
+    """
+    Asynchronous `create_operation()`.
+
+    Args:
+        data (OperationDTO): The data for the new operation.
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+
+    Returns:
+        UUID: The ID of the new operation.
+    """
+    return await dao.run_write(
+        operation.create_operation, data=data, dao=dao.dao
+    )
+
+
+async def update_operation(
+    operation_id: UUID, data: OperationDTO, dao: AsyncDAO = async_dao
+) -> Optional[str]:
+    """
+    Asynchronous `update_operation()`.
+
+    Args:
+        operation_id (UUID): The unique identifier of the operation.
+        data (OperationDTO): The new data for the operation.
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+
+    Returns:
+        Optional[str]: A message indicating the success of the operation.
+
+    Raises:
+        OperationDoesNotExistError: If the operation does not exist.
+    """
+    return await dao.run_write(
+        operation.update_operation,
+        operation_id=operation_id,
+        data=data,
+        dao=dao.dao,
+    )
+
+
+async def delete_operation(
+    operation_id: UUID, dao: AsyncDAO = async_dao
+) -> Optional[str]:
+    """
+    Asynchronous `delete_operation()`.
+
+    Args:
+        operation_id (UUID): The unique identifier of the operation.
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+
+    Returns:
+        Optional[str]: A message indicating the success of the operation.
+
+    Raises:
+        OperationDoesNotExistError: If the operation does not exist.
+    """
+    return await dao.run_write(
+        operation.delete_operation, operation_id=operation_id, dao=dao.dao
+    )
+
+
+async def import_operations(
+    operations: Iterable[OperationDTO], dao: AsyncDAO = async_dao
+) -> int:
+    """
+    Asynchronous `import_operations()`.
+
+    The operations are consumed in the executor.
+
+    Args:
+        operations (Iterable[OperationDTO]): The data for the new
+            operations.
+        dao (AsyncDAO, optional): Asynchronous database access object.
+            Defaults to async_dao.
+
+    Returns:
+        int: The number of imported operations.
+    """
+    return await dao.run_write(
+        operation.import_operations, operations=operations, dao=dao.dao
+    )
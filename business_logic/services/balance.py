@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import date, datetime
+from math import isclose
+from typing import TYPE_CHECKING, Optional
 
 from data_access.dao import db_provider
 
@@ -14,25 +16,96 @@ from config import DB_NAME, DB_EXTENSION
 dao = db_provider(DB_NAME, DB_EXTENSION)
 
 
-def get_balance(dao: DBJsonDAO = dao) -> float:
+def get_balance(
+    dao: DBJsonDAO = dao, as_of: Optional[datetime | date] = None
+) -> float:
     """
     Calculate the balance based on income and expense operations.
 
+    The balance is taken from the per-category totals maintained by the
+    storage layer, so it does not depend on the number of operations. A
+    past balance is answered from the prefix sums of the daily rollup.
+    The maintained sums are updated incrementally and collect floating
+    point error, so the balance is rounded to cents.
+
+    Args:
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+        as_of (Optional[datetime | date]): Count only the operations up to
+            the end of this day. Defaults to None, the current balance.
+
     Returns:
         float: The calculated balance.
 
     Raises:
-        Any exceptions raised by `dao.read()`.
+        Any exceptions raised by `dao.totals()` or `dao.balance()`.
     """
-    operations = dao.read()
+    if as_of is not None:
+        return round(dao.balance(as_of=as_of), 2)
+
+    totals = dao.totals()
 
     balance: float = 0.0
 
-    for operation in operations:
-        amount = operations[operation]["amount"]
-        if operations[operation]["category"] == "income":
+    for category in totals:
+        amount = totals[category]["amount"]
+        if category == "income":
             balance += amount
         else:
             balance -= amount
 
-    return balance
+    return round(balance, 2)
+
+
+def verify_balance(dao: DBJsonDAO = dao) -> bool:
+    """
+    Check the maintained totals against a full scan of the operations.
+
+    The operations are streamed, so the scan runs in bounded memory.
+
+    Args:
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        bool: True if the maintained totals match the operations.
+
+    Raises:
+        Any exceptions raised by `dao.iter_operations()` or `dao.totals()`.
+    """
+    expected: dict[str, dict[str, float | int]] = {}
+
+    for _, operation in dao.iter_operations():
+        total = expected.setdefault(
+            operation["category"], {"amount": 0.0, "count": 0}
+        )
+        total["amount"] += operation["amount"]
+        total["count"] += 1
+
+    totals = dao.totals()
+
+    return expected.keys() == totals.keys() and all(
+        totals[category]["count"] == expected[category]["count"]
+        and isclose(
+            totals[category]["amount"],
+            expected[category]["amount"],
+            abs_tol=1e-6,
+        )
+        for category in expected
+    )
+
+
+def rebuild_balance(dao: DBJsonDAO = dao) -> float:
+    """
+    Rebuild the maintained totals from the operations.
+
+    Args:
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        float: The balance after the rebuild.
+
+    Raises:
+        Any exceptions raised by `dao.rebuild()`.
+    """
+    dao.rebuild()
+    return get_balance(dao=dao)
+
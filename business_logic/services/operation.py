@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 from math import ceil
-from datetime import datetime
 
 if TYPE_CHECKING:
     from uuid import UUID
-    from business_logic.dto import OperationDTO
-    from data_access.dao import DBJsonDAO
+    from business_logic.dto import OperationDTO, OperationRecord
+    from data_access.dao import Batch, DBJsonDAO
 
-from data_access.dao import db_provider
+from data_access.dao import db_provider, to_record
 from data_access.exceptions import RecordDoesNotExistError
 from business_logic.exceptions import OperationDoesNotExistError
 
@@ -19,20 +19,101 @@ from config import DB_NAME, DB_EXTENSION
 dao = db_provider(DB_NAME, DB_EXTENSION)
 
 
+def list_operations(
+    per_page: int = 5,
+    page_number: int = 1,
+    filter: Optional[tuple | list[tuple]] = None,
+    dao: DBJsonDAO = dao,
+    after: Optional[UUID] = None,
+    before: Optional[UUID] = None,
+    order_by: str = "date",
+    descending: bool = False,
+) -> tuple[list[OperationRecord], int]:
+    """
+    Retrieve one page of operations from the database.
+
+    Operations are ordered by `order_by`, ties by date. When a cursor
+    (`after` or `before`) is given, the page is read relative to that
+    operation; if the operation no longer exists, the page is located by
+    `page_number` instead.
+
+    Args:
+        per_page (int): Number of operations per page (default is 5).
+        page_number (int): Page number (default is 1).
+        filter (Optional[tuple | list[tuple]]): Optional filter for operations,
+            a predicate or a list of predicates (see `split_filter()`).
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+        after (Optional[UUID]): ID of the last operation of the previous
+            page.
+        before (Optional[UUID]): ID of the first operation of the next page.
+        order_by (str): Field to sort by: "date", "amount" or "category"
+            (default is "date").
+        descending (bool): Sort from the largest value to the smallest
+            (default is False).
+
+    Returns:
+        tuple[list[OperationRecord], int]: The operations of the page and
+            the total number of matching operations.
+
+    Raises:
+        Any exceptions raised by `dao.page()`.
+    """
+    try:
+        operations, total = dao.page(
+            per_page=per_page,
+            offset=(page_number - 1) * per_page,
+            after=after,
+            before=before,
+            filter=filter,
+            order_by=order_by,
+            descending=descending,
+        )
+    except RecordDoesNotExistError:
+        # The cursor operation has been deleted, fall back to the page number.
+        operations, total = dao.page(
+            per_page=per_page,
+            offset=(page_number - 1) * per_page,
+            filter=filter,
+            order_by=order_by,
+            descending=descending,
+        )
+    return [
+        to_record(operation_id, operation)
+        for operation_id, operation in operations.items()
+    ], total
+
+
 def get_all_operation_paginate(
     per_page: int = 5,
     page_number: int = 1,
-    filter: Optional[tuple[str, str | float]] = None,
+    filter: Optional[tuple | list[tuple]] = None,
     dao: DBJsonDAO = dao,
+    after: Optional[UUID] = None,
+    before: Optional[UUID] = None,
+    order_by: str = "date",
+    descending: bool = False,
 ) -> tuple[str, list[str], set[Optional[str]]]:
     """
     Retrieve a paginated list of all operations from the database.
 
+    Operations are ordered by `order_by`, ties by date. When a cursor
+    (`after` or `before`) is given, the page is read relative to that
+    operation and `page_number` is only used for display; otherwise the
+    page is located by its number.
+
     Args:
         per_page (int): Number of operations per page (default is 5).
         page_number (int): Page number (default is 1).
-        filter (Optional[tuple[str, str | float]]): Optional filter for operations.
+        filter (Optional[tuple | list[tuple]]): Optional filter for operations,
+            a predicate or a list of predicates (see `split_filter()`).
         dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+        after (Optional[UUID]): ID of the last operation of the previous
+            page.
+        before (Optional[UUID]): ID of the first operation of the next page.
+        order_by (str): Field to sort by: "date", "amount" or "category"
+            (default is "date").
+        descending (bool): Sort from the largest value to the smallest
+            (default is False).
 
     Returns:
         tuple[str, list[str], set[Optional[str]]]: A tuple containing:
@@ -41,30 +122,34 @@ def get_all_operation_paginate(
             - Set of buttons for navigation (e.g., 'prev', 'next').
 
     Raises:
-        Any exceptions raised by `dao.read()`.
+        Any exceptions raised by `dao.page()`.
     """
-
-    operations = dao.read(filter=filter)
-
-    pages: int = ceil(len(operations) / per_page)
+    operations, total = list_operations(
+        per_page=per_page,
+        page_number=page_number,
+        filter=filter,
+        dao=dao,
+        after=after,
+        before=before,
+        order_by=order_by,
+        descending=descending,
+    )
+
+    pages: int = ceil(total / per_page)
 
     result_text: str = "\n------------------------------------\n"
 
-    start_index: int = (page_number - 1) * per_page
-    end_index: int = start_index + per_page
-
-    ids = list(operations.keys())[start_index:end_index]
+    ids = [str(operation.id) for operation in operations]
 
-    for index, operation_id in enumerate(ids):
+    for index, operation in enumerate(operations):
         spaces = " " * len(str(index + 1))
-        operation = operations.get(operation_id)
-        date = datetime.strptime(operation.get("date"), "%Y-%m-%dT%H:%M:%S.%f")
+        date = operation.date.strftime("%d-%m-%Y %H:%M:%S")
 
         result_text += (
-            f"{index + 1} - Date: {date.strftime('%d-%m-%Y %H:%M:%S')}\n"
-            f"{spaces}   Category: {operation.get('category')}\n"
-            f"{spaces}   Amount: {operation.get('amount')}\n"
-            f"{spaces}   Description: {operation.get('description')}\n"
+            f"{index + 1} - Date: {date}\n"
+            f"{spaces}   Category: {operation.category}\n"
+            f"{spaces}   Amount: {operation.amount}\n"
+            f"{spaces}   Description: {operation.description}\n"
             f"------------------------------------\n"
         )
 
@@ -92,6 +177,29 @@ def get_all_operation_paginate(
     return result_text, ids, buttons
 
 
+def find_operation(operation_id: UUID, dao: DBJsonDAO = dao) -> OperationDTO:
+    """
+    Retrieve a specific operation by its ID.
+
+    Args:
+        operation_id (UUID): The unique identifier of the operation.
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        OperationDTO: The operation.
+
+    Raises:
+        OperationDoesNotExistError: If the operation with the specified ID does not exist.
+    """
+    try:
+        return dao.read(operation_id=operation_id)
+
+    except RecordDoesNotExistError:
+        raise OperationDoesNotExistError(
+            f"Operation with ID {operation_id} does not exits."
+        )
+
+
 def get_operation(operation_id: UUID, dao: DBJsonDAO = dao) -> Optional[str]:
     """
     Retrieve details of a specific operation by its ID.
@@ -181,12 +289,85 @@ def update_operation(
         )
 
 
-def create_operation(data: OperationDTO, dao: DBJsonDAO = dao) -> None:
+def create_operation(data: OperationDTO, dao: DBJsonDAO = dao) -> UUID:
     """
     Create a new operation in the database.
 
     Args:
         data (OperationDTO): The data for the new operation.
         dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        UUID: The ID of the new operation.
+    """
+    return dao.create(data=data)
+
+
+def import_operations(
+    operations: Iterable[OperationDTO], dao: DBJsonDAO = dao
+) -> int:
+    """
+    Create many operations in the database with a single write.
+
+    Args:
+        operations (Iterable[OperationDTO]): The data for the new
+            operations.
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        int: The number of imported operations.
     """
-    dao.create(data=data)
+    return dao.create_many(operations=operations)
+
+
+def export_operations(
+    filter: Optional[tuple | list[tuple]] = None, dao: DBJsonDAO = dao
+) -> Iterator[OperationRecord]:
+    """
+    Stream the operations from the database, optionally filtered.
+
+    Operations are read one at a time in storage order, so memory use does
+    not grow with the size of the database.
+
+    Args:
+        filter (Optional[tuple | list[tuple]]): Optional filter for
+            operations, a predicate or a list of predicates (see
+            `split_filter()`).
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Yields:
+        OperationRecord: The operations.
+    """
+    yield from dao.iter_records(filter=filter)
+
+
+@contextmanager
+def operation_batch(dao: DBJsonDAO = dao) -> Iterator[Batch]:
+    """
+    Apply many creates, updates and deletes with a single write.
+
+    The database is loaded once; the collected mutations are written when
+    the block exits and discarded if it raises.
+
+    Example:
+        with operation_batch() as batch:
+            for operation_id in ids:
+                batch.update(operation_id=operation_id, data=data)
+
+    Args:
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Yields:
+        Batch: The batch with `create()`, `update()` and `delete()` methods.
+
+    Raises:
+        OperationDoesNotExistError: If an updated or deleted operation does
+            not exist; nothing is written then.
+    """
+    try:
+        with dao.batch() as batch:
+            yield batch
+    except RecordDoesNotExistError as err:
+        raise OperationDoesNotExistError(
+            "An operation of the batch does not exist, nothing was changed."
+        ) from err
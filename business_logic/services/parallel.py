@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Optional
+
+from business_logic.services.report import build_report
+from data_access.dao import db_provider, to_record
+from data_access.dates import PERIODS
+from data_access.parallel import ParallelLedger
+from data_access.partitioned import DBPartitionedDAO
+
+if TYPE_CHECKING:
+    from business_logic.dto import OperationRecord, PeriodTotalsDTO
+    from data_access.dao import DBJsonDAO
+
+
+from config import DB_NAME, DB_EXTENSION
+
+
+dao = db_provider(DB_NAME, DB_EXTENSION)
+
+
+def parallel_ledger(dao: DBJsonDAO = dao) -> ParallelLedger:
+    """
+    Return the parallel engine over the live partitions of a database.
+
+    The engine reads the month files of the partitioned database directly,
+    so it always sees the latest writes.
+
+    Args:
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        ParallelLedger: The engine.
+
+    Raises:
+        ValueError: If the database is not partitioned (see
+            `DB_PARTITIONED`).
+    """
+    if not isinstance(dao, DBPartitionedDAO):
+        raise ValueError(
+            "Parallel processing needs a partitioned database, "
+            "set DB_PARTITIONED = True."
+        )
+    return ParallelLedger(dao.directory)
+
+
+def get_parallel_balance(dao: DBJsonDAO = dao) -> float:
+    """
+    Calculate the balance by scanning the monthly partitions in parallel.
+
+    Every partition is scanned by a worker process, so the result does
+    not depend on the maintained totals (see `verify_balance()`).
+
+    Args:
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        float: The calculated balance.
+
+    Raises:
+        ValueError: If the database is not partitioned.
+    """
+    return round(parallel_ledger(dao).balance(), 2)
+
+
+def find_parallel_operations(
+    filter: Optional[tuple | list[tuple]] = None, dao: DBJsonDAO = dao
+) -> list[OperationRecord]:
+    """
+    Find the operations matching a filter by scanning partitions in parallel.
+
+    Date predicates select the partitions that are scanned.
+
+    Args:
+        filter (Optional[tuple | list[tuple]]): A filter for the data, see
+            `split_filter()`.
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        list[OperationRecord]: The matching operations, in month order.
+
+    Raises:
+        ValueError: If the database is not partitioned.
+    """
+    return [
+        to_record(operation_id, operation)
+        for operation_id, operation in parallel_ledger(dao)
+        .read(filter=filter)
+        .items()
+    ]
+
+
+def get_parallel_period_report(
+    period: str = "month",
+    start: Optional[datetime | date] = None,
+    end: Optional[datetime | date] = None,
+    dao: DBJsonDAO = dao,
+) -> list[PeriodTotalsDTO]:
+    """
+    Sum the operations per period by scanning partitions in parallel.
+
+    The same report as `get_period_report()`, summed from the operations
+    instead of the daily rollup. Only the partitions of the months in the
+    range are scanned; the opening balance is taken from the maintained
+    prefix sums.
+
+    Args:
+        period (str): "day", "week", "month" or "year" (default is
+            "month"). Weeks start on Monday.
+        start (Optional[datetime | date]): The first day of the report,
+            None for the first operation.
+        end (Optional[datetime | date]): The last day of the report
+            (inclusive), None for the last operation.
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        list[PeriodTotalsDTO]: The periods with operations, in date order.
+
+    Raises:
+        ValueError: If the period is unknown or the database is not
+            partitioned.
+    """
+    if period not in PERIODS:
+        raise ValueError(f'Unknown period "{period}".')
+
+    ledger = parallel_ledger(dao)
+    opening = 0.0
+    if start is not None:
+        opening = dao.balance(as_of=start - timedelta(days=1))
+    return build_report(
+        ledger.period_totals(period=period, start=start, end=end), opening
+    )
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Optional
+
+from business_logic.dto import PeriodTotalsDTO
+from data_access.dao import db_provider
+from data_access.dates import PERIODS, period_start
+
+if TYPE_CHECKING:
+    from data_access.dao import DBJsonDAO
+
+
+from config import DB_NAME, DB_EXTENSION
+
+
+dao = db_provider(DB_NAME, DB_EXTENSION)
+
+
+def get_period_report(
+    period: str = "month",
+    start: Optional[datetime | date] = None,
+    end: Optional[datetime | date] = None,
+    dao: DBJsonDAO = dao,
+) -> list[PeriodTotalsDTO]:
+    """
+    Sum the operations per period and category with a running balance.
+
+    The totals are summed from the daily rollup maintained by the storage
+    layer (see `dao.daily_totals()`), so the cost depends on the number of
+    days with operations in the range, not on the number of operations.
+    The opening balance is the maintained balance at the end of the day
+    before `start` (see `dao.balance()`). The amounts are rounded to
+    cents.
+
+    Args:
+        period (str): "day", "week", "month" or "year" (default is
+            "month"). Weeks start on Monday.
+        start (Optional[datetime | date]): The first day of the report,
+            None for the first operation.
+        end (Optional[datetime | date]): The last day of the report
+            (inclusive), None for the last operation.
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        list[PeriodTotalsDTO]: The periods with operations, in date order.
+
+    Raises:
+        ValueError: If the period is unknown.
+        Any exceptions raised by `dao.daily_totals()` and
+            `dao.balance()`.
+    """
+    if period not in PERIODS:
+        raise ValueError(f'Unknown period "{period}".')
+
+    opening: float = 0.0
+    if start is not None:
+        opening = dao.balance(as_of=start - timedelta(days=1))
+    periods: dict[date, dict[str, list[float | int]]] = {}
+
+    for day, totals in dao.daily_totals(start=start, end=end).items():
+        period_totals = periods.setdefault(period_start(day, period), {})
+        for category, total in totals.items():
+            period_total = period_totals.setdefault(category, [0.0, 0])
+            period_total[0] += total["amount"]
+            period_total[1] += total["count"]
+
+    return build_report(
+        {
+            period_day: {
+                category: {"amount": amount, "count": count}
+                for category, (amount, count) in totals.items()
+            }
+            for period_day, totals in periods.items()
+        },
+        opening,
+    )
+
+
+def build_report(
+    periods: dict[date, dict[str, dict[str, float | int]]],
+    opening: float = 0.0,
+) -> list[PeriodTotalsDTO]:
+    """
+    Turn the totals per period into report rows with a running balance.
+
+    Args:
+        periods (dict[date, dict[str, dict[str, float | int]]]):
+            {"amount": ..., "count": ...} keyed by category, keyed by the
+            first day of the period in date order.
+        opening (float): The balance before the first period.
+
+    Returns:
+        list[PeriodTotalsDTO]: The periods, with the amounts rounded to
+            cents.
+    """
+    report: list[PeriodTotalsDTO] = []
+    balance = opening
+    for period_day, totals in periods.items():
+        net = sum(
+            total["amount"] if category == "income" else -total["amount"]
+            for category, total in totals.items()
+        )
+        balance += net
+        report.append(
+            PeriodTotalsDTO(
+                start=period_day,
+                amounts={
+                    category: round(total["amount"], 2)
+                    for category, total in sorted(totals.items())
+                },
+                counts={
+                    category: total["count"]
+                    for category, total in sorted(totals.items())
+                },
+                net=round(net, 2),
+                balance=round(balance, 2),
+            )
+        )
+    return report
+
+
+def get_period_report_text(
+    period: str = "month",
+    start: Optional[datetime | date] = None,
+    end: Optional[datetime | date] = None,
+    dao: DBJsonDAO = dao,
+) -> str:
+    """
+    Format the period report for display.
+
+    Args:
+        period (str): "day", "week", "month" or "year" (default is
+            "month").
+        start (Optional[datetime | date]): The first day of the report,
+            None for the first operation.
+        end (Optional[datetime | date]): The last day of the report
+            (inclusive), None for the last operation.
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        str: A formatted text representing the report for display.
+
+    Raises:
+        ValueError: If the period is unknown.
+        Any exceptions raised by `dao.daily_totals()`.
+    """
+    report = get_period_report(period=period, start=start, end=end, dao=dao)
+
+    result_text: str = "\n------------------------------------\n"
+
+    for totals in report:
+        result_text += f"{period.capitalize()} from {totals.start:%d-%m-%Y}\n"
+        for category, amount in totals.amounts.items():
+            result_text += (
+                f"   {category.capitalize()}: {amount} "
+                f"({totals.counts[category]} operations)\n"
+            )
+        result_text += (
+            f"   Net: {totals.net}\n"
+            f"   Balance: {totals.balance}\n"
+            f"------------------------------------\n"
+        )
+
+    if not report:
+        result_text += "No operations found.\n"
+
+    return result_text
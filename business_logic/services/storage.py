@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from data_access.dao import db_provider
+from data_access.partitioned import DBPartitionedDAO
+from data_access.shards import partition_directory, write_shards
+from data_access.sqlite import DBSqliteDAO
+
+if TYPE_CHECKING:
+    from data_access.dao import DBJsonDAO
+
+
+from config import DB_NAME, DB_EXTENSION, DB_FORMAT
+
+
+dao = db_provider(DB_NAME, DB_EXTENSION)
+partitions = partition_directory(DB_NAME)
+
+
+def convert_storage(data_format: str, dao: DBJsonDAO = dao) -> None:
+    """
+    Rewrite the database file in another on-disk format.
+
+    The database keeps being written in the new format, whatever
+    `DB_FORMAT` is set to.
+
+    Args:
+        data_format (str): The target format ("indent", "compact" or
+            "binary").
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Raises:
+        ValueError: If the database is an SQLite database.
+        Any exceptions raised by `dao.convert()`.
+    """
+    if isinstance(dao, DBSqliteDAO):
+        raise ValueError(
+            "SQLite databases have no other on-disk format to convert to."
+        )
+    dao.convert(data_format=data_format)
+
+
+def migrate_storage(dao: DBJsonDAO = dao) -> None:
+    """
+    Rewrite the database with the dates stored as timestamps.
+
+    Args:
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Raises:
+        Any exceptions raised by `dao.migrate()`.
+    """
+    dao.migrate()
+
+
+def partition_storage(
+    directory: str = partitions, dao: DBJsonDAO = dao
+) -> dict[str, int]:
+    """
+    Write the operations into the monthly partitions of `DB_PARTITIONED`.
+
+    The database itself is left unchanged. The manifest and the directory
+    of the partitions are removed, so they are rebuilt from the written
+    files the next time the partitioned database is opened.
+
+    Args:
+        directory (str, optional): The partition directory. Defaults to
+            "<DB_NAME>.parts".
+        dao (DBJsonDAO, optional): Database access object. Defaults to dao.
+
+    Returns:
+        dict[str, int]: The number of operations per month ("YYYY-MM").
+
+    Raises:
+        ValueError: If the database is already partitioned.
+    """
+    if isinstance(dao, DBPartitionedDAO):
+        raise ValueError("The database is already partitioned.")
+
+    months = write_shards(
+        dao.iter_operations(), directory=directory, data_format=DB_FORMAT
+    )
+    for name in (DBPartitionedDAO.MANIFEST, DBPartitionedDAO.DIRECTORY):
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+    return months
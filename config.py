@@ -1,2 +1,24 @@
 DB_NAME = "db"
 DB_EXTENSION = ".json"
+
+# Format new database files are written in: "indent" (readable JSON),
+# "compact" (minified JSON) or "binary" (fixed-width records with a string
+# table). Existing files are read and written in the format they hold; use
+# "manage.py convert" to change it.
+DB_FORMAT = "indent"
+
+# Keep the parsed database in memory and reload it only when the file changes.
+DB_CACHE = True
+
+# Append mutations to "<DB_NAME><DB_EXTENSION>.log" instead of rewriting the
+# whole database file, folding the log into the file every N entries.
+DB_JOURNAL = False
+DB_JOURNAL_COMPACT_THRESHOLD = 1000
+
+# Worker processes of the parallel aggregations over the monthly partitions
+# (see DB_PARTITIONED); None uses one per CPU.
+DB_SHARD_WORKERS = None
+
+# Split the JSON database into one file per month ("<DB_NAME>.parts"), so
+# date queries and creates only touch the months involved.
+DB_PARTITIONED = False
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from uuid import UUID
+    from business_logic.dto import OperationDTO
+    from data_access.dao import Batch, DBJsonDAO
+    from data_access.sqlite import DBSqliteDAO
+
+T = TypeVar("T")
+
+
+class AsyncDAO:
+    """
+    Asynchronous front of a DAO for use from an event loop.
+
+    Every call runs in `executor`, so parsing, serialization and file I/O
+    do not block the loop. The DAOs keep in-memory state (caches, views, a
+    SQLite connection) that is not thread-safe, so the default executor is
+    a single dedicated thread. Writes are also queued on an asyncio lock,
+    which keeps them in arrival order and lets a caller make several calls
+    with no write in between (see `write_lock`).
+
+    Args:
+        dao (DBJsonDAO | DBSqliteDAO): The wrapped DAO.
+        executor (Optional[Executor]): Where the DAO calls run. Defaults to
+            a single-thread executor owned by this object.
+    """
+
+    def __init__(
+        self,
+        dao: DBJsonDAO | DBSqliteDAO,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.dao = dao
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dao"
+        )
+        self.write_lock = asyncio.Lock()
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a blocking function in the executor.
+
+        Args:
+            func (Callable[..., T]): The function, usually a DAO method or a
+                service function called with `dao=self.dao`.
+            *args (Any): Positional arguments of the function.
+            **kwargs (Any): Keyword arguments of the function.
+
+        Returns:
+            T: The result of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    async def run_write(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a blocking function that writes, one write at a time.
+
+        Args:
+            func (Callable[..., T]): The function.
+            *args (Any): Positional arguments of the function.
+            **kwargs (Any): Keyword arguments of the function.
+
+        Returns:
+            T: The result of the function.
+        """
+        async with self.write_lock:
+            return await self.run(func, *args, **kwargs)
+
+    async def read(
+        self,
+        operation_id: Optional[UUID] = None,
+        filter: Optional[tuple | list[tuple]] = None,
+    ) -> dict[UUID, dict[str, str | float]] | OperationDTO | None:
+        """
+        Read data, see `DBJsonDAO.read()`.
+        """
+        return await self.run(
+            self.dao.read, operation_id=operation_id, filter=filter
+        )
+
+    async def page(
+        self, per_page: int, **kwargs: Any
+    ) -> tuple[dict[UUID, dict[str, str | float]], int]:
+        """
+        Read one page of operations, see `DBJsonDAO.page()`.
+        """
+        return await self.run(self.dao.page, per_page=per_page, **kwargs)
+
+    async def totals(self) -> dict[str, dict[str, float | int]]:
+        """
+        Return the totals per category, see `DBJsonDAO.totals()`.
+        """
+        return await self.run(self.dao.totals)
+
+    async def create(self, data: OperationDTO) -> UUID:
+        """
+        Create a new operation, see `DBJsonDAO.create()`.
+        """
+        return await self.run_write(self.dao.create, data=data)
+
+    async def create_many(self, operations: Iterable[OperationDTO]) -> int:
+        """
+        Create several operations, see `DBJsonDAO.create_many()`.
+        """
+        return await self.run_write(self.dao.create_many, operations)
+
+    async def update(self, operation_id: UUID, data: OperationDTO) -> None:
+        """
+        Update an operation, see `DBJsonDAO.update()`.
+        """
+        await self.run_write(
+            self.dao.update, operation_id=operation_id, data=data
+        )
+
+    async def delete(self, operation_id: UUID) -> None:
+        """
+        Delete an operation, see `DBJsonDAO.delete()`.
+        """
+        await self.run_write(self.dao.delete, operation_id=operation_id)
+
+    async def batch(self, func: Callable[[Batch], T]) -> T:
+        """
+        Run `func` with a batch and commit its mutations with one write.
+
+        Args:
+            func (Callable[[Batch], T]): Records the mutations in the batch;
+                runs in the executor.
+
+        Returns:
+            T: The result of `func`.
+        """
+
+        def apply() -> T:
+            with self.dao.batch() as batch:
+                return func(batch)
+
+        return await self.run_write(apply)
+
+    def close(self) -> None:
+        """
+        Shut down the executor owned by this object.
+        """
+        if self._own_executor:
+            self._executor.shutdown()
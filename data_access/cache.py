@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+from data_access.dao import DBJsonDAO
+
+from config import DB_FORMAT
+
+
+class DBCachedJsonDAO(DBJsonDAO):
+    """
+    JSON database that keeps the parsed data in memory.
+
+    The file is parsed again only when its inode, modification time or size
+    differ from the ones recorded at the last load or write, so repeated
+    reads of an unchanged database cost a single `os.stat` call. The data
+    returned by `read()` is the cached dictionary and must not be modified.
+    """
+
+    def __init__(
+        self, data_name: str, data_type: str, data_format: str = DB_FORMAT
+    ) -> None:
+        super().__init__(
+            data_name=data_name, data_type=data_type, data_format=data_format
+        )
+        self._json_data: Optional[dict[UUID, dict[str, str | float]]] = None
+        self._cached_stat: Optional[tuple[int, int, int]] = None
+
+    def _load(self) -> dict[UUID, dict[str, str | float]]:
+        """
+        Return the cached data, reloading it if the file has changed.
+
+        Returns:
+            dict[UUID, dict[str, str | float]]: Operations keyed by their ID.
+        """
+        stat = self._stat(self._database)
+        if self._json_data is None or stat != self._cached_stat:
+            self._json_data = super()._load()
+            self._cached_stat = stat
+        return self._json_data
+
+    def _iter_file(self) -> Iterator[tuple[UUID, dict[str, str | float]]]:
+        """
+        Iterate over the cached data if it is current, else stream the file.
+
+        Yields:
+            tuple[UUID, dict[str, str | float]]: (ID, record) pairs.
+        """
+        if (
+            self._json_data is not None
+            and self._stat(self._database) == self._cached_stat
+        ):
+            yield from self._json_data.items()
+        else:
+            yield from super()._iter_file()
+
+    def _fetch(
+        self, operation_ids: list[UUID]
+    ) -> dict[UUID, dict[str, str | float]]:
+        """
+        Look up the records of some operations in the cached data.
+
+        Args:
+            operation_ids (list[UUID]): The IDs of existing operations.
+
+        Returns:
+            dict[UUID, dict[str, str | float]]: The records keyed by ID, in
+                the order of `operation_ids`.
+        """
+        json_data = self._load()
+        return {
+            operation_id: json_data[operation_id]
+            for operation_id in operation_ids
+            if operation_id in json_data
+        }
+
+    def _dump(self, json_data: dict[UUID, dict[str, str | float]]) -> None:
+        """
+        Write the data and keep it as the cached state of the new file.
+
+        Args:
+            json_data (dict[UUID, dict[str, str | float]]): Operations keyed
+                by their ID.
+        """
+        try:
+            super()._dump(json_data)
+        except BaseException:
+            self.invalidate()
+            raise
+        self._json_data = json_data
+        self._cached_stat = self._stat(self._database)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached data so the next access reloads the file.
+        """
+        self._json_data = None
+        self._cached_stat = None
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from itertools import compress, islice, repeat
+from operator import ge, gt, le
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+from data_access.dates import DAY, day_number, from_day_number
+
+
+class ColumnarLedger:
+    """
+    Read-only snapshot of the operations stored column by column.
+
+    Every field is a typed array instead of a dictionary per record: dates
+    as day numbers (`days`), amounts as doubles, and categories and
+    descriptions as codes into the `category_names` and
+    `description_names` tables, each distinct string stored once. A
+    record takes 17 bytes instead of a few hundred, and rows are kept in
+    date order.
+
+    Aggregations work on whole slices of the arrays with builtins
+    implemented in C (`sum()`, `itertools.compress()`, `map()`,
+    `bytes.count()`), so the interpreter loops once per day or month of
+    the answer, not once per operation. A date range is located by binary
+    search on `days`, and a category is selected with a byte mask built
+    by `bytes.translate()`. Operation IDs are not kept; use the DAO to
+    read the operations themselves.
+
+    Args:
+        operations (Iterable[tuple[UUID, dict[str, Any]]]): (ID, record)
+            pairs with timestamp dates, e.g. `dao.iter_operations()`.
+    """
+
+    INCOME = "income"
+
+    def __init__(
+        self, operations: Iterable[tuple[UUID, dict[str, Any]]] = ()
+    ) -> None:
+        self.days = array("i")
+        self.amounts = array("d")
+        self.categories = array("B")
+        self.descriptions = array("I")
+        self.category_names: list[str] = []
+        self.description_names: list[str] = []
+
+        category_codes: dict[str, int] = {}
+        description_codes: dict[str, int] = {}
+        # Bound methods avoid attribute lookups in the per-record loop.
+        add_day, add_amount = self.days.append, self.amounts.append
+        add_category = self.categories.append
+        add_description = self.descriptions.append
+        for _, operation in operations:
+            category = operation["category"]
+            if category not in category_codes:
+                if len(category_codes) == 256:
+                    raise ValueError("More than 256 distinct categories.")
+                category_codes[category] = len(category_codes)
+                self.category_names.append(category)
+            description = operation["description"]
+            if description not in description_codes:
+                description_codes[description] = len(description_codes)
+                self.description_names.append(description)
+
+            timestamp = operation["date"]
+            add_day(
+                timestamp // DAY
+                if type(timestamp) is int
+                else day_number(timestamp)
+            )
+            add_amount(operation["amount"])
+            add_category(category_codes[category])
+            add_description(description_codes[description])
+
+        if not all(map(le, self.days, islice(self.days, 1, None))):
+            self._sort()
+
+        self._category_codes = category_codes
+        self._masks: dict[str, bytes] = {}
+        self._signed: Optional[array] = None
+
+    def _sort(self) -> None:
+        # Stable, so operations of one day keep their storage order.
+        order = sorted(range(len(self.days)), key=self.days.__getitem__)
+        for name in ("days", "amounts", "categories", "descriptions"):
+            column = getattr(self, name)
+            column = array(column.typecode, map(column.__getitem__, order))
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def category_mask(self, category: str) -> bytes:
+        """
+        Return a byte per row, 1 where the operation has the category.
+
+        Args:
+            category (str): The category.
+
+        Returns:
+            bytes: The mask.
+        """
+        if category not in self._masks:
+            table = bytearray(256)
+            if category in self._category_codes:
+                table[self._category_codes[category]] = 1
+            self._masks[category] = self.categories.tobytes().translate(table)
+        return self._masks[category]
+
+    @property
+    def signed(self) -> array:
+        """
+        The amounts with expenses negated, as they count in the balance.
+
+        Every category other than income is subtracted, like in
+        `get_balance()`.
+        """
+        if self._signed is None:
+            signs = [
+                1.0 if category == self.INCOME else -1.0
+                for category in self.category_names
+            ]
+            self._signed = array(
+                "d",
+                map(
+                    float.__mul__,
+                    self.amounts,
+                    map(signs.__getitem__, self.categories),
+                ),
+            )
+        return self._signed
+
+    def rows(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> tuple[int, int]:
+        """
+        Locate the rows of a date range.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            tuple[int, int]: The first row and the row after the last one.
+        """
+        low = 0 if start is None else bisect_left(self.days, day_number(start))
+        high = (
+            len(self.days)
+            if end is None
+            else bisect_right(self.days, day_number(end))
+        )
+        return low, max(low, high)
+
+    def _sum(self, low: int, high: int, category: Optional[str]) -> float:
+        if category is None:
+            return sum(self.signed[low:high])
+        return sum(
+            compress(
+                self.amounts[low:high], self.category_mask(category)[low:high]
+            )
+        )
+
+    def balance(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> float:
+        """
+        Return the income minus the expenses of a date range.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            float: The balance.
+        """
+        return self._sum(*self.rows(start, end), category=None)
+
+    def totals(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> dict[str, dict[str, float | int]]:
+        """
+        Return the amount and count totals per category of a date range.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            dict[str, dict[str, float | int]]: {"amount": ..., "count": ...}
+                keyed by category, like `DBJsonDAO.totals()`.
+        """
+        low, high = self.rows(start, end)
+        totals = {}
+        for category in self.category_names:
+            count = self.category_mask(category).count(1, low, high)
+            if count:
+                totals[category] = {
+                    "amount": self._sum(low, high, category),
+                    "count": count,
+                }
+        return totals
+
+    def daily_sums(self, category: Optional[str] = None) -> dict[date, float]:
+        """
+        Return the sum of the amounts of every day with operations.
+
+        Args:
+            category (Optional[str]): Sum the amounts of this category;
+                None sums the signed amounts (the change of the balance).
+
+        Returns:
+            dict[date, float]: The sums keyed by day, in date order.
+        """
+        sums: dict[date, float] = {}
+        low = 0
+        while low < len(self.days):
+            day = self.days[low]
+            high = bisect_right(self.days, day, low)
+            sums[from_day_number(day)] = self._sum(low, high, category)
+            low = high
+        return sums
+
+    def monthly_sums(
+        self, category: Optional[str] = None
+    ) -> dict[date, float]:
+        """
+        Return the sum of the amounts of every month with operations.
+
+        Args:
+            category (Optional[str]): Sum the amounts of this category;
+                None sums the signed amounts (the change of the balance).
+
+        Returns:
+            dict[date, float]: The sums keyed by the first day of the
+                month, in date order.
+        """
+        sums: dict[date, float] = {}
+        low = 0
+        while low < len(self.days):
+            month = from_day_number(self.days[low]).replace(day=1)
+            following = (
+                month.replace(year=month.year + 1, month=1)
+                if month.month == 12
+                else month.replace(month=month.month + 1)
+            )
+            high = bisect_left(self.days, day_number(following), low)
+            sums[month] = self._sum(low, high, category)
+            low = high
+        return sums
+
+    def count(
+        self,
+        category: Optional[str] = None,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+    ) -> int:
+        """
+        Count the operations matching all the given criteria.
+
+        Args:
+            category (Optional[str]): The category, None for any.
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+            min_amount (Optional[float]): The smallest amount, None if open.
+            max_amount (Optional[float]): The largest amount, None if open.
+
+        Returns:
+            int: The number of matching operations.
+        """
+        low, high = self.rows(start, end)
+        if category is None:
+            amounts = self.amounts[low:high]
+        else:
+            mask = self.category_mask(category)
+            if min_amount is None and max_amount is None:
+                return mask.count(1, low, high)
+            amounts = array(
+                "d", compress(self.amounts[low:high], mask[low:high])
+            )
+
+        # Amounts within [min, max] are those >= min less those > max.
+        count = len(amounts)
+        if min_amount is not None:
+            count = sum(map(ge, amounts, repeat(float(min_amount))))
+        if max_amount is not None:
+            count -= sum(map(gt, amounts, repeat(float(max_amount))))
+        return max(count, 0)
@@ -1,29 +1,202 @@
 from __future__ import annotations
 
-import json
-from uuid import uuid4
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+import os
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right
+from uuid import UUID, uuid4
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
 if TYPE_CHECKING:
-    from uuid import UUID
+    from data_access.partitioned import DBPartitionedDAO
+    from data_access.sqlite import DBSqliteDAO
 
-from business_logic.dto import OperationDTO
+from business_logic.dto import OperationDTO, OperationRecord
+from data_access.columns import ColumnarLedger
+from data_access.dates import (
+    day_number,
+    from_day_number,
+    from_timestamp,
+    normalize,
+    normalize_all,
+    to_timestamp,
+)
 from data_access.exceptions import RecordDoesNotExistError
+from data_access.files import FileLock, atomic_write
+from data_access.formats import FORMATS, detect_format
+from data_access.views import (
+    BalanceView,
+    DailyView,
+    IndexView,
+    LedgerView,
+    OrderView,
+)
 
+from config import DB_CACHE, DB_FORMAT, DB_JOURNAL, DB_PARTITIONED
 
-def db_provider(data_name: str, data_type: str) -> "DBJsonDAO":
+
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+
+def db_provider(
+    data_name: str,
+    data_type: str,
+    journal: bool = DB_JOURNAL,
+    cache: bool = DB_CACHE,
+    data_format: str = DB_FORMAT,
+    partitioned: bool = DB_PARTITIONED,
+) -> DBJsonDAO | DBSqliteDAO | DBPartitionedDAO:
     """
     Provide a database provider based on the specified data type.
 
+    SQLite extensions (".db", ".sqlite", ".sqlite3") select DBSqliteDAO, any
+    other extension selects a JSON database.
+
     Args:
         data_name (str): The name of the data.
         data_type (str): The type of the data.
+        journal (bool): Whether mutations are appended to a journal instead
+            of rewriting the whole file. Defaults to DB_JOURNAL.
+        cache (bool): Whether the parsed data is kept in memory between
+            calls. Journaled databases are always kept in memory. Defaults
+            to DB_CACHE.
+        data_format (str): The format file databases are written in, see
+            `data_access.formats`. Defaults to DB_FORMAT.
+        partitioned (bool): Whether file databases are split into one file
+            per month. Takes precedence over `journal`. Defaults to
+            DB_PARTITIONED.
+
+    Returns:
+        DBJsonDAO | DBSqliteDAO | DBPartitionedDAO: A database provider
+            instance.
+    """
+    if data_type in SQLITE_EXTENSIONS:
+        from data_access.sqlite import DBSqliteDAO
+
+        return DBSqliteDAO(data_name=data_name, data_type=data_type)
+    if partitioned:
+        from data_access.partitioned import DBPartitionedDAO
+
+        return DBPartitionedDAO(
+            data_name=data_name,
+            data_type=data_type,
+            cache=cache,
+            data_format=data_format,
+        )
+    if journal:
+        from data_access.journal import DBJournalDAO
+
+        return DBJournalDAO(
+            data_name=data_name, data_type=data_type, data_format=data_format
+        )
+    if cache:
+        from data_access.cache import DBCachedJsonDAO
+
+        return DBCachedJsonDAO(
+            data_name=data_name, data_type=data_type, data_format=data_format
+        )
+    return DBJsonDAO(
+        data_name=data_name, data_type=data_type, data_format=data_format
+    )
+
+
+def split_filter(filter: tuple | list[tuple]) -> list[tuple]:
+    """
+    Split a filter into the predicates that must all hold.
+
+    A predicate is either (key, value), matching records whose field equals
+    the value, or (key, low, high), matching records whose field lies within
+    the inclusive range, where a bound of None leaves that side open. Dates
+    are compared by calendar day. A filter is a single predicate or a list
+    of them.
+
+    Args:
+        filter (tuple | list[tuple]): The filter.
+
+    Returns:
+        list[tuple]: The predicates.
+    """
+    if isinstance(filter, tuple):
+        return [filter]
+    return list(filter)
+
+
+def matches(operation: dict[str, str | float], predicate: tuple) -> bool:
+    """
+    Check a record against a predicate without using an index.
+
+    Indexed fields are compared the way the index compares them, e.g.
+    dates by calendar day.
+
+    Args:
+        operation (dict[str, str | float]): The operation record.
+        predicate (tuple): The predicate, see `split_filter()`.
+
+    Returns:
+        bool: True if the record matches.
+    """
+    key = predicate[0]
+    if key in IndexView.keys:
+        value = IndexView.index_value(key, operation[key])
+        bounds = [
+            None if bound is None else IndexView.index_value(key, bound)
+            for bound in predicate[1:]
+        ]
+    else:
+        value = operation[key]
+        bounds = list(predicate[1:])
+
+    if len(bounds) == 1:
+        return value == bounds[0]
+
+    low, high = bounds
+    return (low is None or low <= value) and (high is None or value <= high)
+
+
+def to_operation(
+    operation_id: UUID, operation: dict[str, str | float]
+) -> OperationDTO:
+    """
+    Convert a stored record to an operation.
+
+    Args:
+        operation_id (UUID): The ID of the operation.
+        operation (dict[str, str | float]): The record with a timestamp
+            date, as returned by the DAOs.
 
     Returns:
-        DBJsonDAO: A database provider instance.
+        OperationDTO: The operation.
+    """
+    return OperationDTO(
+        category=operation["category"],
+        amount=operation["amount"],
+        description=operation["description"],
+        date=from_timestamp(operation["date"]),
+        id=operation_id,
+    )
+
+
+def to_record(
+    operation_id: UUID, operation: dict[str, str | float]
+) -> OperationRecord:
     """
-    return DBJsonDAO(data_name=data_name, data_type=data_type)
+    Convert a stored record to an immutable operation record.
+
+    Args:
+        operation_id (UUID): The ID of the operation.
+        operation (dict[str, str | float]): The record with a timestamp
+            date, as returned by the DAOs.
+
+    Returns:
+        OperationRecord: The record with the ID and date parsed.
+    """
+    return OperationRecord(
+        UUID(operation_id),
+        from_timestamp(operation["date"]),
+        operation["category"],
+        operation["amount"],
+        operation["description"],
+    )
 
 
 class FileDB:
@@ -32,99 +205,744 @@ class FileDB:
         self._data_type = data_type
         self._database = self._data_name + self._data_type
 
+    @staticmethod
+    def _stat(path: str) -> Optional[tuple[int, int, int]]:
+        """
+        Identify the current on-disk state of a file.
+
+        Args:
+            path (str): Path to the file.
+
+        Returns:
+            Optional[tuple[int, int, int]]: The inode, modification time (ns)
+                and size of the file, or None if it does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def iter_records(
+        self, filter: Optional[tuple | list[tuple]] = None
+    ) -> Iterator[OperationRecord]:
+        """
+        Iterate over the operations, optionally filtered, as typed records.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Yields:
+            OperationRecord: The operations in storage order.
+        """
+        for operation_id, operation in self.iter_operations(filter=filter):
+            yield to_record(operation_id, operation)
+
+    def columns(
+        self, filter: Optional[tuple | list[tuple]] = None
+    ) -> ColumnarLedger:
+        """
+        Load the operations, optionally filtered, into a columnar snapshot.
+
+        The operations are streamed into the arrays, so the records are
+        never held in memory all at once.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Returns:
+            ColumnarLedger: The snapshot for aggregations.
+        """
+        return ColumnarLedger(self.iter_operations(filter=filter))
+
+
+class Batch:
+    """
+    Mutations applied to the loaded data and committed together.
+
+    Created by `DBJsonDAO.batch()`. Every mutation is applied to the data
+    immediately, so later mutations in the batch see earlier ones, and is
+    recorded as an (ID, old record, new record) change.
+
+    Args:
+        json_data (dict[UUID, dict[str, str | float]]): The loaded data.
+    """
+
+    def __init__(self, json_data: dict[UUID, dict[str, str | float]]) -> None:
+        self.json_data = json_data
+        self.changes: list[tuple[UUID, Optional[dict], Optional[dict]]] = []
+
+    def create(self, data: OperationDTO) -> UUID:
+        """
+        Create a new operation.
+
+        The operation keeps its date if it has one and is dated now
+        otherwise.
+
+        Args:
+            data (OperationDTO): The operation data.
+
+        Returns:
+            UUID: The ID of the operation.
+        """
+        operation: dict[str, str | float] = {
+            "date": to_timestamp(data.date or datetime.now()),
+            "category": data.category,
+            "amount": data.amount,
+            "description": data.description,
+        }
+
+        if not data.id:
+            new_id: str = str(uuid4())
+            while new_id in self.json_data:
+                new_id = str(uuid4())
+        else:
+            new_id = data.id
+
+        self._apply(new_id, operation)
+        return new_id
+
+    def update(self, operation_id: UUID, data: OperationDTO) -> None:
+        """
+        Update an operation; empty fields of `data` are left unchanged.
+
+        Args:
+            operation_id (UUID): The ID of the operation to update.
+            data (OperationDTO): The updated operation data.
+
+        Raises:
+            RecordDoesNotExistError: If the operation does not exist.
+        """
+        if not (old_data := self.json_data.get(operation_id)):
+            raise RecordDoesNotExistError("Record does not exist.")
+
+        self._apply(
+            operation_id,
+            {
+                "date": old_data["date"],
+                "category": (
+                    data.category if data.category else old_data["category"]
+                ),
+                "amount": (data.amount if data.amount else old_data["amount"]),
+                "description": (
+                    data.description
+                    if data.description
+                    else old_data["description"]
+                ),
+            },
+        )
+
+    def delete(self, operation_id: UUID) -> None:
+        """
+        Delete an operation.
+
+        Args:
+            operation_id (UUID): The ID of the operation to delete.
+
+        Raises:
+            RecordDoesNotExistError: If the operation does not exist.
+        """
+        if not self.json_data.get(operation_id):
+            raise RecordDoesNotExistError("Record does not exist.")
+
+        self._apply(operation_id, None)
+
+    def _apply(
+        self, operation_id: UUID, operation: Optional[dict[str, str | float]]
+    ) -> None:
+        old_data = self.json_data.get(operation_id)
+        if operation is None:
+            del self.json_data[operation_id]
+        else:
+            self.json_data[operation_id] = operation
+        self.changes.append((operation_id, old_data, operation))
+
+    def rollback(self) -> None:
+        """
+        Undo the changes in the loaded data, most recent first.
+        """
+        for operation_id, old_data, _ in reversed(self.changes):
+            if old_data is None:
+                del self.json_data[operation_id]
+            else:
+                self.json_data[operation_id] = old_data
+        self.changes.clear()
+
 
 class DBJsonDAO(FileDB):
+    """
+    JSON database storing operations keyed by their ID.
+
+    The file is read in whichever format it holds ("indent", "compact" or
+    "binary", see `data_access.formats`) and written back in the same one,
+    so a database keeps the format it was converted to; `data_format` is
+    used until the file has been read.
+
+    The views listed in `views` are maintained on every mutation and
+    persisted next to the database as "<data_name>.<view name>.json".
+
+    Files are replaced atomically, and read-modify-write cycles hold an
+    advisory lock on "<database>.lock", so several processes can share one
+    database without losing updates.
+    """
+
+    views: tuple[type[LedgerView], ...] = (
+        BalanceView,
+        IndexView,
+        OrderView,
+        DailyView,
+    )
+
+    def __init__(
+        self, data_name: str, data_type: str, data_format: str = DB_FORMAT
+    ) -> None:
+        super().__init__(data_name=data_name, data_type=data_type)
+        self._format = FORMATS[data_format]
+        self._views: dict[str, LedgerView] = {}
+        self._views_state: Optional[Any] = None
+        self._lock = FileLock(self._database)
+
+    def _load(self) -> dict[UUID, dict[str, str | float]]:
+        """
+        Load the whole JSON database.
+
+        Dates stored as ISO 8601 strings by earlier versions are converted
+        to timestamps, see `data_access.dates`. The database keeps being
+        written in the format of the loaded file.
+
+        Returns:
+            dict[UUID, dict[str, str | float]]: Operations keyed by their ID.
+        """
+        with open(self._database, "rb") as file:
+            self._format = detect_format(file, self._format)
+            json_data = self._format.load(file)
+        for operation in json_data.values():
+            normalize(operation)
+        return json_data
+
+    def _iter_file(self) -> Iterator[tuple[UUID, dict[str, str | float]]]:
+        """
+        Stream the operations from the database file.
+
+        Yields:
+            tuple[UUID, dict[str, str | float]]: (ID, record) pairs.
+        """
+        with open(self._database, "rb") as file:
+            self._format = detect_format(file, self._format)
+            yield from normalize_all(self._format.iterate(file))
+
+    def _dump(self, json_data: dict[UUID, dict[str, str | float]]) -> None:
+        """
+        Write the whole JSON database, replacing the file atomically.
+
+        Args:
+            json_data (dict[UUID, dict[str, str | float]]): Operations keyed
+                by their ID.
+        """
+        with atomic_write(self._database) as file:
+            self._format.dump(json_data, file)
+
+    def _state(self) -> Any:
+        """
+        Identify the on-disk state the persisted views are checked against.
+
+        Returns:
+            Any: A JSON-serializable identity of the database file.
+        """
+        return self._stat(self._database)
+
+    def _view_path(self, view_type: type[LedgerView]) -> str:
+        return f"{self._data_name}.{view_type.name}.json"
+
+    def _open_views(self, state: Any) -> None:
+        """
+        Replace the in-memory views with the persisted ones valid for state.
+
+        Views that are missing or stale are left out.
+
+        Args:
+            state (Any): The current state of the database file.
+        """
+        self._views = {}
+        for view_type in self.views:
+            view = view_type.open(self._view_path(view_type), state)
+            if view is not None:
+                self._views[view_type.name] = view
+        self._views_state = state
+
+    def _save_views(self, state: Any, on_write: bool = False) -> None:
+        """
+        Persist the in-memory views for a state of the database file.
+
+        Args:
+            state (Any): The state of the database file the views reflect.
+            on_write (bool, optional): Persist only the views saved on every
+                write, see `LedgerView.saved_on_write`. Defaults to False.
+        """
+        for view_type in self.views:
+            if on_write and not view_type.saved_on_write:
+                continue
+            self._views[view_type.name].save(
+                self._view_path(view_type), state
+            )
+        self._views_state = state
+
+    def view(self, name: str) -> LedgerView:
+        """
+        Return a maintained view that reflects the current database.
+
+        The in-memory view is reused while the database file is unchanged,
+        otherwise the persisted one is loaded; the operations are scanned
+        only if the persisted view is missing or stale, and then every
+        missing view is built and persisted from that single scan.
+
+        Args:
+            name (str): The name of the view.
+
+        Returns:
+            LedgerView: The view.
+        """
+        state = self._state()
+        if state != self._views_state:
+            self._open_views(state)
+        if name not in self._views:
+            json_data = self._load()
+            for view_type in self.views:
+                if view_type.name not in self._views:
+                    view = view_type.build(json_data)
+                    view.save(self._view_path(view_type), state)
+                    self._views[view_type.name] = view
+        return self._views[name]
+
+    def rebuild(self) -> None:
+        """
+        Rebuild and persist all maintained views from the operations.
+        """
+        with self._lock:
+            json_data = self._load()
+            self._views = {
+                view_type.name: view_type.build(json_data)
+                for view_type in self.views
+            }
+            self._save_views(self._state())
+
+    def convert(self, data_format: str) -> None:
+        """
+        Rewrite the database in another format and keep writing in it.
+
+        Args:
+            data_format (str): The target format, see `data_access.formats`.
+        """
+        with self._lock:
+            json_data = self._load()
+            self._format = FORMATS[data_format]
+            self._commit(json_data, [])
+
+    def migrate(self) -> None:
+        """
+        Rewrite the database with the dates stored as timestamps.
+
+        Databases written by earlier versions store the dates as ISO 8601
+        strings; they are readable as they are, but converted on every
+        load until the database is rewritten.
+        """
+        with self._lock:
+            self._commit(self._load(), [])
+
+    def totals(self) -> dict[str, dict[str, float | int]]:
+        """
+        Return the maintained amount and count totals per category.
+
+        Returns:
+            dict[str, dict[str, float | int]]: {"amount": ..., "count": ...}
+                keyed by category.
+        """
+        return self.view(BalanceView.name).totals
+
+    def balance(self, as_of: Optional[datetime | date] = None) -> float:
+        """
+        Return the income minus the expenses up to the end of a day.
+
+        Answered by the prefix sums of the daily rollup in O(log days).
+
+        Args:
+            as_of (Optional[datetime | date]): The last day (inclusive),
+                None for all the operations.
+
+        Returns:
+            float: The balance.
+        """
+        daily: DailyView = self.view(DailyView.name)
+        return daily.balance(None if as_of is None else day_number(as_of))
+
+    def daily_totals(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> dict[date, dict[str, dict[str, float | int]]]:
+        """
+        Return the maintained amount and count totals per day and category.
+
+        The totals are read from the daily rollup, so the cost depends on
+        the number of days in the range, not on the number of operations.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            dict[date, dict[str, dict[str, float | int]]]: {"amount": ...,
+                "count": ...} keyed by category, keyed by the days with
+                operations in date order.
+        """
+        daily: DailyView = self.view(DailyView.name)
+        return {
+            from_day_number(day): {
+                category: {"amount": amount, "count": count}
+                for category, (amount, count) in daily.days[day].items()
+            }
+            for day in daily.between(
+                None if start is None else day_number(start),
+                None if end is None else day_number(end),
+            )
+        }
+
+    def iter_operations(
+        self, filter: Optional[tuple | list[tuple]] = None
+    ) -> Iterator[tuple[UUID, dict[str, str | float]]]:
+        """
+        Iterate over the operations, optionally filtered, in file order.
+
+        The database file is decoded incrementally, so memory use does not
+        grow with the size of the database.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Yields:
+            tuple[UUID, dict[str, str | float]]: (ID, record) pairs.
+        """
+        predicates = split_filter(filter) if filter else []
+        for operation_uuid, operation in self._iter_file():
+            if all(matches(operation, predicate) for predicate in predicates):
+                yield operation_uuid, operation
+
+    def page(
+        self,
+        per_page: int,
+        offset: int = 0,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        filter: Optional[tuple | list[tuple]] = None,
+        order_by: str = "date",
+        descending: bool = False,
+    ) -> tuple[dict[UUID, dict[str, str | float]], int]:
+        """
+        Read one page of operations in a sort order.
+
+        The page is cut from the maintained sort order, so its cost does
+        not depend on the page position or the direction, and only the
+        records of the page are read (see `_fetch()`). With a filter only
+        the matching operations are ordered; the data is loaded once if
+        the filter is not answered by the secondary indexes alone.
+
+        Args:
+            per_page (int): The maximum number of operations to return.
+            offset (int): The number of operations to skip when no cursor
+                is given. Defaults to 0.
+            after (Optional[UUID]): Return the operations following the one
+                with this ID.
+            before (Optional[UUID]): Return the operations preceding the one
+                with this ID.
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+            order_by (str): The field to sort by, one of `OrderView.fields`;
+                ties are ordered by date and ID. Defaults to "date".
+            descending (bool): Sort from the largest value to the smallest.
+                Defaults to False.
+
+        Returns:
+            tuple[dict[UUID, dict[str, str | float]], int]: The operations of
+                the page and the total number of matching operations.
+
+        Raises:
+            KeyError: If the field is not sortable.
+            RecordDoesNotExistError: If the cursor operation does not exist.
+        """
+        if order_by not in OrderView.fields:
+            raise KeyError(order_by)
+
+        order: OrderView = self.view(OrderView.name)
+        json_data: Optional[dict[UUID, dict[str, str | float]]] = None
+
+        if filter:
+            operation_uuids, scan_predicates = self._index_lookup(filter)
+            if operation_uuids is None or scan_predicates:
+                json_data = self._load()
+                operation_uuids = [
+                    operation_uuid
+                    for operation_uuid in (
+                        json_data
+                        if operation_uuids is None
+                        else operation_uuids
+                    )
+                    if operation_uuid in json_data
+                    and all(
+                        matches(json_data[operation_uuid], predicate)
+                        for predicate in scan_predicates
+                    )
+                ]
+            keys = sorted(
+                order.key(order_by, operation_uuid)
+                for operation_uuid in operation_uuids
+            )
+        else:
+            keys = order.order[order_by]
+
+        cursor = after if after is not None else before
+        if cursor is not None:
+            cursor_key = order.key(order_by, cursor)
+            if cursor_key is None:
+                raise RecordDoesNotExistError("Record does not exist.")
+
+        # The keys are sorted ascending; a descending page is cut from the
+        # mirrored position and reversed.
+        if descending:
+            after, before = before, after
+        if after is not None:
+            start = bisect_right(keys, cursor_key)
+            end = start + per_page
+        elif before is not None:
+            end = bisect_left(keys, cursor_key)
+            start = end - per_page
+        elif descending:
+            end = len(keys) - offset
+            start = end - per_page
+        else:
+            start = offset
+            end = offset + per_page
+
+        page_keys = keys[max(start, 0) : max(end, 0)]
+        if descending:
+            page_keys = page_keys[::-1]
+
+        page_ids = [key[-1] for key in page_keys]
+        if json_data is None:
+            return self._fetch(page_ids), len(keys)
+        return {
+            operation_uuid: json_data[operation_uuid]
+            for operation_uuid in page_ids
+        }, len(keys)
+
+    def _commit(
+        self,
+        json_data: dict[UUID, dict[str, str | float]],
+        changes: list[tuple[UUID, Optional[dict], Optional[dict]]],
+    ) -> None:
+        """
+        Persist mutations already applied to the loaded data.
+
+        The views are updated with the changes if they reflect the data as
+        it was loaded, and rebuilt from `json_data` otherwise. Only the
+        views saved on write are persisted; the indexes and sort orders
+        stay current in memory and are rebuilt by the next DAO that opens
+        them.
+
+        Args:
+            json_data (dict[UUID, dict[str, str | float]]): The loaded data
+                with the changes applied.
+            changes (list[tuple[UUID, Optional[dict], Optional[dict]]]):
+                The changed operations as (ID, old record, new record)
+                triples, where None marks a missing record.
+        """
+        state = self._state()
+        if state != self._views_state:
+            self._open_views(state)
+
+        self._dump(json_data)
+
+        for view_type in self.views:
+            if view := self._views.get(view_type.name):
+                view.apply(changes)
+            else:
+                self._views[view_type.name] = view_type.build(json_data)
+        self._save_views(self._state(), on_write=True)
+
+    def _index_lookup(
+        self, filter: tuple | list[tuple]
+    ) -> tuple[Optional[list[UUID]], list[tuple]]:
+        """
+        Answer the indexed predicates of a filter from the secondary indexes.
+
+        The ID lists of the predicates are intersected starting from the
+        shortest one.
+
+        Args:
+            filter (tuple | list[tuple]): A filter for the data, see
+                `split_filter()`.
+
+        Returns:
+            tuple[Optional[list[UUID]], list[tuple]]: The IDs matching the
+                indexed predicates (None if there are none) and the
+                predicates left to check against the records.
+        """
+        index_matches: list[list[UUID]] = []
+        scan_predicates: list[tuple] = []
+        for predicate in split_filter(filter):
+            if predicate[0] not in IndexView.keys:
+                scan_predicates.append(predicate)
+                continue
+            index: IndexView = self.view(IndexView.name)
+            if len(predicate) == 2:
+                index_matches.append(index.lookup(*predicate))
+            else:
+                index_matches.append(index.lookup_range(*predicate))
+
+        if not index_matches:
+            return None, scan_predicates
+
+        index_matches.sort(key=len)
+        other_matches = [set(ids) for ids in index_matches[1:]]
+        return [
+            operation_uuid
+            for operation_uuid in index_matches[0]
+            if all(operation_uuid in ids for ids in other_matches)
+        ], scan_predicates
+
+    def _fetch(
+        self, operation_ids: list[UUID]
+    ) -> dict[UUID, dict[str, str | float]]:
+        """
+        Read the records of some operations.
+
+        The file is streamed and reading stops once all the records are
+        found; DAOs that keep the data in memory look them up instead.
+
+        Args:
+            operation_ids (list[UUID]): The IDs of existing operations.
+
+        Returns:
+            dict[UUID, dict[str, str | float]]: The records keyed by ID, in
+                the order of `operation_ids`.
+        """
+        wanted = set(operation_ids)
+        found: dict[UUID, dict[str, str | float]] = {}
+        if wanted:
+            for operation_uuid, operation in self._iter_file():
+                if operation_uuid in wanted:
+                    found[operation_uuid] = operation
+                    if len(found) == len(wanted):
+                        break
+        return {
+            operation_id: found[operation_id]
+            for operation_id in operation_ids
+            if operation_id in found
+        }
+
     def read(
         self,
         operation_id: Optional[UUID] = None,
-        filter: Optional[tuple[str, str | float | datetime]] = None,
+        filter: Optional[tuple | list[tuple]] = None,
     ) -> dict[UUID, dict[str, str | float]] | OperationDTO | None:
         """
         Read data from the JSON database.
 
+        Predicates on category, amount and date (compared by calendar day)
+        are answered from the maintained secondary indexes, starting from
+        the most selective one.
+
         Args:
             operation_id (Optional[UUID]): The ID of the operation to read.
-            filter (Optional[tuple[str, str | float | datetime]]): A filter for the data.
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
 
         Returns:
             Union[dict[UUID, dict[str, str | float]], OperationDTO, None]: The read data.
         """
-        with open(self._database, "r") as file:
-            json_data: dict[UUID, dict[str, str | float]] = json.load(file)
-
-            if filter:
-                filtered_data = {}
-                key = filter[0]
-                value = filter[1]
-
-                if key == "date":
-                    for operation_uuid in json_data:
-                        data_date = datetime.strptime(
-                            json_data[operation_uuid][key],
-                            "%Y-%m-%dT%H:%M:%S.%f",
-                        )
-                        if (
-                            data_date.year == value.year
-                            and data_date.month == value.month
-                            and data_date.day == value.day
-                        ):
-                            filtered_data[operation_uuid] = json_data[
-                                operation_uuid
-                            ]
-
-                else:
-                    for operation_uuid in json_data:
-                        if json_data[operation_uuid][key] == value:
-                            filtered_data[operation_uuid] = json_data[
-                                operation_uuid
-                            ]
-
-                return filtered_data
-
-            elif not operation_id:
-                return json_data
-
-            elif operation := json_data.get(operation_id):
-                return OperationDTO(
-                    category=operation.get("category"),
-                    amount=operation.get("amount"),
-                    description=operation.get("description"),
-                    date=datetime.strptime(
-                        operation.get("date"), "%Y-%m-%dT%H:%M:%S.%f"
-                    ),
-                    id=operation_id,
+        json_data: dict[UUID, dict[str, str | float]] = self._load()
+
+        if filter:
+            operation_uuids, scan_predicates = self._index_lookup(filter)
+            if operation_uuids is None:
+                operation_uuids = list(json_data)
+
+            return {
+                operation_uuid: json_data[operation_uuid]
+                for operation_uuid in operation_uuids
+                if operation_uuid in json_data
+                and all(
+                    matches(json_data[operation_uuid], predicate)
+                    for predicate in scan_predicates
                 )
-            else:
-                raise RecordDoesNotExistError("Record does not exist.")
+            }
+
+        elif not operation_id:
+            return json_data
+
+        elif operation := json_data.get(operation_id):
+            return to_operation(operation_id, operation)
+        else:
+            raise RecordDoesNotExistError("Record does not exist.")
+
+    @contextmanager
+    def batch(self) -> Iterator[Batch]:
+        """
+        Collect creates, updates and deletes and commit them together.
 
-    def create(self, data: OperationDTO) -> None:
+        The data is loaded once when the block is entered and written once
+        when it exits, with the views updated for all the changes. If the
+        block raises, nothing is written and the loaded data is restored.
+        The database lock is held for the whole block.
+
+        Example:
+            with dao.batch() as batch:
+                batch.create(data)
+                batch.delete(operation_id)
+
+        Yields:
+            Batch: The batch to record the mutations in.
+        """
+        with self._lock:
+            batch = Batch(json_data=self._load())
+            try:
+                yield batch
+            except BaseException:
+                batch.rollback()
+                raise
+            if batch.changes:
+                self._commit(batch.json_data, batch.changes)
+
+    def create(self, data: OperationDTO) -> UUID:
         """
         Create a new operation in the JSON database.
 
         Args:
             data (OperationDTO): The operation data.
-        """
-        with open(self._database, "r") as file:
-            json_data: dict[UUID, dict[str, str | float]] = json.load(file)
 
-            operation: dict[str, datetime | str | float] = {
-                "date": datetime.now().isoformat(),
-                "category": data.category,
-                "amount": data.amount,
-                "description": data.description,
-            }
+        Returns:
+            UUID: The ID of the operation.
+        """
+        with self.batch() as batch:
+            return batch.create(data=data)
 
-            if not data.id:
-                new_id: str = str(uuid4())
-                while new_id in json_data:
-                    new_id = str(uuid4())
-            else:
-                new_id = data.id
+    def create_many(self, operations: Iterable[OperationDTO]) -> int:
+        """
+        Create several operations in the JSON database with a single write.
 
-            json_data[new_id] = operation
+        Args:
+            operations (Iterable[OperationDTO]): The operations data.
 
-        with open(self._database, "w") as file:
-            json.dump(json_data, file, indent=2)
+        Returns:
+            int: The number of created operations.
+        """
+        with self.batch() as batch:
+            for data in operations:
+                batch.create(data=data)
+        return len(batch.changes)
 
     def update(self, operation_id: UUID, data: OperationDTO) -> None:
         """
@@ -134,30 +952,8 @@ class DBJsonDAO(FileDB):
             operation_id (UUID): The ID of the operation to update.
             data (OperationDTO): The updated operation data.
         """
-        with open(self._database, "r") as file:
-            json_data: dict[UUID, dict[str, str | float]] = json.load(file)
-
-            if old_data := json_data.get(operation_id):
-                json_data[operation_id] = {
-                    "date": old_data["date"],
-                    "category": (
-                        data.category
-                        if data.category
-                        else old_data["category"]
-                    ),
-                    "amount": (
-                        data.amount if data.amount else old_data["amount"]
-                    ),
-                    "description": (
-                        data.description
-                        if data.description
-                        else old_data["description"]
-                    ),
-                }
-            else:
-                raise RecordDoesNotExistError("Record does not exist.")
-        with open(self._database, "w") as file:
-            json.dump(json_data, file, indent=2)
+        with self.batch() as batch:
+            batch.update(operation_id=operation_id, data=data)
 
     def delete(self, operation_id: UUID) -> None:
         """
@@ -166,11 +962,5 @@ class DBJsonDAO(FileDB):
         Args:
             operation_id (UUID): The ID of the operation to delete.
         """
-        with open(self._database, "r") as file:
-            json_data: dict[UUID, dict[str, str | float]] = json.load(file)
-            if json_data.get(operation_id):
-                json_data.pop(operation_id)
-            else:
-                raise RecordDoesNotExistError("Record does not exist.")
-        with open(self._database, "w") as file:
-            json.dump(json_data, file, indent=2)
+        with self.batch() as batch:
+            batch.delete(operation_id=operation_id)
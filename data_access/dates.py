@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Iterator
+
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+DAY = 86_400_000_000
+
+
+def to_timestamp(value: int | str | datetime | date) -> int:
+    """
+    Convert a date to the stored timestamp.
+
+    Dates are stored as naive (local) microseconds since 1970-01-01, so they
+    compare and sort as integers and are never parsed in a query. ISO 8601
+    strings of databases written before are converted with the fast
+    `datetime.fromisoformat()`.
+
+    Args:
+        value (int | str | datetime | date): A timestamp, an ISO 8601
+            string, a datetime or a date (its midnight).
+
+    Returns:
+        int: The timestamp.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    return (value - EPOCH) // MICROSECOND
+
+
+def from_timestamp(timestamp: int) -> datetime:
+    """
+    Convert a stored timestamp to a datetime.
+
+    Args:
+        timestamp (int): Microseconds since 1970-01-01.
+
+    Returns:
+        datetime: The naive datetime.
+    """
+    return EPOCH + timedelta(microseconds=timestamp)
+
+
+def day_number(value: int | str | datetime | date) -> int:
+    """
+    Return the calendar day of a date as days since 1970-01-01.
+
+    Args:
+        value (int | str | datetime | date): A timestamp, an ISO 8601
+            string, a datetime or a date.
+
+    Returns:
+        int: The day number.
+    """
+    return to_timestamp(value) // DAY
+
+
+def normalize(operation: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert the date of a record read from storage to a timestamp in place.
+
+    Args:
+        operation (dict[str, Any]): The operation record.
+
+    Returns:
+        dict[str, Any]: The same record.
+    """
+    if not isinstance(operation["date"], int):
+        operation["date"] = to_timestamp(operation["date"])
+    return operation
+
+
+def normalize_all(
+    operations: Iterable[tuple[str, dict[str, Any]]],
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Normalize the dates of (ID, record) pairs as they are iterated.
+
+    Args:
+        operations (Iterable[tuple[str, dict[str, Any]]]): (ID, record)
+            pairs read from storage.
+
+    Yields:
+        tuple[str, dict[str, Any]]: The pairs with timestamp dates.
+    """
+    for operation_id, operation in operations:
+        yield operation_id, normalize(operation)
+
+
+def from_day_number(day: int) -> date:
+    """
+    Convert a day number (see `day_number()`) to a calendar date.
+
+    Args:
+        day (int): Days since 1970-01-01.
+
+    Returns:
+        date: The calendar date.
+    """
+    return EPOCH.date() + timedelta(days=day)
+
+
+PERIODS = ("day", "week", "month", "year")
+
+
+def period_start(day: date, period: str) -> date:
+    """
+    Return the first day of the period containing a day.
+
+    Weeks start on Monday.
+
+    Args:
+        day (date): The day.
+        period (str): "day", "week", "month" or "year".
+
+    Returns:
+        date: The first day of the period.
+
+    Raises:
+        ValueError: If the period is unknown.
+    """
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    if period == "year":
+        return day.replace(month=1, day=1)
+    raise ValueError(f'Unknown period "{period}".')
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+
+class FenwickTree:
+    """
+    Prefix sums over a fixed range of positions (a binary indexed tree).
+
+    Adding to a position and summing all the positions up to one both take
+    O(log n) steps, where n is the number of positions; building the tree
+    from the values of every position takes O(n).
+
+    Args:
+        values (Iterable[float]): The initial value of every position; the
+            number of values is the number of positions.
+    """
+
+    def __init__(self, values: Iterable[float] = ()) -> None:
+        # 1-based: tree[i] holds the sum of the i & -i positions ending at
+        # position i - 1.
+        self.tree: list[float] = [0.0]
+        self.tree.extend(values)
+        size = len(self.tree)
+        for index in range(1, size):
+            parent = index + (index & -index)
+            if parent < size:
+                self.tree[parent] += self.tree[index]
+
+    @classmethod
+    def from_tree(cls, tree: list[float]) -> FenwickTree:
+        """
+        Restore a tree from its `tree` list, e.g. a persisted copy.
+
+        Args:
+            tree (list[float]): The `tree` attribute of a tree.
+
+        Returns:
+            FenwickTree: The tree, without rebuilding it.
+        """
+        fenwick = cls.__new__(cls)
+        fenwick.tree = tree
+        return fenwick
+
+    def __len__(self) -> int:
+        return len(self.tree) - 1
+
+    def add(self, position: int, value: float) -> None:
+        """
+        Add a value to a position.
+
+        Args:
+            position (int): The position, from 0 to `len(self) - 1`.
+            value (float): The value to add.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        index = position + 1
+        size = len(self.tree)
+        while index < size:
+            self.tree[index] += value
+            index += index & -index
+
+    def prefix_sum(self, position: int) -> float:
+        """
+        Sum the values of the positions from 0 to a position (inclusive).
+
+        Positions past the end count as the last one, and negative
+        positions sum to 0.
+
+        Args:
+            position (int): The last position to sum.
+
+        Returns:
+            float: The sum.
+        """
+        index = min(position + 1, len(self))
+        total = 0.0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from contextlib import contextmanager, suppress
+from typing import BinaryIO, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of one process are serialized.
+    fcntl = None
+
+
+@contextmanager
+def atomic_write(path: str) -> Iterator[BinaryIO]:
+    """
+    Replace a file atomically with the data written in the block.
+
+    The data is written to a temporary file next to `path`, flushed to disk
+    and renamed over `path`, so a crash leaves either the old or the new
+    file, never a truncated one. If the block raises, `path` is untouched.
+
+    Args:
+        path (str): Path to the file to replace.
+
+    Yields:
+        BinaryIO: The temporary file opened for binary writing.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    try:
+        with open(temp_path, "wb") as file:
+            if mode is not None:
+                os.chmod(temp_path, mode)
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    # Persist the rename itself; not supported on every platform.
+    with suppress(OSError, AttributeError):
+        descriptor = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on "<path>.lock" shared between processes.
+
+    The lock is reentrant within a thread, so nested read-modify-write
+    cycles of one DAO do not deadlock, and serializes the threads of the
+    process that holds it.
+
+    Args:
+        path (str): Path to the guarded file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path + ".lock"
+        self._thread_lock = threading.RLock()
+        self._file: Optional[BinaryIO] = None
+        self._depth = 0
+
+    def __enter__(self) -> FileLock:
+        self._thread_lock.acquire()
+        if not self._depth:
+            try:
+                self._file = open(self._path, "ab")
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            except BaseException:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._depth -= 1
+        if not self._depth:
+            # Closing the file releases the lock.
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import struct
+from io import TextIOWrapper
+from uuid import UUID
+from typing import Any, BinaryIO, Iterator
+
+from data_access.dates import to_timestamp
+from data_access.stream import iter_json_object
+
+
+class JsonFormat:
+    """
+    Operations stored as a JSON object keyed by ID.
+
+    Args:
+        indent (int | None): The indentation of the written JSON, None for
+            minified output.
+    """
+
+    def __init__(self, indent: int | None) -> None:
+        self._indent = indent
+        self._separators = (",", ": ") if indent is not None else (",", ":")
+
+    def load(self, file: BinaryIO) -> dict[str, dict[str, Any]]:
+        return json.load(file)
+
+    def iterate(
+        self, file: BinaryIO
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        text = TextIOWrapper(file, encoding="utf-8")
+        try:
+            yield from iter_json_object(text)
+        finally:
+            text.detach()
+
+    def dump(
+        self, json_data: dict[str, dict[str, Any]], file: BinaryIO
+    ) -> None:
+        text = TextIOWrapper(file, encoding="utf-8")
+        json.dump(
+            json_data, text, indent=self._indent, separators=self._separators
+        )
+        text.flush()
+        text.detach()
+
+
+class BinaryFormat:
+    """
+    Operations stored as fixed-width binary records with a string table.
+
+    Layout (little-endian):
+        header: magic b"CFTL", version (u16), record count (u32) and string
+            count (u32);
+        string table: for each string its UTF-8 length (u32) and bytes;
+        records: ID (16 raw UUID bytes), date (i64 microseconds since
+            1970-01-01, naive), amount (f64), category and description
+            (u32 indexes into the string table).
+
+    Categories and descriptions are stored once in the string table, so a
+    record takes 40 bytes. IDs must be canonical UUID strings.
+    """
+
+    MAGIC = b"CFTL"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHII")
+    LENGTH = struct.Struct("<I")
+    RECORD = struct.Struct("<16sqdII")
+    BATCH = 1024
+
+    def load(self, file: BinaryIO) -> dict[str, dict[str, Any]]:
+        return dict(self.iterate(file))
+
+    def iterate(
+        self, file: BinaryIO
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        magic, version, record_count, string_count = self.HEADER.unpack(
+            file.read(self.HEADER.size)
+        )
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Unsupported binary database format.")
+
+        strings: list[str] = []
+        for _ in range(string_count):
+            (length,) = self.LENGTH.unpack(file.read(self.LENGTH.size))
+            strings.append(file.read(length).decode("utf-8"))
+
+        remaining = record_count
+        while remaining:
+            batch = min(remaining, self.BATCH)
+            data = file.read(batch * self.RECORD.size)
+            if len(data) != batch * self.RECORD.size:
+                raise ValueError("Truncated binary database.")
+            remaining -= batch
+
+            for raw_id, date, amount, category, description in (
+                self.RECORD.iter_unpack(data)
+            ):
+                yield str(UUID(bytes=raw_id)), {
+                    "date": date,
+                    "category": strings[category],
+                    "amount": amount,
+                    "description": strings[description],
+                }
+
+    def dump(
+        self, json_data: dict[str, dict[str, Any]], file: BinaryIO
+    ) -> None:
+        strings: dict[str, int] = {}
+        for operation_id, operation in json_data.items():
+            if str(UUID(operation_id)) != operation_id:
+                raise ValueError(
+                    f"ID {operation_id} is not a canonical UUID string."
+                )
+            strings.setdefault(operation["category"], len(strings))
+            strings.setdefault(operation["description"], len(strings))
+
+        file.write(
+            self.HEADER.pack(
+                self.MAGIC, self.VERSION, len(json_data), len(strings)
+            )
+        )
+        for string in strings:
+            encoded = string.encode("utf-8")
+            file.write(self.LENGTH.pack(len(encoded)) + encoded)
+
+        batch = bytearray()
+        for operation_id, operation in json_data.items():
+            batch += self.RECORD.pack(
+                UUID(operation_id).bytes,
+                to_timestamp(operation["date"]),
+                operation["amount"],
+                strings[operation["category"]],
+                strings[operation["description"]],
+            )
+            if len(batch) >= self.BATCH * self.RECORD.size:
+                file.write(batch)
+                batch.clear()
+        file.write(batch)
+
+
+FORMATS: dict[str, JsonFormat | BinaryFormat] = {
+    "indent": JsonFormat(indent=2),
+    "compact": JsonFormat(indent=None),
+    "binary": BinaryFormat(),
+}
+
+
+def detect_format(
+    file: BinaryIO,
+    default: JsonFormat | BinaryFormat = FORMATS["indent"],
+) -> JsonFormat | BinaryFormat:
+    """
+    Detect the format of a database file from its first bytes.
+
+    Minified JSON is told from indented JSON by the character following
+    the opening brace. An empty object could be either, so it is reported
+    as `default`. The file position is left at the start of the file.
+
+    Args:
+        file (BinaryIO): The database file opened for binary reading.
+        default (JsonFormat | BinaryFormat, optional): The format of an
+            empty JSON object. Defaults to the indented JSON format.
+
+    Returns:
+        JsonFormat | BinaryFormat: The format to read the file with.
+    """
+    magic = file.read(len(BinaryFormat.MAGIC))
+    file.seek(0)
+    if magic == BinaryFormat.MAGIC:
+        return FORMATS["binary"]
+    if magic[1:2] == b'"':
+        return FORMATS["compact"]
+    if magic[1:2] == b"\n":
+        return FORMATS["indent"]
+    return default
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    from uuid import UUID
+    from data_access.views import LedgerView
+
+from data_access.dao import DBJsonDAO
+from data_access.dates import normalize
+from data_access.formats import FORMATS
+
+from config import DB_FORMAT, DB_JOURNAL_COMPACT_THRESHOLD
+
+
+class DBJournalDAO(DBJsonDAO):
+    """
+    JSON database whose mutations are appended to a journal.
+
+    The database file is kept as a snapshot in the usual format, while every
+    create, update and delete is appended as a single JSON line to
+    "<database>.log". The journal is replayed on top of the snapshot when the
+    data is loaded and folded back into the snapshot once it holds
+    `compact_threshold` entries, so a single mutation costs O(1) I/O.
+    """
+
+    def __init__(
+        self,
+        data_name: str,
+        data_type: str,
+        compact_threshold: int = DB_JOURNAL_COMPACT_THRESHOLD,
+        data_format: str = DB_FORMAT,
+    ) -> None:
+        super().__init__(
+            data_name=data_name, data_type=data_type, data_format=data_format
+        )
+        self._journal = self._database + ".log"
+        self._compact_threshold = compact_threshold
+        self._json_data: Optional[dict[UUID, dict[str, str | float]]] = None
+        self._snapshot_stat: Optional[tuple[int, int, int]] = None
+        self._journal_offset: int = 0
+        self._journal_entries: int = 0
+
+    def _load(self) -> dict[UUID, dict[str, str | float]]:
+        """
+        Return the snapshot with the journal replayed on top of it.
+
+        The data and the maintained views are kept in memory between calls;
+        the snapshot is re-read only when it has been replaced (e.g.
+        compacted by another process) and only the journal entries appended
+        since the last call are replayed.
+
+        Returns:
+            dict[UUID, dict[str, str | float]]: Operations keyed by their ID.
+        """
+        snapshot_stat = self._stat(self._database)
+        journal_stat = self._stat(self._journal)
+        journal_size = journal_stat[2] if journal_stat else 0
+
+        if (
+            self._json_data is None
+            or snapshot_stat != self._snapshot_stat
+            or journal_size < self._journal_offset
+        ):
+            self._json_data = super()._load()
+            self._snapshot_stat = snapshot_stat
+            self._journal_offset = 0
+            self._journal_entries = 0
+
+            self._open_views(snapshot_stat)
+            for view_type in self.views:
+                if view_type.name not in self._views:
+                    self._views[view_type.name] = view_type.build(
+                        self._json_data
+                    )
+
+        if journal_size > self._journal_offset:
+            self._replay()
+
+        return self._json_data
+
+    def _iter_file(self) -> Iterator[tuple[UUID, dict[str, str | float]]]:
+        """
+        Iterate over the in-memory snapshot with the journal replayed.
+
+        Yields:
+            tuple[UUID, dict[str, str | float]]: (ID, record) pairs.
+        """
+        yield from self._load().items()
+
+    def _fetch(
+        self, operation_ids: list[UUID]
+    ) -> dict[UUID, dict[str, str | float]]:
+        """
+        Look up the records of some operations in the in-memory data.
+
+        Args:
+            operation_ids (list[UUID]): The IDs of existing operations.
+
+        Returns:
+            dict[UUID, dict[str, str | float]]: The records keyed by ID, in
+                the order of `operation_ids`.
+        """
+        json_data = self._load()
+        return {
+            operation_id: json_data[operation_id]
+            for operation_id in operation_ids
+            if operation_id in json_data
+        }
+
+    def _replay(self) -> None:
+        """
+        Apply the journal entries appended since the last replay.
+
+        Only complete lines are consumed; a line that is not valid JSON
+        (a torn write) is skipped.
+        """
+        with open(self._journal, "rb") as file:
+            file.seek(self._journal_offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+
+                self._journal_offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+
+                operation_id, record = entry["id"], entry["record"]
+                if record is None:
+                    old_data = self._json_data.pop(operation_id, None)
+                else:
+                    normalize(record)
+                    old_data = self._json_data.get(operation_id)
+                    self._json_data[operation_id] = record
+                self._journal_entries += 1
+
+                for view in self._views.values():
+                    view.apply([(operation_id, old_data, record)])
+
+    def _state(self) -> Any:
+        """
+        Identify the snapshot the persisted views are checked against.
+
+        Returns:
+            Any: A JSON-serializable identity of the snapshot file.
+        """
+        return self._snapshot_stat
+
+    def view(self, name: str) -> LedgerView:
+        """
+        Return a maintained view that reflects the snapshot and the journal.
+
+        Args:
+            name (str): The name of the view.
+
+        Returns:
+            LedgerView: The view.
+        """
+        self._load()
+        return self._views[name]
+
+    def rebuild(self) -> None:
+        """
+        Rebuild all maintained views and persist them with a new snapshot.
+        """
+        with self._lock:
+            json_data = self._load()
+            self._views = {
+                view_type.name: view_type.build(json_data)
+                for view_type in self.views
+            }
+            self.compact()
+
+    def convert(self, data_format: str) -> None:
+        """
+        Compact the journal into a snapshot written in another format.
+
+        Args:
+            data_format (str): The target format, see `data_access.formats`.
+        """
+        with self._lock:
+            self._load()
+            self._format = FORMATS[data_format]
+            self.compact()
+
+    def migrate(self) -> None:
+        """
+        Compact the journal into a snapshot with timestamp dates.
+        """
+        with self._lock:
+            self.compact()
+
+    def _commit(
+        self,
+        json_data: dict[UUID, dict[str, str | float]],
+        changes: list[tuple[UUID, Optional[dict], Optional[dict]]],
+    ) -> None:
+        """
+        Append the changes to the journal.
+
+        The in-memory data already holds the changes. If another process
+        appended to the journal since the last replay, the in-memory state
+        is dropped and rebuilt from the files on the next load, so entries
+        are always applied in journal order.
+
+        Args:
+            json_data (dict[UUID, dict[str, str | float]]): The loaded data
+                with the changes applied.
+            changes (list[tuple[UUID, Optional[dict], Optional[dict]]]):
+                The changed operations as (ID, old record, new record)
+                triples, where None marks a missing record.
+        """
+        payload = b"".join(
+            json.dumps({"id": operation_id, "record": record}).encode()
+            + b"\n"
+            for operation_id, _, record in changes
+        )
+
+        with open(self._journal, "a+b") as file:
+            position = file.tell()
+            if position:
+                file.seek(-1, 2)
+                if file.read(1) != b"\n":
+                    # Terminate a torn line left by an interrupted write.
+                    payload = b"\n" + payload
+            file.write(payload)
+
+        if position != self._journal_offset:
+            self._json_data = None
+            return
+
+        self._journal_offset += len(payload)
+        self._journal_entries += len(changes)
+        for view in self._views.values():
+            view.apply(changes)
+
+        if self._journal_entries >= self._compact_threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Fold the journal into a new snapshot and truncate the journal.
+
+        The maintained views are persisted for the new snapshot. Replaying
+        the journal is idempotent, so a crash between writing the snapshot
+        and truncating the journal loses nothing.
+        """
+        with self._lock:
+            json_data = self._load()
+            self._dump(json_data)
+
+            with open(self._journal, "wb"):
+                pass
+
+            self._snapshot_stat = self._stat(self._database)
+            self._journal_offset = 0
+            self._journal_entries = 0
+            self._save_views(self._snapshot_stat)
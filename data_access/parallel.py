@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+from data_access.dao import matches, split_filter
+from data_access.dates import (
+    DAY,
+    PERIODS,
+    day_number,
+    from_day_number,
+    period_start,
+)
+from data_access.shards import iter_shard, list_shards, prune_shards
+
+from config import DB_SHARD_WORKERS
+
+T = TypeVar("T")
+
+Totals = dict[str, dict[str, float | int]]
+
+
+def _add(totals: Totals, category: str, amount: float, count: int) -> None:
+    total = totals.setdefault(category, {"amount": 0.0, "count": 0})
+    total["amount"] += amount
+    total["count"] += count
+
+
+def _merge(totals: Totals, other: Totals) -> Totals:
+    for category, total in other.items():
+        _add(totals, category, total["amount"], total["count"])
+    return totals
+
+
+def _day_bounds(
+    start: Optional[datetime | date], end: Optional[datetime | date]
+) -> tuple[Optional[int], Optional[int]]:
+    return tuple(
+        None if value is None else day_number(value) for value in (start, end)
+    )
+
+
+def shard_totals(
+    path: str, low: Optional[int] = None, high: Optional[int] = None
+) -> Totals:
+    """
+    Sum the amounts and counts per category of one shard.
+
+    Runs in a worker process.
+
+    Args:
+        path (str): The shard file.
+        low (Optional[int]): The first day number, None if open.
+        high (Optional[int]): The last day number, None if open.
+
+    Returns:
+        Totals: {"amount": ..., "count": ...} keyed by category.
+    """
+    totals: Totals = {}
+    for _, operation in iter_shard(path):
+        day = operation["date"] // DAY
+        if (low is None or low <= day) and (high is None or day <= high):
+            _add(totals, operation["category"], operation["amount"], 1)
+    return totals
+
+
+def shard_matches(
+    path: str, predicates: list[tuple]
+) -> dict[UUID, dict[str, Any]]:
+    """
+    Return the operations of one shard matching all the predicates.
+
+    Runs in a worker process.
+
+    Args:
+        path (str): The shard file.
+        predicates (list[tuple]): The predicates, see `split_filter()`.
+
+    Returns:
+        dict[UUID, dict[str, Any]]: The matching operations keyed by ID.
+    """
+    return {
+        operation_id: operation
+        for operation_id, operation in iter_shard(path)
+        if all(matches(operation, predicate) for predicate in predicates)
+    }
+
+
+def shard_period_totals(
+    path: str,
+    period: str,
+    low: Optional[int] = None,
+    high: Optional[int] = None,
+) -> dict[date, Totals]:
+    """
+    Sum the amounts and counts per period and category of one shard.
+
+    Runs in a worker process.
+
+    Args:
+        path (str): The shard file.
+        period (str): "day", "week", "month" or "year".
+        low (Optional[int]): The first day number, None if open.
+        high (Optional[int]): The last day number, None if open.
+
+    Returns:
+        dict[date, Totals]: The totals keyed by the first day of the
+            period.
+    """
+    periods: dict[date, Totals] = {}
+    starts: dict[int, date] = {}
+    for _, operation in iter_shard(path):
+        day = operation["date"] // DAY
+        if (low is not None and day < low) or (
+            high is not None and day > high
+        ):
+            continue
+        if day not in starts:
+            starts[day] = period_start(from_day_number(day), period)
+        _add(
+            periods.setdefault(starts[day], {}),
+            operation["category"],
+            operation["amount"],
+            1,
+        )
+    return periods
+
+
+class ParallelLedger:
+    """
+    Aggregations over monthly shards computed by a pool of processes.
+
+    Each shard (see `data_access.shards`) is parsed and aggregated by a
+    worker process and the partial results are merged, so the work is
+    spread over the CPU cores instead of one interpreter. Shards outside
+    the requested dates are not read at all.
+
+    The shards are usually the live partitions of `DBPartitionedDAO`
+    (`DBPartitionedDAO.directory`). Partitions are replaced atomically, so
+    every shard is read either before or after a concurrent write.
+
+    A pool is started per call unless `executor` is given; with a single
+    shard or a single worker everything runs in the calling process.
+
+    Args:
+        directory (str): The shard (partition) directory.
+        max_workers (Optional[int]): The number of worker processes, None
+            for the number of CPUs.
+        executor (Optional[Executor]): A pool to reuse between calls.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_workers: Optional[int] = DB_SHARD_WORKERS,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.directory = directory
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor
+
+    def _map(
+        self, func: Callable[..., T], paths: list[str], *args: Any
+    ) -> list[T]:
+        arguments = [[argument] * len(paths) for argument in args]
+        if self.executor is not None:
+            return list(self.executor.map(func, paths, *arguments))
+        if len(paths) <= 1 or self.max_workers == 1:
+            return list(map(func, paths, *arguments))
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(paths))
+        ) as executor:
+            return list(executor.map(func, paths, *arguments))
+
+    def _paths(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> list[str]:
+        return list(
+            prune_shards(list_shards(self.directory), start, end).values()
+        )
+
+    def totals(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> Totals:
+        """
+        Return the amount and count totals per category.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            Totals: {"amount": ..., "count": ...} keyed by category.
+        """
+        totals: Totals = {}
+        for partial in self._map(
+            shard_totals, self._paths(start, end), *_day_bounds(start, end)
+        ):
+            _merge(totals, partial)
+        return totals
+
+    def balance(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> float:
+        """
+        Return the income minus the expenses.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            float: The balance.
+        """
+        return sum(
+            total["amount"] if category == "income" else -total["amount"]
+            for category, total in self.totals(start, end).items()
+        )
+
+    def read(
+        self, filter: Optional[tuple | list[tuple]] = None
+    ) -> dict[UUID, dict[str, Any]]:
+        """
+        Return the operations matching a filter.
+
+        Date predicates also select the shards that are read.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Returns:
+            dict[UUID, dict[str, Any]]: The matching operations keyed by ID,
+                in month order.
+        """
+        predicates = split_filter(filter) if filter else []
+        start = end = None
+        for predicate in predicates:
+            if predicate[0] == "date":
+                start, end = predicate[1], predicate[-1]
+
+        operations: dict[UUID, dict[str, Any]] = {}
+        for partial in self._map(
+            shard_matches, self._paths(start, end), predicates
+        ):
+            operations.update(partial)
+        return operations
+
+    def period_totals(
+        self,
+        period: str = "month",
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> dict[date, Totals]:
+        """
+        Return the amount and count totals per period and category.
+
+        Args:
+            period (str): "day", "week", "month" or "year".
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            dict[date, Totals]: The totals keyed by the first day of the
+                period, in date order.
+
+        Raises:
+            ValueError: If the period is unknown.
+        """
+        if period not in PERIODS:
+            raise ValueError(f'Unknown period "{period}".')
+
+        periods: dict[date, Totals] = {}
+        for partial in self._map(
+            shard_period_totals,
+            self._paths(start, end),
+            period,
+            *_day_bounds(start, end),
+        ):
+            # A week or a year spans several shards.
+            for key, totals in partial.items():
+                _merge(periods.setdefault(key, {}), totals)
+        return dict(sorted(periods.items()))
@@ -0,0 +1,659 @@
+from __future__ import annotations
+
+import heapq
+import json
+import os
+from bisect import bisect_left, bisect_right
+from contextlib import ExitStack, contextmanager
+from dataclasses import replace
+from datetime import date, datetime
+from itertools import chain, islice, repeat
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from uuid import UUID
+    from business_logic.dto import OperationDTO
+    from data_access.dao import Batch, DBJsonDAO
+
+from data_access.dao import FileDB, db_provider, split_filter
+from data_access.exceptions import RecordDoesNotExistError
+from data_access.files import FileLock, atomic_write
+from data_access.formats import FORMATS
+from data_access.shards import (
+    list_shards,
+    month_key,
+    partition_directory,
+    prune_shards,
+)
+from data_access.views import OrderView
+
+from config import DB_CACHE, DB_FORMAT
+
+
+class PartitionedBatch:
+    """
+    Mutations routed to the batches of the partitions they touch.
+
+    Created by `DBPartitionedDAO.batch()`. A partition's batch is opened
+    the first time the partition is touched and committed when the block
+    exits.
+
+    Args:
+        dao (DBPartitionedDAO): The partitioned database.
+        stack (ExitStack): Holds the open partition batches.
+    """
+
+    def __init__(self, dao: DBPartitionedDAO, stack: ExitStack) -> None:
+        self._dao = dao
+        self._stack = stack
+        self._batches: dict[str, Batch] = {}
+        self.ids: dict[UUID, Optional[str]] = {}
+        self.counts: dict[str, int] = {}
+
+    def _batch(self, key: str) -> Batch:
+        if key not in self._batches:
+            self._batches[key] = self._stack.enter_context(
+                self._dao.partition(key, create=True).batch()
+            )
+        return self._batches[key]
+
+    def _key(self, operation_id: UUID) -> Optional[str]:
+        if operation_id in self.ids:
+            return self.ids[operation_id]
+        return self._dao.partition_of(operation_id)
+
+    def _existing_key(self, operation_id: UUID) -> str:
+        key = self._key(operation_id)
+        if key is None:
+            raise RecordDoesNotExistError("Record does not exist.")
+        return key
+
+    def _move(
+        self, operation_id: UUID, old: Optional[str], new: Optional[str]
+    ) -> None:
+        self.ids[operation_id] = new
+        for key, change in ((old, -1), (new, 1)):
+            if key is not None:
+                self.counts[key] = self.counts.get(key, 0) + change
+
+    def create(self, data: OperationDTO) -> UUID:
+        """
+        Create a new operation in the partition of its month.
+
+        The operation keeps its date if it has one and is dated now
+        otherwise.
+
+        Args:
+            data (OperationDTO): The operation data.
+
+        Returns:
+            UUID: The ID of the operation.
+        """
+        data = replace(data, date=data.date or datetime.now())
+        key = month_key(data.date)
+        old = self._key(data.id) if data.id else None
+        if old is not None and old != key:
+            self.delete(operation_id=data.id)
+            old = None
+
+        operation_id = self._batch(key).create(data=data)
+        if old is None:
+            self._move(operation_id, None, key)
+        return operation_id
+
+    def update(self, operation_id: UUID, data: OperationDTO) -> None:
+        """
+        Update an operation; empty fields of `data` are left unchanged.
+
+        Args:
+            operation_id (UUID): The ID of the operation to update.
+            data (OperationDTO): The updated operation data.
+
+        Raises:
+            RecordDoesNotExistError: If the operation does not exist.
+        """
+        self._batch(self._existing_key(operation_id)).update(
+            operation_id=operation_id, data=data
+        )
+
+    def delete(self, operation_id: UUID) -> None:
+        """
+        Delete an operation.
+
+        Args:
+            operation_id (UUID): The ID of the operation to delete.
+
+        Raises:
+            RecordDoesNotExistError: If the operation does not exist.
+        """
+        key = self._existing_key(operation_id)
+        self._batch(key).delete(operation_id=operation_id)
+        self._move(operation_id, key, None)
+
+
+class DBPartitionedDAO(FileDB):
+    """
+    JSON database split into one file per month of the operation dates.
+
+    The partitions use the layout of `data_access.shards`
+    ("<data_name>.parts/YYYY-MM.json"), so `ParallelLedger` aggregates them
+    in place, see `directory`. Each partition is a JSON database with
+    its own maintained views. The directory also holds:
+
+    - "manifest.json": the number of operations per non-empty partition
+      and the format new partitions are written in (see `convert()`);
+    - "directory.log": the partition of every ID, appended as
+      "<ID> <month>" or "<ID> -" lines on every create and delete and
+      read once per process.
+
+    Date filters and date ranges only read the partitions of the months
+    they overlap, creates write the partition of the operation's month,
+    and updates and deletes find the partition in the directory, so
+    queries on recent data do not depend on the length of the history.
+    A batch spanning several months commits each partition separately.
+    The date of an operation never changes, so operations do not move
+    between partitions on update.
+
+    If the manifest is missing (e.g. the partitions were written by
+    `write_shards()`), it and the directory are rebuilt from the
+    partitions. Months whose operations were all deleted are dropped from
+    the manifest, so they are not read again.
+    """
+
+    MANIFEST = "manifest.json"
+    DIRECTORY = "directory.log"
+
+    def __init__(
+        self,
+        data_name: str,
+        data_type: str,
+        cache: bool = DB_CACHE,
+        data_format: str = DB_FORMAT,
+    ) -> None:
+        super().__init__(data_name=data_name, data_type=data_type)
+        self._root = partition_directory(data_name)
+        self._manifest_path = os.path.join(self._root, self.MANIFEST)
+        self._directory_path = os.path.join(self._root, self.DIRECTORY)
+        self._cache = cache
+        try:
+            with open(self._manifest_path, "r") as file:
+                data_format = json.load(file).get("format", data_format)
+        except (FileNotFoundError, ValueError):
+            pass
+        self._format = data_format
+        os.makedirs(self._root, exist_ok=True)
+        self._lock = FileLock(self._manifest_path)
+        self._partitions: dict[str, DBJsonDAO] = {}
+        self._ids: dict[UUID, str] = {}
+        self._ids_offset = 0
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory of the partitions.
+        """
+        return self._root
+
+    def partition(self, key: str, create: bool = False) -> DBJsonDAO:
+        """
+        Return the database of a month.
+
+        Args:
+            key (str): The month ("YYYY-MM").
+            create (bool): Create the partition file if it does not exist.
+
+        Returns:
+            DBJsonDAO: The partition.
+        """
+        if key not in self._partitions:
+            data_name = os.path.join(self._root, key)
+            if create and not os.path.exists(data_name + ".json"):
+                with atomic_write(data_name + ".json") as file:
+                    FORMATS[self._format].dump({}, file)
+            self._partitions[key] = db_provider(
+                data_name=data_name,
+                data_type=".json",
+                journal=False,
+                cache=self._cache,
+                data_format=self._format,
+                partitioned=False,
+            )
+        return self._partitions[key]
+
+    def manifest(self) -> dict[str, int]:
+        """
+        Return the number of operations per partition.
+
+        Returns:
+            dict[str, int]: The counts keyed by month, in month order.
+        """
+        try:
+            with open(self._manifest_path, "r") as file:
+                return json.load(file)["partitions"]
+        except (FileNotFoundError, ValueError, KeyError):
+            with self._lock:
+                return self._rebuild_layout()
+
+    def _write_manifest(self, counts: dict[str, int]) -> None:
+        with atomic_write(self._manifest_path) as file:
+            file.write(
+                json.dumps(
+                    {
+                        "partitions": dict(sorted(counts.items())),
+                        "format": self._format,
+                    }
+                ).encode()
+            )
+
+    def _rebuild_layout(self) -> dict[str, int]:
+        """
+        Recount the partitions and rewrite the manifest and the directory.
+
+        Returns:
+            dict[str, int]: The counts of the non-empty partitions keyed by
+                month.
+        """
+        counts: dict[str, int] = {}
+        self._ids = {}
+        for key in list_shards(self._root):
+            operations = self.partition(key).read()
+            if operations:
+                counts[key] = len(operations)
+            self._ids.update(dict.fromkeys(operations, key))
+
+        payload = "".join(
+            f"{operation_id} {key}\n"
+            for operation_id, key in self._ids.items()
+        ).encode()
+        with atomic_write(self._directory_path) as file:
+            file.write(payload)
+        self._ids_offset = len(payload)
+        self._write_manifest(counts)
+        return counts
+
+    def _sync_directory(self) -> None:
+        """
+        Read the directory entries appended since the last call.
+        """
+        stat = self._stat(self._directory_path)
+        size = stat[2] if stat else 0
+        if size < self._ids_offset:
+            # Rewritten by a rebuild in another process.
+            self._ids = {}
+            self._ids_offset = 0
+        if size == self._ids_offset:
+            return
+
+        with open(self._directory_path, "rb") as file:
+            file.seek(self._ids_offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                self._ids_offset += len(line)
+                operation_id, key = line.decode().split()
+                if key == "-":
+                    self._ids.pop(operation_id, None)
+                else:
+                    self._ids[operation_id] = key
+
+    def partition_of(self, operation_id: UUID) -> Optional[str]:
+        """
+        Find the partition of an operation in the directory.
+
+        Args:
+            operation_id (UUID): The ID of the operation.
+
+        Returns:
+            Optional[str]: The month of the partition, None if the
+                operation does not exist.
+        """
+        self.manifest()
+        self._sync_directory()
+        return self._ids.get(operation_id)
+
+    def _keys(self, filter: Optional[tuple | list[tuple]] = None) -> list[str]:
+        """
+        Select the partitions a filter can match, in month order.
+        """
+        keys = {key: key for key in self.manifest()}
+        for predicate in split_filter(filter) if filter else ():
+            if predicate[0] == "date":
+                keys = prune_shards(keys, predicate[1], predicate[-1])
+        return list(keys)
+
+    def read(
+        self,
+        operation_id: Optional[UUID] = None,
+        filter: Optional[tuple | list[tuple]] = None,
+    ) -> dict[UUID, dict[str, str | float]] | OperationDTO | None:
+        """
+        Read data from the partitions, see `DBJsonDAO.read()`.
+
+        Args:
+            operation_id (Optional[UUID]): The ID of the operation to read.
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Returns:
+            dict[UUID, dict[str, str | float]] | OperationDTO | None: The
+                read data, in month order.
+
+        Raises:
+            RecordDoesNotExistError: If the operation does not exist.
+        """
+        if operation_id and not filter:
+            key = self.partition_of(operation_id)
+            if key is None:
+                raise RecordDoesNotExistError("Record does not exist.")
+            return self.partition(key).read(operation_id=operation_id)
+
+        json_data: dict[UUID, dict[str, str | float]] = {}
+        for key in self._keys(filter):
+            json_data.update(self.partition(key).read(filter=filter))
+        return json_data
+
+    def iter_operations(
+        self, filter: Optional[tuple | list[tuple]] = None
+    ) -> Iterator[tuple[UUID, dict[str, str | float]]]:
+        """
+        Iterate over the operations, optionally filtered, month by month.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Yields:
+            tuple[UUID, dict[str, str | float]]: (ID, record) pairs.
+        """
+        for key in self._keys(filter):
+            yield from self.partition(key).iter_operations(filter=filter)
+
+    def totals(self) -> dict[str, dict[str, float | int]]:
+        """
+        Return the amount and count totals per category.
+
+        The totals maintained by every partition are added up.
+
+        Returns:
+            dict[str, dict[str, float | int]]: {"amount": ..., "count": ...}
+                keyed by category.
+        """
+        totals: dict[str, dict[str, float | int]] = {}
+        for key in self.manifest():
+            for category, total in self.partition(key).totals().items():
+                merged = totals.setdefault(
+                    category, {"amount": 0.0, "count": 0}
+                )
+                merged["amount"] += total["amount"]
+                merged["count"] += total["count"]
+        return totals
+
+    def balance(self, as_of: Optional[datetime | date] = None) -> float:
+        """
+        Return the income minus the expenses up to the end of a day.
+
+        The maintained totals of the months before `as_of` are added to the
+        balance of its own month, see `DBJsonDAO.balance()`.
+
+        Args:
+            as_of (Optional[datetime | date]): The last day (inclusive),
+                None for all the operations.
+
+        Returns:
+            float: The balance.
+        """
+        last = None if as_of is None else month_key(as_of)
+        balance = 0.0
+        for key in self._keys(("date", None, as_of)):
+            partition = self.partition(key)
+            if key == last:
+                balance += partition.balance(as_of)
+                continue
+            for category, total in partition.totals().items():
+                if category == "income":
+                    balance += total["amount"]
+                else:
+                    balance -= total["amount"]
+        return balance
+
+    def daily_totals(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> dict[date, dict[str, dict[str, float | int]]]:
+        """
+        Return the amount and count totals per day and category.
+
+        Only the partitions of the months overlapping the range are read.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            dict[date, dict[str, dict[str, float | int]]]: {"amount": ...,
+                "count": ...} keyed by category, keyed by the days with
+                operations in date order.
+        """
+        daily: dict[date, dict[str, dict[str, float | int]]] = {}
+        for key in self._keys(("date", start, end)):
+            daily.update(self.partition(key).daily_totals(start, end))
+        return daily
+
+    def page(
+        self,
+        per_page: int,
+        offset: int = 0,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        filter: Optional[tuple | list[tuple]] = None,
+        order_by: str = "date",
+        descending: bool = False,
+    ) -> tuple[dict[UUID, dict[str, str | float]], int]:
+        """
+        Read one page of operations in a sort order, see `DBJsonDAO.page()`.
+
+        The sort orders of the partitions are merged lazily. In the date
+        order the partitions follow each other, so whole partitions before
+        the offset are skipped by their size.
+
+        Raises:
+            KeyError: If the field is not sortable.
+            RecordDoesNotExistError: If the cursor operation does not exist.
+        """
+        if order_by not in OrderView.fields:
+            raise KeyError(order_by)
+
+        keys = self._keys(filter)
+        records: dict[str, dict[UUID, dict[str, Any]]] = {}
+        orders: list[list[tuple[Any, ...]]] = []
+        for key in keys:
+            partition = self.partition(key)
+            if filter:
+                records[key] = partition.read(filter=filter)
+                orders.append(
+                    sorted(
+                        OrderView.sort_key(order_by, operation_id, operation)
+                        for operation_id, operation in records[key].items()
+                    )
+                )
+            else:
+                orders.append(partition.view(OrderView.name).order[order_by])
+        total = sum(map(len, orders))
+
+        cursor = after if after is not None else before
+        if cursor is not None:
+            cursor_partition = self.partition_of(cursor)
+            if cursor_partition is None:
+                raise RecordDoesNotExistError("Record does not exist.")
+            cursor_key = OrderView.sort_key(
+                order_by,
+                cursor,
+                self.partition(cursor_partition).read()[cursor],
+            )
+
+        # As in DBJsonDAO.page(), a descending page is the mirror of an
+        # ascending one. The keys are walked forward after a cursor or from
+        # an offset, and backward before a cursor or from the end.
+        if descending:
+            after, before = before, after
+        backward = before is not None or (after is None and descending)
+        if after is not None:
+            starts = [bisect_right(order, cursor_key) for order in orders]
+        elif before is not None:
+            starts = [bisect_left(order, cursor_key) for order in orders]
+        else:
+            starts = [len(order) if backward else 0 for order in orders]
+
+        if cursor is None and order_by == "date":
+            # The partitions hold consecutive date ranges.
+            indexes = range(len(orders))
+            for index in reversed(indexes) if backward else indexes:
+                skipped = min(offset, len(orders[index]))
+                starts[index] += -skipped if backward else skipped
+                offset -= skipped
+
+        walks = [
+            zip(
+                map(
+                    order.__getitem__,
+                    range(start - 1, -1, -1) if backward
+                    else range(start, len(order)),
+                ),
+                repeat(key),
+            )
+            for order, start, key in zip(orders, starts, keys)
+        ]
+        if order_by == "date":
+            walk = chain(*(reversed(walks) if backward else walks))
+        else:
+            walk = heapq.merge(*walks, reverse=backward)
+        skip = offset if cursor is None else 0
+        page = list(islice(walk, skip, skip + per_page))
+        if backward != descending:
+            page.reverse()
+
+        operations: dict[UUID, dict[str, str | float]] = {}
+        for sort_key, key in page:
+            if key not in records:
+                records[key] = self.partition(key).read()
+            operations[sort_key[-1]] = records[key][sort_key[-1]]
+        return operations, total
+
+    @contextmanager
+    def batch(self) -> Iterator[PartitionedBatch]:
+        """
+        Collect creates, updates and deletes and commit them together.
+
+        Every touched partition is written once when the block exits, then
+        the directory and the manifest are updated. If the block raises,
+        nothing is written.
+
+        Yields:
+            PartitionedBatch: The batch to record the mutations in.
+        """
+        with self._lock:
+            counts = self.manifest()
+            with ExitStack() as stack:
+                batch = PartitionedBatch(self, stack)
+                yield batch
+            if not batch.ids and not batch.counts:
+                return
+
+            self._sync_directory()
+            payload = "".join(
+                f"{operation_id} {key or '-'}\n"
+                for operation_id, key in batch.ids.items()
+            ).encode()
+            with open(self._directory_path, "ab") as file:
+                file.write(payload)
+            self._sync_directory()
+
+            for key, change in batch.counts.items():
+                counts[key] = counts.get(key, 0) + change
+                if not counts[key]:
+                    del counts[key]
+            self._write_manifest(counts)
+
+    def create(self, data: OperationDTO) -> UUID:
+        """
+        Create a new operation in the partition of its month.
+
+        Args:
+            data (OperationDTO): The operation data.
+
+        Returns:
+            UUID: The ID of the operation.
+        """
+        with self.batch() as batch:
+            return batch.create(data=data)
+
+    def create_many(self, operations: Iterable[OperationDTO]) -> int:
+        """
+        Create several operations, writing every partition once.
+
+        Args:
+            operations (Iterable[OperationDTO]): The operations data.
+
+        Returns:
+            int: The number of created operations.
+        """
+        count = 0
+        with self.batch() as batch:
+            for data in operations:
+                batch.create(data=data)
+                count += 1
+        return count
+
+    def update(self, operation_id: UUID, data: OperationDTO) -> None:
+        """
+        Update an operation in its partition.
+
+        Args:
+            operation_id (UUID): The ID of the operation to update.
+            data (OperationDTO): The updated operation data.
+        """
+        with self.batch() as batch:
+            batch.update(operation_id=operation_id, data=data)
+
+    def delete(self, operation_id: UUID) -> None:
+        """
+        Delete an operation from its partition.
+
+        Args:
+            operation_id (UUID): The ID of the operation to delete.
+        """
+        with self.batch() as batch:
+            batch.delete(operation_id=operation_id)
+
+    def rebuild(self) -> None:
+        """
+        Rebuild the views of every partition, the manifest and the directory.
+        """
+        with self._lock:
+            for key in list_shards(self._root):
+                self.partition(key).rebuild()
+            self._rebuild_layout()
+
+    def convert(self, data_format: str) -> None:
+        """
+        Rewrite every partition in another format and keep writing in it.
+
+        Args:
+            data_format (str): The target format, see `data_access.formats`.
+        """
+        with self._lock:
+            self._format = data_format
+            counts = self.manifest()
+            for key in counts:
+                self.partition(key).convert(data_format=data_format)
+            self._write_manifest(counts)
+
+    def migrate(self) -> None:
+        """
+        Rewrite every partition with the dates stored as timestamps.
+        """
+        with self._lock:
+            for key in self.manifest():
+                self.partition(key).migrate()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+import re
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+from data_access.dates import from_timestamp, normalize, normalize_all
+from data_access.files import atomic_write
+from data_access.formats import FORMATS, detect_format
+
+from config import DB_FORMAT
+
+
+SHARD_NAME = re.compile(r"^(\d{4}-\d{2})\.json$")
+
+
+def partition_directory(data_name: str) -> str:
+    """
+    Return the directory of the monthly partitions of a database.
+
+    The partitions of `DBPartitionedDAO` are shards, so `ParallelLedger`
+    aggregates the live database in that directory.
+
+    Args:
+        data_name (str): The name of the database without extension.
+
+    Returns:
+        str: "<data_name>.parts".
+    """
+    return data_name + ".parts"
+
+
+def month_key(value: int | datetime | date) -> str:
+    """
+    Return the shard key ("YYYY-MM") of a date.
+
+    Args:
+        value (int | datetime | date): A timestamp, a datetime or a date.
+
+    Returns:
+        str: The year and month of the date.
+    """
+    if isinstance(value, int):
+        value = from_timestamp(value)
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+def list_shards(directory: str) -> dict[str, str]:
+    """
+    Find the shards of a directory.
+
+    Args:
+        directory (str): The shard directory.
+
+    Returns:
+        dict[str, str]: Shard paths keyed by month, in date order; empty if
+            the directory does not exist.
+    """
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return {}
+    return {
+        match[1]: os.path.join(directory, name)
+        for name in sorted(names)
+        if (match := SHARD_NAME.match(name))
+    }
+
+
+def prune_shards(
+    shards: dict[str, str],
+    start: Optional[datetime | date] = None,
+    end: Optional[datetime | date] = None,
+) -> dict[str, str]:
+    """
+    Keep the shards of the months overlapping a date range.
+
+    Args:
+        shards (dict[str, str]): Shard paths keyed by month.
+        start (Optional[datetime | date]): The first day, None if open.
+        end (Optional[datetime | date]): The last day, None if open.
+
+    Returns:
+        dict[str, str]: The overlapping shards.
+    """
+    low = month_key(start) if start is not None else None
+    high = month_key(end) if end is not None else None
+    return {
+        key: path
+        for key, path in shards.items()
+        if (low is None or low <= key) and (high is None or key <= high)
+    }
+
+
+def load_shard(path: str) -> dict[UUID, dict[str, Any]]:
+    """
+    Load the operations of a shard.
+
+    Args:
+        path (str): The shard file, in any of the database formats.
+
+    Returns:
+        dict[UUID, dict[str, Any]]: Operations keyed by ID, with timestamp
+            dates.
+    """
+    with open(path, "rb") as file:
+        json_data = detect_format(file).load(file)
+    for operation in json_data.values():
+        normalize(operation)
+    return json_data
+
+
+def iter_shard(path: str) -> Iterator[tuple[UUID, dict[str, Any]]]:
+    """
+    Stream the operations of a shard.
+
+    Args:
+        path (str): The shard file, in any of the database formats.
+
+    Yields:
+        tuple[UUID, dict[str, Any]]: (ID, record) pairs.
+    """
+    with open(path, "rb") as file:
+        yield from normalize_all(detect_format(file).iterate(file))
+
+
+def write_shards(
+    operations: Iterable[tuple[UUID, dict[str, Any]]],
+    directory: str,
+    data_format: str = DB_FORMAT,
+) -> dict[str, int]:
+    """
+    Split operations by month into one database file per month.
+
+    Every shard is written atomically; shards of months without
+    operations are removed, so the directory holds exactly `operations`.
+
+    Args:
+        operations (Iterable[tuple[UUID, dict[str, Any]]]): (ID, record)
+            pairs with timestamp dates.
+        directory (str): The shard directory, created if needed.
+        data_format (str): The format of the shard files, see
+            `data_access.formats`.
+
+    Returns:
+        dict[str, int]: The number of operations per month.
+    """
+    months: dict[str, dict[UUID, dict[str, Any]]] = {}
+    for operation_id, operation in operations:
+        months.setdefault(month_key(operation["date"]), {})[
+            operation_id
+        ] = operation
+
+    os.makedirs(directory, exist_ok=True)
+    for key, json_data in months.items():
+        with atomic_write(os.path.join(directory, key + ".json")) as file:
+            FORMATS[data_format].dump(json_data, file)
+    for key, path in list_shards(directory).items():
+        if key not in months:
+            os.remove(path)
+
+    return {key: len(months[key]) for key in sorted(months)}
@@ -0,0 +1,778 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from uuid import UUID, uuid4
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, Optional
+
+from business_logic.dto import OperationDTO, OperationRecord
+from data_access.dao import FileDB, split_filter
+from data_access.dates import to_timestamp
+from data_access.exceptions import RecordDoesNotExistError
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    category TEXT NOT NULL,
+    amount REAL NOT NULL,
+    description TEXT NOT NULL
+);
+-- Superseded by the composite indexes below.
+DROP INDEX IF EXISTS operations_category;
+DROP INDEX IF EXISTS operations_amount;
+CREATE INDEX IF NOT EXISTS operations_category_date_id
+ON operations (category, date, id);
+CREATE INDEX IF NOT EXISTS operations_amount_date_id
+ON operations (amount, date, id);
+CREATE INDEX IF NOT EXISTS operations_date_id ON operations (date, id);
+
+CREATE TABLE IF NOT EXISTS totals (
+    category TEXT PRIMARY KEY,
+    amount REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS operations_insert_totals
+AFTER INSERT ON operations
+BEGIN
+    INSERT INTO totals (category, amount, count)
+    VALUES (NEW.category, NEW.amount, 1)
+    ON CONFLICT (category) DO UPDATE
+    SET amount = amount + excluded.amount, count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS operations_delete_totals
+AFTER DELETE ON operations
+BEGIN
+    UPDATE totals SET amount = amount - OLD.amount, count = count - 1
+    WHERE category = OLD.category;
+END;
+CREATE TRIGGER IF NOT EXISTS operations_update_totals
+AFTER UPDATE OF category, amount ON operations
+BEGIN
+    UPDATE totals SET amount = amount - OLD.amount, count = count - 1
+    WHERE category = OLD.category;
+    INSERT INTO totals (category, amount, count)
+    VALUES (NEW.category, NEW.amount, 1)
+    ON CONFLICT (category) DO UPDATE
+    SET amount = amount + excluded.amount, count = count + 1;
+END;
+
+-- Daily rollup; day is the "YYYY-MM-DD" prefix of the ISO 8601 date.
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT NOT NULL,
+    category TEXT NOT NULL,
+    amount REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, category)
+);
+CREATE TRIGGER IF NOT EXISTS operations_insert_daily
+AFTER INSERT ON operations
+BEGIN
+    INSERT INTO daily (day, category, amount, count)
+    VALUES (substr(NEW.date, 1, 10), NEW.category, NEW.amount, 1)
+    ON CONFLICT (day, category) DO UPDATE
+    SET amount = amount + excluded.amount, count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS operations_delete_daily
+AFTER DELETE ON operations
+BEGIN
+    UPDATE daily SET amount = amount - OLD.amount, count = count - 1
+    WHERE day = substr(OLD.date, 1, 10) AND category = OLD.category;
+END;
+CREATE TRIGGER IF NOT EXISTS operations_update_daily
+AFTER UPDATE OF date, category, amount ON operations
+BEGIN
+    UPDATE daily SET amount = amount - OLD.amount, count = count - 1
+    WHERE day = substr(OLD.date, 1, 10) AND category = OLD.category;
+    INSERT INTO daily (day, category, amount, count)
+    VALUES (substr(NEW.date, 1, 10), NEW.category, NEW.amount, 1)
+    ON CONFLICT (day, category) DO UPDATE
+    SET amount = amount + excluded.amount, count = count + 1;
+END;
+
+-- Prefix sums of the daily balances: a Fenwick tree over the Julian day
+-- numbers. Node k holds the balance of the days (k - lowbit(k), k], so a
+-- day changes one node per level and a prefix sum reads one per level.
+CREATE TABLE IF NOT EXISTS tree_levels (level INTEGER PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS balance_tree (
+    node INTEGER PRIMARY KEY,
+    amount REAL NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS operations_insert_tree
+AFTER INSERT ON operations
+BEGIN
+    INSERT INTO balance_tree (node, amount)
+    SELECT ((position >> level) + 1) << level, signed
+    FROM tree_levels, (
+        SELECT
+            CAST(julianday(substr(NEW.date, 1, 10)) AS INTEGER) AS position,
+            CASE WHEN NEW.category = 'income'
+            THEN NEW.amount ELSE -NEW.amount END AS signed
+    )
+    WHERE (position >> level) & 1 = 0
+    ON CONFLICT (node) DO UPDATE SET amount = amount + excluded.amount;
+END;
+CREATE TRIGGER IF NOT EXISTS operations_delete_tree
+AFTER DELETE ON operations
+BEGIN
+    UPDATE balance_tree SET amount = amount - (
+        CASE WHEN OLD.category = 'income' THEN OLD.amount ELSE -OLD.amount END
+    )
+    WHERE node IN (
+        SELECT ((position >> level) + 1) << level
+        FROM tree_levels, (
+            SELECT
+                CAST(julianday(substr(OLD.date, 1, 10)) AS INTEGER)
+                AS position
+        )
+        WHERE (position >> level) & 1 = 0
+    );
+END;
+CREATE TRIGGER IF NOT EXISTS operations_update_tree
+AFTER UPDATE OF date, category, amount ON operations
+BEGIN
+    UPDATE balance_tree SET amount = amount - (
+        CASE WHEN OLD.category = 'income' THEN OLD.amount ELSE -OLD.amount END
+    )
+    WHERE node IN (
+        SELECT ((position >> level) + 1) << level
+        FROM tree_levels, (
+            SELECT
+                CAST(julianday(substr(OLD.date, 1, 10)) AS INTEGER)
+                AS position
+        )
+        WHERE (position >> level) & 1 = 0
+    );
+    INSERT INTO balance_tree (node, amount)
+    SELECT ((position >> level) + 1) << level, signed
+    FROM tree_levels, (
+        SELECT
+            CAST(julianday(substr(NEW.date, 1, 10)) AS INTEGER) AS position,
+            CASE WHEN NEW.category = 'income'
+            THEN NEW.amount ELSE -NEW.amount END AS signed
+    )
+    WHERE (position >> level) & 1 = 0
+    ON CONFLICT (node) DO UPDATE SET amount = amount + excluded.amount;
+END;
+"""
+
+REBUILD_TOTALS = """
+DELETE FROM totals;
+INSERT INTO totals (category, amount, count)
+SELECT category, SUM(amount), COUNT(*) FROM operations GROUP BY category;
+DELETE FROM daily;
+INSERT INTO daily (day, category, amount, count)
+SELECT substr(date, 1, 10), category, SUM(amount), COUNT(*)
+FROM operations GROUP BY substr(date, 1, 10), category;
+-- Levels 0 to 23 cover the Julian day numbers of years 1 to 9999.
+INSERT OR IGNORE INTO tree_levels (level)
+WITH RECURSIVE levels (level) AS (
+    SELECT 0 UNION ALL SELECT level + 1 FROM levels WHERE level < 23
+)
+SELECT level FROM levels;
+DELETE FROM balance_tree;
+INSERT INTO balance_tree (node, amount)
+SELECT ((position >> level) + 1) << level AS node, SUM(signed)
+FROM tree_levels, (
+    SELECT
+        CAST(julianday(day) AS INTEGER) AS position,
+        SUM(CASE WHEN category = 'income' THEN amount ELSE -amount END)
+        AS signed
+    FROM daily GROUP BY day
+)
+WHERE (position >> level) & 1 = 0
+GROUP BY node;
+"""
+
+
+INSERT_OPERATION = (
+    "INSERT INTO operations (id, date, category, amount, description) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET date = excluded.date, "
+    "category = excluded.category, amount = excluded.amount, "
+    "description = excluded.description"
+)
+
+
+class SqliteBatch:
+    """
+    Mutations executed in the transaction opened by `DBSqliteDAO.batch()`.
+
+    Args:
+        connection (sqlite3.Connection): The connection in a transaction.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    @staticmethod
+    def _row(data: OperationDTO) -> tuple[str, str, str, float, str]:
+        return (
+            data.id if data.id else str(uuid4()),
+            (data.date or datetime.now()).isoformat(timespec="microseconds"),
+            data.category,
+            data.amount,
+            data.description,
+        )
+
+    def create(self, data: OperationDTO) -> UUID:
+        """
+        Create a new operation.
+
+        The operation keeps its date if it has one and is dated now
+        otherwise.
+
+        Args:
+            data (OperationDTO): The operation data.
+
+        Returns:
+            UUID: The ID of the operation.
+        """
+        row = self._row(data)
+        self._connection.execute(INSERT_OPERATION, row)
+        return row[0]
+
+    def create_many(self, operations: Iterable[OperationDTO]) -> int:
+        """
+        Create several operations with a single statement.
+
+        Args:
+            operations (Iterable[OperationDTO]): The operations data.
+
+        Returns:
+            int: The number of created operations.
+        """
+        cursor = self._connection.executemany(
+            INSERT_OPERATION, (self._row(data) for data in operations)
+        )
+        return max(cursor.rowcount, 0)
+
+    def update(self, operation_id: UUID, data: OperationDTO) -> None:
+        """
+        Update an operation; empty fields of `data` are left unchanged.
+
+        Args:
+            operation_id (UUID): The ID of the operation to update.
+            data (OperationDTO): The updated operation data.
+
+        Raises:
+            RecordDoesNotExistError: If the operation does not exist.
+        """
+        cursor = self._connection.execute(
+            "UPDATE operations SET category = COALESCE(?, category), "
+            "amount = COALESCE(?, amount), "
+            "description = COALESCE(?, description) WHERE id = ?",
+            (
+                data.category if data.category else None,
+                data.amount if data.amount else None,
+                data.description if data.description else None,
+                operation_id,
+            ),
+        )
+        if not cursor.rowcount:
+            raise RecordDoesNotExistError("Record does not exist.")
+
+    def delete(self, operation_id: UUID) -> None:
+        """
+        Delete an operation.
+
+        Args:
+            operation_id (UUID): The ID of the operation to delete.
+
+        Raises:
+            RecordDoesNotExistError: If the operation does not exist.
+        """
+        cursor = self._connection.execute(
+            "DELETE FROM operations WHERE id = ?", (operation_id,)
+        )
+        if not cursor.rowcount:
+            raise RecordDoesNotExistError("Record does not exist.")
+
+
+class DBSqliteDAO(FileDB):
+    """
+    SQLite database with the same contract as DBJsonDAO.
+
+    Operations are kept in insertion order (rowid) and indexed by category,
+    amount and date, each followed by (date, id), so filtered reads and
+    sorted pages are answered by indexed queries.
+    Dates are stored as ISO 8601 strings, which sort chronologically, and
+    returned as timestamps like the JSON databases return them (see
+    `data_access.dates`).
+    Amount and count totals per category are maintained by triggers.
+
+    The connection is not bound to the thread that opened it, so the DAO
+    can be shared by threads that serialize their calls (as `LedgerServer`
+    does with its lock); it must not be used by two threads at once.
+    """
+
+    def __init__(self, data_name: str, data_type: str) -> None:
+        super().__init__(data_name=data_name, data_type=data_type)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Open the database on first use and create the schema if needed.
+
+        Returns:
+            sqlite3.Connection: The connection to the database.
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self._database, check_same_thread=False
+            )
+            self._connection.executescript(SCHEMA)
+            if self._connection.execute(
+                "SELECT NOT EXISTS (SELECT 1 FROM tree_levels) "
+                "OR EXISTS (SELECT 1 FROM operations) "
+                "AND (NOT EXISTS (SELECT 1 FROM totals) "
+                "OR NOT EXISTS (SELECT 1 FROM daily) "
+                "OR NOT EXISTS (SELECT 1 FROM balance_tree))"
+            ).fetchone()[0]:
+                # New database, or one created before the totals were
+                # maintained.
+                self.rebuild()
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def totals(self) -> dict[str, dict[str, float | int]]:
+        """
+        Return the maintained amount and count totals per category.
+
+        Returns:
+            dict[str, dict[str, float | int]]: {"amount": ..., "count": ...}
+                keyed by category.
+        """
+        return {
+            category: {"amount": amount, "count": count}
+            for category, amount, count in self.connection.execute(
+                "SELECT category, amount, count FROM totals WHERE count > 0"
+            )
+        }
+
+    def balance(self, as_of: Optional[datetime | date] = None) -> float:
+        """
+        Return the income minus the expenses up to the end of a day.
+
+        The current balance is summed from the maintained totals. A past
+        balance is a prefix sum of the Fenwick tree over the days, kept by
+        triggers, so it reads one node per level (at most 24) whatever
+        the number of days or operations.
+
+        Args:
+            as_of (Optional[datetime | date]): The last day (inclusive),
+                None for all the operations.
+
+        Returns:
+            float: The balance.
+        """
+        if as_of is not None:
+            return self.connection.execute(
+                "SELECT COALESCE(SUM(amount), 0.0) FROM balance_tree "
+                "WHERE node IN (SELECT (position >> level) << level "
+                "FROM tree_levels, (SELECT CAST(julianday(?) AS INTEGER) + 1 "
+                "AS position) WHERE (position >> level) & 1 = 1)",
+                [f"{as_of:%Y-%m-%d}"],
+            ).fetchone()[0]
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(CASE WHEN category = 'income' "
+            "THEN amount ELSE -amount END), 0.0) FROM totals"
+        ).fetchone()[0]
+
+    def daily_totals(
+        self,
+        start: Optional[datetime | date] = None,
+        end: Optional[datetime | date] = None,
+    ) -> dict[date, dict[str, dict[str, float | int]]]:
+        """
+        Return the maintained amount and count totals per day and category.
+
+        Args:
+            start (Optional[datetime | date]): The first day, None if open.
+            end (Optional[datetime | date]): The last day (inclusive), None
+                if open.
+
+        Returns:
+            dict[date, dict[str, dict[str, float | int]]]: {"amount": ...,
+                "count": ...} keyed by category, keyed by the days with
+                operations in date order.
+        """
+        conditions = ["count > 0"]
+        parameters: list[str] = []
+        if start is not None:
+            conditions.append("day >= ?")
+            parameters.append(f"{start:%Y-%m-%d}")
+        if end is not None:
+            conditions.append("day <= ?")
+            parameters.append(f"{end:%Y-%m-%d}")
+
+        daily: dict[date, dict[str, dict[str, float | int]]] = {}
+        for day, category, amount, count in self.connection.execute(
+            "SELECT day, category, amount, count FROM daily "
+            f"WHERE {' AND '.join(conditions)} ORDER BY day, category",
+            parameters,
+        ):
+            daily.setdefault(date.fromisoformat(day), {})[category] = {
+                "amount": amount,
+                "count": count,
+            }
+        return daily
+
+    def rebuild(self) -> None:
+        """
+        Recompute the maintained totals and daily rollup from the operations.
+        """
+        self.connection.executescript("BEGIN;" + REBUILD_TOTALS + "COMMIT;")
+
+    def migrate(self) -> None:
+        """
+        Do nothing: SQLite databases keep their ISO 8601 date strings.
+
+        The strings sort chronologically in the indexes and are converted
+        to timestamps as rows are read.
+        """
+
+    def read(
+        self,
+        operation_id: Optional[UUID] = None,
+        filter: Optional[tuple | list[tuple]] = None,
+    ) -> dict[UUID, dict[str, str | float]] | OperationDTO | None:
+        """
+        Read data from the SQLite database.
+
+        Args:
+            operation_id (Optional[UUID]): The ID of the operation to read.
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Returns:
+            Union[dict[UUID, dict[str, str | float]], OperationDTO, None]: The read data.
+        """
+        query = (
+            "SELECT id, date, category, amount, description FROM operations"
+        )
+
+        if filter:
+            conditions, parameters = self._where(filter)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+
+            return self._to_dict(
+                self.connection.execute(query + " ORDER BY rowid", parameters)
+            )
+
+        elif not operation_id:
+            return self._to_dict(
+                self.connection.execute(query + " ORDER BY rowid")
+            )
+
+        elif row := self.connection.execute(
+            query + " WHERE id = ?", (operation_id,)
+        ).fetchone():
+            return OperationDTO(
+                category=row[2],
+                amount=row[3],
+                description=row[4],
+                date=datetime.fromisoformat(row[1]),
+                id=operation_id,
+            )
+        else:
+            raise RecordDoesNotExistError("Record does not exist.")
+
+    def _where(
+        self, filter: Optional[tuple | list[tuple]]
+    ) -> tuple[list[str], list[str | float]]:
+        """
+        Translate a filter into SQL conditions.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Returns:
+            tuple[list[str], list[str | float]]: The conditions to join with
+                AND and their parameters.
+        """
+        conditions: list[str] = []
+        parameters: list[str | float] = []
+
+        for predicate in split_filter(filter) if filter else ():
+            key = predicate[0]
+            if key not in ("category", "amount", "date"):
+                raise KeyError(key)
+
+            if len(predicate) == 2:
+                low = high = predicate[1]
+            else:
+                low, high = predicate[1], predicate[2]
+
+            if key == "date":
+                if low is not None:
+                    conditions.append("date >= ?")
+                    parameters.append(self._day(low).isoformat())
+                if high is not None:
+                    conditions.append("date < ?")
+                    parameters.append(
+                        (self._day(high) + timedelta(days=1)).isoformat()
+                    )
+            elif len(predicate) == 2:
+                conditions.append(f"{key} = ?")
+                parameters.append(low)
+            else:
+                if low is not None:
+                    conditions.append(f"{key} >= ?")
+                    parameters.append(low)
+                if high is not None:
+                    conditions.append(f"{key} <= ?")
+                    parameters.append(high)
+
+        return conditions, parameters
+
+    def iter_operations(
+        self, filter: Optional[tuple | list[tuple]] = None
+    ) -> Iterator[tuple[UUID, dict[str, str | float]]]:
+        """
+        Iterate over the operations, optionally filtered, in insertion order.
+
+        Rows are fetched from the cursor as they are consumed.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Yields:
+            tuple[UUID, dict[str, str | float]]: (ID, record) pairs.
+        """
+        conditions, parameters = self._where(filter)
+        query = (
+            "SELECT id, date, category, amount, description FROM operations"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        for operation_id, date, category, amount, description in (
+            self.connection.execute(query + " ORDER BY rowid", parameters)
+        ):
+            yield operation_id, {
+                "date": to_timestamp(date),
+                "category": category,
+                "amount": amount,
+                "description": description,
+            }
+
+    def iter_records(
+        self, filter: Optional[tuple | list[tuple]] = None
+    ) -> Iterator[OperationRecord]:
+        """
+        Iterate over the operations, optionally filtered, as typed records.
+
+        The records are built from the rows directly, without an
+        intermediate dictionary per operation.
+
+        Args:
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+
+        Yields:
+            OperationRecord: The operations in insertion order.
+        """
+        conditions, parameters = self._where(filter)
+        query = (
+            "SELECT id, date, category, amount, description FROM operations"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        for operation_id, date, category, amount, description in (
+            self.connection.execute(query + " ORDER BY rowid", parameters)
+        ):
+            yield OperationRecord(
+                UUID(operation_id),
+                datetime.fromisoformat(date),
+                category,
+                amount,
+                description,
+            )
+
+    def page(
+        self,
+        per_page: int,
+        offset: int = 0,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        filter: Optional[tuple | list[tuple]] = None,
+        order_by: str = "date",
+        descending: bool = False,
+    ) -> tuple[dict[UUID, dict[str, str | float]], int]:
+        """
+        Read one page of operations in a sort order.
+
+        Cursor pages are indexed range scans on (field, date, id).
+
+        Args:
+            per_page (int): The maximum number of operations to return.
+            offset (int): The number of operations to skip when no cursor
+                is given. Defaults to 0.
+            after (Optional[UUID]): Return the operations following the one
+                with this ID.
+            before (Optional[UUID]): Return the operations preceding the one
+                with this ID.
+            filter (Optional[tuple | list[tuple]]): A filter for the data,
+                see `split_filter()`.
+            order_by (str): The field to sort by: "date", "amount" or
+                "category"; ties are ordered by date and ID. Defaults to
+                "date".
+            descending (bool): Sort from the largest value to the smallest.
+                Defaults to False.
+
+        Returns:
+            tuple[dict[UUID, dict[str, str | float]], int]: The operations of
+                the page and the total number of matching operations.
+
+        Raises:
+            KeyError: If the field is not sortable.
+            RecordDoesNotExistError: If the cursor operation does not exist.
+        """
+        if order_by not in ("date", "amount", "category"):
+            raise KeyError(order_by)
+        columns = ("date", "id") if order_by == "date" else (
+            order_by, "date", "id"
+        )
+
+        conditions, parameters = self._where(filter)
+
+        if conditions:
+            total = self.connection.execute(
+                "SELECT COUNT(*) FROM operations WHERE "
+                + " AND ".join(conditions),
+                parameters,
+            ).fetchone()[0]
+        else:
+            total = sum(total["count"] for total in self.totals().values())
+
+        # A page before the cursor is read in the opposite direction and
+        # reversed.
+        reverse = before is not None
+        ascending = descending == reverse
+
+        cursor = after if after is not None else before
+        if cursor is not None:
+            row = self.connection.execute(
+                f"SELECT {', '.join(columns)} FROM operations WHERE id = ?",
+                (cursor,),
+            ).fetchone()
+            if not row:
+                raise RecordDoesNotExistError("Record does not exist.")
+            conditions.append(
+                f"({', '.join(columns)}) {'>' if ascending else '<'} "
+                f"({', '.join('?' * len(columns))})"
+            )
+            parameters += list(row)
+
+        query = (
+            "SELECT id, date, category, amount, description FROM operations"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        direction = "" if ascending else " DESC"
+        query += " ORDER BY " + ", ".join(
+            column + direction for column in columns
+        )
+
+        rows = self.connection.execute(
+            query + " LIMIT ? OFFSET ?",
+            parameters + [per_page, offset if cursor is None else 0],
+        ).fetchall()
+        if reverse:
+            rows.reverse()
+
+        return self._to_dict(rows), total
+
+    @staticmethod
+    def _day(value: datetime) -> datetime:
+        return datetime(value.year, value.month, value.day)
+
+    @staticmethod
+    def _to_dict(
+        cursor: Iterable[tuple],
+    ) -> dict[UUID, dict[str, str | float]]:
+        return {
+            operation_id: {
+                "date": to_timestamp(date),
+                "category": category,
+                "amount": amount,
+                "description": description,
+            }
+            for operation_id, date, category, amount, description in cursor
+        }
+
+    @contextmanager
+    def batch(self) -> Iterator[SqliteBatch]:
+        """
+        Collect creates, updates and deletes and commit them together.
+
+        The mutations run in one transaction, which is rolled back if the
+        block raises.
+
+        Yields:
+            SqliteBatch: The batch to record the mutations in.
+        """
+        with self.connection:
+            yield SqliteBatch(self.connection)
+
+    def create(self, data: OperationDTO) -> UUID:
+        """
+        Create a new operation in the SQLite database.
+
+        Args:
+            data (OperationDTO): The operation data.
+
+        Returns:
+            UUID: The ID of the operation.
+        """
+        with self.batch() as batch:
+            return batch.create(data=data)
+
+    def create_many(self, operations: Iterable[OperationDTO]) -> int:
+        """
+        Create several operations in the SQLite database in one transaction.
+
+        Args:
+            operations (Iterable[OperationDTO]): The operations data.
+
+        Returns:
+            int: The number of created operations.
+        """
+        with self.batch() as batch:
+            return batch.create_many(operations=operations)
+
+    def update(self, operation_id: UUID, data: OperationDTO) -> None:
+        """
+        Update an operation in the SQLite database.
+
+        Args:
+            operation_id (UUID): The ID of the operation to update.
+            data (OperationDTO): The updated operation data.
+        """
+        with self.batch() as batch:
+            batch.update(operation_id=operation_id, data=data)
+
+    def delete(self, operation_id: UUID) -> None:
+        """
+        Delete an operation from the SQLite database.
+
+        Args:
+            operation_id (UUID): The ID of the operation to delete.
+        """
+        with self.batch() as batch:
+            batch.delete(operation_id=operation_id)
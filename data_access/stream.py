@@ -0,0 +1,97 @@
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Iterator, TextIO
+
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = JSONDecoder()
+
+
+def iter_json_object(
+    file: TextIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """
+    Iterate over the members of a top-level JSON object without loading it.
+
+    The file is read in chunks and only the member being decoded is kept in
+    memory, so memory use is bounded by the largest member rather than by
+    the size of the file.
+
+    Args:
+        file (TextIO): A file containing a JSON object.
+        chunk_size (int): The number of characters read at a time.
+
+    Yields:
+        tuple[str, Any]: The (key, value) pairs of the object in file order.
+
+    Raises:
+        ValueError: If the file does not contain a JSON object.
+    """
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk = file.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def skip_whitespace() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\n\r":
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                raise ValueError("Unexpected end of JSON data.")
+
+    def decode() -> Any:
+        nonlocal position
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, position)
+            except JSONDecodeError:
+                if fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next
+            # chunk, so only accept a value followed by another character.
+            if end < len(buffer) or not fill():
+                position = end
+                return value
+            # The buffer has been refilled and shifted, decode it again.
+
+    if skip_whitespace() != "{":
+        raise ValueError("Expected a JSON object.")
+    position += 1
+
+    if skip_whitespace() == "}":
+        return
+
+    while True:
+        if skip_whitespace() != '"':
+            raise ValueError("Expected an object key.")
+        key = decode()
+
+        if skip_whitespace() != ":":
+            raise ValueError("Expected ':' after an object key.")
+        position += 1
+
+        skip_whitespace()
+        value = decode()
+        yield key, value
+
+        separator = skip_whitespace()
+        position += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError("Expected ',' or '}' in an object.")
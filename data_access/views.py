@@ -0,0 +1,651 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right, insort
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+from data_access.dates import day_number
+from data_access.fenwick import FenwickTree
+from data_access.files import atomic_write
+
+
+class LedgerView:
+    """
+    Structure derived from the operations and maintained on every mutation.
+
+    A view is persisted next to the database together with the state of the
+    database file it reflects, so it can be reused without scanning the
+    operations as long as that file has not changed. A persisted view of
+    another `version` of the layout is rebuilt.
+
+    Views that grow with the number of operations set `saved_on_write` to
+    False: a write keeps them up to date in memory only, and their stale
+    copy on disk is rebuilt when another DAO first needs it.
+    """
+
+    name: str = ""
+    version: int = 1
+    saved_on_write: bool = True
+
+    def add(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        """
+        Account for a new operation.
+
+        Args:
+            operation_id (UUID): The ID of the operation.
+            operation (dict[str, Any]): The operation record.
+        """
+        raise NotImplementedError
+
+    def remove(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        """
+        Account for a removed operation.
+
+        Args:
+            operation_id (UUID): The ID of the operation.
+            operation (dict[str, Any]): The operation record.
+        """
+        raise NotImplementedError
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize the view to a JSON-compatible dictionary.
+
+        Returns:
+            dict[str, Any]: The serialized view.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LedgerView:
+        """
+        Restore a view serialized by `to_dict()`.
+
+        Args:
+            data (dict[str, Any]): The serialized view.
+
+        Returns:
+            LedgerView: The restored view.
+        """
+        raise NotImplementedError
+
+    def apply(
+        self,
+        changes: Iterable[
+            tuple[UUID, Optional[dict[str, Any]], Optional[dict[str, Any]]]
+        ],
+    ) -> None:
+        """
+        Apply changes to the view.
+
+        Args:
+            changes (Iterable[tuple[UUID, Optional[dict], Optional[dict]]]):
+                The changed operations as (ID, old record, new record)
+                triples, where None marks a missing record.
+        """
+        for operation_id, before, after in changes:
+            if before is not None:
+                self.remove(operation_id, before)
+            if after is not None:
+                self.add(operation_id, after)
+
+    @classmethod
+    def build(cls, json_data: dict[UUID, dict[str, Any]]) -> LedgerView:
+        """
+        Build the view from scratch.
+
+        Args:
+            json_data (dict[UUID, dict[str, Any]]): Operations keyed by ID.
+
+        Returns:
+            LedgerView: The built view.
+        """
+        view = cls()
+        for operation_id, operation in json_data.items():
+            view.add(operation_id, operation)
+        return view
+
+    @classmethod
+    def open(cls, path: str, state: Any) -> Optional[LedgerView]:
+        """
+        Load a persisted view if it reflects the given database state.
+
+        Args:
+            path (str): Path to the persisted view.
+            state (Any): The current state of the database file.
+
+        Returns:
+            Optional[LedgerView]: The view, or None if it is missing,
+                unreadable or stale.
+        """
+        try:
+            with open(path, "r") as file:
+                data = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if data.get("state") != json.loads(json.dumps(state)) or (
+            data.get("version", 1) != cls.version
+        ):
+            return None
+        try:
+            return cls.from_dict(data["view"])
+        except KeyError:
+            # Persisted by a version of the view with a different layout.
+            return None
+
+    def save(self, path: str, state: Any) -> None:
+        """
+        Persist the view together with the database state it reflects.
+
+        Args:
+            path (str): Path to the persisted view.
+            state (Any): The state of the database file.
+        """
+        with atomic_write(path) as file:
+            file.write(
+                json.dumps(
+                    {
+                        "state": state,
+                        "version": self.version,
+                        "view": self.to_dict(),
+                    }
+                ).encode()
+            )
+
+
+class BalanceView(LedgerView):
+    """
+    Running totals of the operation amounts and counts per category.
+    """
+
+    name = "balance"
+
+    def __init__(
+        self, totals: Optional[dict[str, dict[str, float | int]]] = None
+    ) -> None:
+        self.totals: dict[str, dict[str, float | int]] = totals or {}
+
+    def add(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        total = self.totals.setdefault(
+            operation["category"], {"amount": 0.0, "count": 0}
+        )
+        total["amount"] += operation["amount"]
+        total["count"] += 1
+
+    def remove(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        total = self.totals[operation["category"]]
+        total["amount"] -= operation["amount"]
+        total["count"] -= 1
+        if not total["count"]:
+            del self.totals[operation["category"]]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"totals": self.totals}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BalanceView:
+        return cls(totals=data["totals"])
+
+
+class IndexView(LedgerView):
+    """
+    Secondary indexes mapping category, amount and calendar day to IDs.
+
+    IDs within a value are kept in insertion order; a record keeps its
+    position as long as the indexed field does not change. The distinct
+    values of each field are kept sorted once a range has been looked up,
+    so ranges are resolved by binary search.
+    """
+
+    name = "index"
+    version = 2
+    saved_on_write = False
+    keys = ("category", "amount", "date")
+
+    def __init__(
+        self,
+        index: Optional[
+            dict[str, dict[str | float | int, dict[UUID, None]]]
+        ] = None,
+    ) -> None:
+        self.index: dict[str, dict[str | float | int, dict[UUID, None]]] = (
+            index or {key: {} for key in self.keys}
+        )
+        self._sorted: dict[str, list[str | float | int]] = {}
+
+    @staticmethod
+    def index_value(key: str, value: Any) -> str | float | int:
+        """
+        Normalize a field value to the index key it is stored under.
+
+        Amounts are compared as floats and dates by calendar day (days
+        since 1970-01-01, see `day_number()`).
+
+        Args:
+            key (str): The indexed field.
+            value (Any): The field value of a record or a filter.
+
+        Returns:
+            str | float | int: The index key.
+        """
+        if key == "amount":
+            return float(value)
+        if key == "date":
+            return day_number(value)
+        return value
+
+    def lookup(self, key: str, value: Any) -> list[UUID]:
+        """
+        Return the IDs of the operations whose field matches the value.
+
+        Args:
+            key (str): The indexed field.
+            value (Any): The value to look up.
+
+        Returns:
+            list[UUID]: The matching IDs.
+        """
+        return list(self.index[key].get(self.index_value(key, value), ()))
+
+    def lookup_range(
+        self, key: str, low: Optional[Any], high: Optional[Any]
+    ) -> list[UUID]:
+        """
+        Return the IDs of the operations whose field lies within a range.
+
+        Args:
+            key (str): The indexed field.
+            low (Optional[Any]): The inclusive lower bound, None if open.
+            high (Optional[Any]): The inclusive upper bound, None if open.
+
+        Returns:
+            list[UUID]: The matching IDs ordered by field value.
+        """
+        values = self.sorted_values(key)
+        start = (
+            bisect_left(values, self.index_value(key, low))
+            if low is not None
+            else 0
+        )
+        end = (
+            bisect_right(values, self.index_value(key, high))
+            if high is not None
+            else len(values)
+        )
+        return [
+            operation_id
+            for value in values[start:end]
+            for operation_id in self.index[key][value]
+        ]
+
+    def sorted_values(self, key: str) -> list[str | float | int]:
+        """
+        Return the distinct values of a field in ascending order.
+
+        Args:
+            key (str): The indexed field.
+
+        Returns:
+            list[str | float | int]: The sorted values.
+        """
+        if key not in self._sorted:
+            self._sorted[key] = sorted(self.index[key])
+        return self._sorted[key]
+
+    def add(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        for key in self.keys:
+            self._add(key, operation_id, operation)
+
+    def remove(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        for key in self.keys:
+            self._remove(key, operation_id, operation)
+
+    def _add(
+        self, key: str, operation_id: UUID, operation: dict[str, Any]
+    ) -> None:
+        value = self.index_value(key, operation[key])
+        if value not in self.index[key]:
+            self.index[key][value] = {}
+            if key in self._sorted:
+                insort(self._sorted[key], value)
+        self.index[key][value][operation_id] = None
+
+    def _remove(
+        self, key: str, operation_id: UUID, operation: dict[str, Any]
+    ) -> None:
+        value = self.index_value(key, operation[key])
+        ids = self.index[key][value]
+        del ids[operation_id]
+        if not ids:
+            del self.index[key][value]
+            if key in self._sorted:
+                values = self._sorted[key]
+                del values[bisect_left(values, value)]
+
+    def apply(
+        self,
+        changes: Iterable[
+            tuple[UUID, Optional[dict[str, Any]], Optional[dict[str, Any]]]
+        ],
+    ) -> None:
+        for operation_id, before, after in changes:
+            for key in self.keys:
+                if (
+                    before is not None
+                    and after is not None
+                    and self.index_value(key, before[key])
+                    == self.index_value(key, after[key])
+                ):
+                    continue
+                if before is not None:
+                    self._remove(key, operation_id, before)
+                if after is not None:
+                    self._add(key, operation_id, after)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            key: {str(value): list(ids) for value, ids in values.items()}
+            for key, values in self.index.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IndexView:
+        return cls(
+            index={
+                key: {
+                    (
+                        float(value)
+                        if key == "amount"
+                        else int(value) if key == "date" else value
+                    ): dict.fromkeys(ids)
+                    for value, ids in values.items()
+                }
+                for key, values in data.items()
+            }
+        )
+
+
+class OrderView(LedgerView):
+    """
+    Operations kept sorted by every field in `fields`.
+
+    Operations with equal values are ordered by date and then by ID. Used
+    for sorted keyset pagination: a page following or preceding a record is
+    found by binary search, in either direction, instead of sorting all
+    operations. The key of an operation is found by its ID through a map
+    built from the order on first use and maintained afterwards.
+    """
+
+    name = "order"
+    version = 2
+    saved_on_write = False
+    fields = ("date", "amount", "category")
+
+    def __init__(
+        self, order: Optional[dict[str, list[tuple[Any, ...]]]] = None
+    ) -> None:
+        self.order: dict[str, list[tuple[Any, ...]]] = order or {
+            field: [] for field in self.fields
+        }
+        self._keys: dict[str, dict[UUID, tuple[Any, ...]]] = {}
+
+    @staticmethod
+    def sort_value(field: str, value: Any) -> Any:
+        """
+        Normalize a field value to the value it is sorted by.
+
+        Args:
+            field (str): The sorted field.
+            value (Any): The field value of a record.
+
+        Returns:
+            Any: The sort value.
+        """
+        if field == "amount":
+            return float(value)
+        return value
+
+    @classmethod
+    def sort_key(
+        cls, field: str, operation_id: UUID, operation: dict[str, Any]
+    ) -> tuple[Any, ...]:
+        """
+        Return the position key of an operation in a sort order.
+
+        Args:
+            field (str): The sorted field.
+            operation_id (UUID): The ID of the operation.
+            operation (dict[str, Any]): The operation record.
+
+        Returns:
+            tuple[Any, ...]: The (date, ID) key for the date order and the
+                (sort value, date, ID) key otherwise.
+        """
+        if field == "date":
+            return operation["date"], operation_id
+        return (
+            cls.sort_value(field, operation[field]),
+            operation["date"],
+            operation_id,
+        )
+
+    def key(
+        self, field: str, operation_id: UUID
+    ) -> Optional[tuple[Any, ...]]:
+        """
+        Return the position key of an operation in a sort order by its ID.
+
+        Args:
+            field (str): The sorted field.
+            operation_id (UUID): The ID of the operation.
+
+        Returns:
+            Optional[tuple[Any, ...]]: The key, see `sort_key()`, or None
+                if the operation does not exist.
+        """
+        if field not in self._keys:
+            self._keys[field] = {key[-1]: key for key in self.order[field]}
+        return self._keys[field].get(operation_id)
+
+    def add(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        for field in self.fields:
+            key = self.sort_key(field, operation_id, operation)
+            insort(self.order[field], key)
+            if field in self._keys:
+                self._keys[field][operation_id] = key
+
+    def remove(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        for field in self.fields:
+            keys = self.order[field]
+            del keys[
+                bisect_left(
+                    keys, self.sort_key(field, operation_id, operation)
+                )
+            ]
+            if field in self._keys:
+                del self._keys[field][operation_id]
+
+    def apply(
+        self,
+        changes: Iterable[
+            tuple[UUID, Optional[dict[str, Any]], Optional[dict[str, Any]]]
+        ],
+    ) -> None:
+        for operation_id, before, after in changes:
+            for field in self.fields:
+                old_key = before and self.sort_key(field, operation_id, before)
+                new_key = after and self.sort_key(field, operation_id, after)
+                if old_key == new_key:
+                    continue
+                keys = self.order[field]
+                ids = self._keys.get(field)
+                if old_key:
+                    del keys[bisect_left(keys, old_key)]
+                    if ids is not None:
+                        del ids[operation_id]
+                if new_key:
+                    insort(keys, new_key)
+                    if ids is not None:
+                        ids[operation_id] = new_key
+
+    @classmethod
+    def build(cls, json_data: dict[UUID, dict[str, Any]]) -> OrderView:
+        view = cls()
+        for field in cls.fields:
+            view.order[field] = sorted(
+                view.sort_key(field, operation_id, operation)
+                for operation_id, operation in json_data.items()
+            )
+        return view
+
+    def to_dict(self) -> dict[str, Any]:
+        return {field: keys for field, keys in self.order.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OrderView:
+        return cls(
+            order={
+                field: [tuple(key) for key in data[field]]
+                for field in cls.fields
+            }
+        )
+
+
+class DailyView(LedgerView):
+    """
+    Amount and count totals per calendar day and category.
+
+    Days are day numbers (days since 1970-01-01, see `day_number()`) kept
+    in sorted order, so the totals of a date range, and any coarser period,
+    are summed over days instead of operations.
+
+    The balance at the end of a day is a prefix sum of the daily balances,
+    answered by a Fenwick tree over the days from the first one. The tree
+    is built on the first balance query (or when the view is persisted)
+    and then updated by every mutation in O(log n); it leaves room for a
+    year or more of later days, and is rebuilt when a day outside its
+    range is added. The tree is persisted with the view, so a reloaded
+    view answers a past balance without an O(days) rebuild.
+    """
+
+    name = "daily"
+
+    def __init__(
+        self, days: Optional[dict[int, dict[str, list[float | int]]]] = None
+    ) -> None:
+        self.days: dict[int, dict[str, list[float | int]]] = days or {}
+        self.order: list[int] = sorted(self.days)
+        self._first_day = 0
+        self._net: Optional[FenwickTree] = None
+
+    @staticmethod
+    def _signed(category: str, amount: float) -> float:
+        return amount if category == "income" else -amount
+
+    def _update_net(self, day: int, amount: float) -> None:
+        if self._net is None:
+            return
+        if self._first_day <= day < self._first_day + len(self._net):
+            self._net.add(day - self._first_day, amount)
+        else:
+            self._net = None
+
+    def add(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        day = day_number(operation["date"])
+        if day not in self.days:
+            self.days[day] = {}
+            insort(self.order, day)
+        total = self.days[day].setdefault(operation["category"], [0.0, 0])
+        total[0] += operation["amount"]
+        total[1] += 1
+        self._update_net(
+            day, self._signed(operation["category"], operation["amount"])
+        )
+
+    def remove(self, operation_id: UUID, operation: dict[str, Any]) -> None:
+        day = day_number(operation["date"])
+        self._update_net(
+            day, -self._signed(operation["category"], operation["amount"])
+        )
+        totals = self.days[day]
+        total = totals[operation["category"]]
+        total[0] -= operation["amount"]
+        total[1] -= 1
+        if not total[1]:
+            del totals[operation["category"]]
+            if not totals:
+                del self.days[day]
+                del self.order[bisect_left(self.order, day)]
+
+    def between(
+        self, low: Optional[int] = None, high: Optional[int] = None
+    ) -> list[int]:
+        """
+        Return the days with operations within a range.
+
+        Args:
+            low (Optional[int]): The first day number, None if open.
+            high (Optional[int]): The last day number (inclusive), None if
+                open.
+
+        Returns:
+            list[int]: The day numbers in ascending order.
+        """
+        start = 0 if low is None else bisect_left(self.order, low)
+        end = len(self.order) if high is None else bisect_right(
+            self.order, high
+        )
+        return self.order[start:end]
+
+    def balance(self, day: Optional[int] = None) -> float:
+        """
+        Return the income minus the expenses up to the end of a day.
+
+        Args:
+            day (Optional[int]): The last day number (inclusive), None for
+                all the days.
+
+        Returns:
+            float: The balance.
+        """
+        if not self.order:
+            return 0.0
+        if self._net is None:
+            self._build_net()
+        if day is None:
+            day = self.order[-1]
+        return self._net.prefix_sum(day - self._first_day)
+
+    def _build_net(self) -> None:
+        self._first_day = self.order[0]
+        span = self.order[-1] - self._first_day + 1
+        net = [0.0] * (span + max(span, 366))
+        for day in self.order:
+            net[day - self._first_day] = sum(
+                self._signed(category, amount)
+                for category, (amount, _) in self.days[day].items()
+            )
+        self._net = FenwickTree(net)
+
+    def to_dict(self) -> dict[str, Any]:
+        if self._net is None and self.order:
+            self._build_net()
+        data: dict[str, Any] = {"days": self.days}
+        if self._net is not None:
+            data["first_day"] = self._first_day
+            data["net"] = self._net.tree
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DailyView:
+        view = cls(
+            days={int(day): totals for day, totals in data["days"].items()}
+        )
+        if "net" in data:
+            view._first_day = data["first_day"]
+            view._net = FenwickTree.from_tree(data["net"])
+        return view
@@ -0,0 +1,7 @@
+import sys
+
+from presentation import cli_func
+
+
+if __name__ == "__main__":
+    sys.exit(cli_func())
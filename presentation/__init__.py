@@ -1,4 +1,5 @@
 from .paginate import paginate_operation
 from .ui import ui_func
+from .cli import cli_func
 
-__all__ = ["paginate_operation", "ui_func"]
+__all__ = ["paginate_operation", "ui_func", "cli_func"]
@@ -0,0 +1,301 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import datetime
+from os.path import splitext
+from typing import Optional
+
+from business_logic.services import (
+    convert_storage,
+    export_operations,
+    get_balance,
+    get_parallel_balance,
+    import_operations,
+    migrate_storage,
+    partition_storage,
+    rebuild_balance,
+    verify_balance,
+)
+from presentation.exceptions import (
+    AmountError,
+    CategoryError,
+    DateError,
+    ImportFileError,
+)
+from presentation.exporter import EXPORT_FORMATS, write_operations
+from presentation.importer import read_operations
+from presentation.filters import build_filter
+from presentation.server import serve
+from presentation.validators import validate_date
+
+
+def balance_command(args: Namespace) -> int:
+    """
+    Show, verify or rebuild the maintained balance, or a past balance.
+
+    Args:
+        args (Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The exit status.
+    """
+    if args.verify:
+        if not verify_balance():
+            print("The maintained balance does not match the operations.")
+            return 1
+        print("The maintained balance matches the operations.")
+        return 0
+
+    if args.rebuild:
+        print(f"Balance rebuilt: {rebuild_balance()}")
+        return 0
+
+    if args.parallel:
+        try:
+            print(f"Balance: {get_parallel_balance()}")
+        except ValueError as err:
+            print(err)
+            return 1
+        return 0
+
+    if args.as_of:
+        try:
+            validate_date(date=args.as_of)
+        except DateError as err:
+            print(err)
+            return 1
+        as_of = datetime.strptime(args.as_of, "%d-%m-%Y")
+        print(f"Balance on {args.as_of}: {get_balance(as_of=as_of)}")
+        return 0
+
+    print(f"Balance: {get_balance()}")
+    return 0
+
+
+def convert_command(args: Namespace) -> int:
+    """
+    Rewrite the database in another on-disk format.
+
+    Args:
+        args (Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The exit status.
+    """
+    try:
+        convert_storage(data_format=args.format)
+    except ValueError as err:
+        print(err)
+        return 1
+    print(f'The database has been converted to the "{args.format}" format.')
+    return 0
+
+
+def migrate_command(args: Namespace) -> int:
+    """
+    Rewrite the database with the dates stored as timestamps.
+
+    Args:
+        args (Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The exit status.
+    """
+    migrate_storage()
+    print("The dates of the database are stored as timestamps.")
+    return 0
+
+
+def shard_command(args: Namespace) -> int:
+    """
+    Write the operations into the monthly partitions of DB_PARTITIONED.
+
+    Args:
+        args (Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The exit status.
+    """
+    try:
+        months = partition_storage()
+    except ValueError as err:
+        print(err)
+        return 1
+    print(
+        f"{sum(months.values())} operations written into {len(months)} "
+        "monthly partitions."
+    )
+    return 0
+
+
+def import_command(args: Namespace) -> int:
+    """
+    Import operations from a CSV or JSON Lines file.
+
+    Every row is validated before anything is written; the operations are
+    then stored with a single write, so an invalid file imports nothing.
+
+    Args:
+        args (Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The exit status.
+    """
+    try:
+        count = import_operations(operations=read_operations(args.path))
+    except (ImportFileError, OSError) as err:
+        print(f"Nothing was imported. {err}")
+        return 1
+
+    print(f"Imported {count} operations.")
+    return 0
+
+
+def export_command(args: Namespace) -> int:
+    """
+    Export operations, optionally filtered, to a CSV or JSON Lines file.
+
+    Args:
+        args (Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The exit status.
+    """
+    file_format = args.format or splitext(args.path)[1].lower().lstrip(".")
+    if file_format not in EXPORT_FORMATS:
+        print('Use a ".csv" or ".jsonl" file or pass --format.')
+        return 1
+
+    try:
+        operations = export_operations(
+            filter=build_filter(
+                category=args.category or "",
+                start_date=args.start,
+                end_date=args.end,
+                min_amount=args.min_amount,
+                max_amount=args.max_amount,
+            )
+        )
+    except (CategoryError, DateError, AmountError) as err:
+        print(err)
+        return 1
+
+    if args.path == "-":
+        write_operations(operations, sys.stdout, file_format)
+        return 0
+
+    with open(args.path, "w", encoding="utf-8", newline="") as file:
+        count = write_operations(operations, file, file_format)
+    print(f"Exported {count} operations.")
+    return 0
+
+
+def serve_command(args: Namespace) -> int:
+    """
+    Serve the JSON API over HTTP.
+
+    Args:
+        args (Namespace): Parsed command line arguments.
+
+    Returns:
+        int: The exit status.
+    """
+    print(f"Serving on http://{args.host}:{args.port}/")
+    serve(host=args.host, port=args.port)
+    return 0
+
+
+def cli_func(argv: Optional[list[str]] = None) -> int:
+    """
+    Command line interface for maintenance tasks.
+
+    Args:
+        argv (Optional[list[str]]): Command line arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = ArgumentParser(description="CashFlowTracker maintenance.")
+    subparsers = parser.add_subparsers(required=True)
+
+    balance_parser = subparsers.add_parser(
+        "balance", help="Show, verify or rebuild the maintained balance."
+    )
+    balance_options = balance_parser.add_mutually_exclusive_group()
+    balance_options.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare the maintained totals with a full scan.",
+    )
+    balance_options.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute the maintained totals from the operations.",
+    )
+    balance_options.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Sum the monthly partitions in parallel (see DB_PARTITIONED).",
+    )
+    balance_options.add_argument(
+        "--as-of",
+        metavar="DD-MM-YYYY",
+        help="Show the balance at the end of a past day.",
+    )
+    balance_parser.set_defaults(handler=balance_command)
+
+    convert_parser = subparsers.add_parser(
+        "convert", help="Rewrite the database in another on-disk format."
+    )
+    convert_parser.add_argument(
+        "format", choices=("indent", "compact", "binary")
+    )
+    convert_parser.set_defaults(handler=convert_command)
+
+    migrate_parser = subparsers.add_parser(
+        "migrate",
+        help="Rewrite the dates of an older database as timestamps.",
+    )
+    migrate_parser.set_defaults(handler=migrate_command)
+
+    shard_parser = subparsers.add_parser(
+        "shard",
+        help="Split the database into monthly partitions (DB_PARTITIONED).",
+    )
+    shard_parser.set_defaults(handler=shard_command)
+
+    import_parser = subparsers.add_parser(
+        "import", help="Import operations from a CSV or JSON Lines file."
+    )
+    import_parser.add_argument(
+        "path", help='Path to a ".csv" or ".jsonl" file.'
+    )
+    import_parser.set_defaults(handler=import_command)
+
+    export_parser = subparsers.add_parser(
+        "export", help="Export operations to a CSV or JSON Lines file."
+    )
+    export_parser.add_argument(
+        "path", help='Path to a ".csv" or ".jsonl" file, "-" for stdout.'
+    )
+    export_parser.add_argument("--format", choices=EXPORT_FORMATS)
+    export_parser.add_argument("--category", help='"income" or "expense".')
+    export_parser.add_argument(
+        "--from", dest="start", default="", help="Start date, DD-MM-YYYY."
+    )
+    export_parser.add_argument(
+        "--to", dest="end", default="", help="End date, DD-MM-YYYY."
+    )
+    export_parser.add_argument("--min-amount", default="")
+    export_parser.add_argument("--max-amount", default="")
+    export_parser.set_defaults(handler=export_command)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve the JSON API over HTTP."
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.set_defaults(handler=serve_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
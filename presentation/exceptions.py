@@ -16,3 +16,7 @@ class DescriptionError(Exception):
 
 class DateError(Exception):
     pass
+
+
+class ImportFileError(Exception):
+    pass
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import csv
+import json
+from typing import TYPE_CHECKING, Iterable, TextIO
+
+if TYPE_CHECKING:
+    from business_logic.dto import OperationRecord
+
+
+FIELDS = ("id", "date", "category", "amount", "description")
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+
+def write_operations(
+    operations: Iterable[OperationRecord],
+    file: TextIO,
+    file_format: str,
+) -> int:
+    """
+    Write operations to a CSV or JSON Lines file as they are produced.
+
+    Every operation is written as soon as it is read, so memory use does
+    not depend on the number of operations. Dates are written in ISO 8601.
+
+    Args:
+        operations (Iterable[OperationRecord]): The operations.
+        file (TextIO): The output file, opened with newline="" for CSV.
+        file_format (str): "csv" or "jsonl".
+
+    Returns:
+        int: The number of written operations.
+
+    Raises:
+        ValueError: If the format is unsupported.
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f'Unsupported export format "{file_format}".')
+
+    if file_format == "csv":
+        writer = csv.writer(file)
+        writer.writerow(FIELDS)
+
+    count = 0
+    for operation in operations:
+        record = {
+            "id": str(operation.id),
+            "date": operation.date.isoformat(timespec="microseconds"),
+            "category": operation.category,
+            "amount": operation.amount,
+            "description": operation.description,
+        }
+        if file_format == "csv":
+            writer.writerow([record[field] for field in FIELDS])
+        else:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+
+    return count
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from presentation.validators import (
+    validate_amount_range,
+    validate_category,
+    validate_date_range,
+)
+
+
+def build_filter(
+    category: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    min_amount: str = "",
+    max_amount: str = "",
+) -> list[tuple]:
+    """
+    Validate search criteria given as text and build an operation filter.
+
+    Empty criteria are skipped.
+
+    Args:
+        category (str): "income" or "expense".
+        start_date (str): The start date in the format DD-MM-YYYY.
+        end_date (str): The end date in the format DD-MM-YYYY.
+        min_amount (str): The minimum amount.
+        max_amount (str): The maximum amount.
+
+    Returns:
+        list[tuple]: The predicates, empty to match every operation.
+
+    Raises:
+        CategoryError, DateError, AmountError: If a criterion is invalid.
+    """
+    operation_filter: list[tuple] = []
+
+    if category:
+        validate_category(category=category)
+        operation_filter.append(("category", category))
+
+    validate_date_range(start_date=start_date, end_date=end_date)
+    if start_date or end_date:
+        operation_filter.append(
+            (
+                "date",
+                *(
+                    datetime.strptime(date, "%d-%m-%Y") if date else None
+                    for date in (start_date, end_date)
+                ),
+            )
+        )
+
+    validate_amount_range(min_amount=min_amount, max_amount=max_amount)
+    if min_amount or max_amount:
+        operation_filter.append(
+            (
+                "amount",
+                float(min_amount) if min_amount else None,
+                float(max_amount) if max_amount else None,
+            )
+        )
+
+    return operation_filter
@@ -0,0 +1,149 @@
+import csv
+import json
+from os.path import splitext
+from datetime import datetime
+from typing import Any, Iterator
+
+from business_logic.dto import OperationDTO
+from presentation.validators import (
+    validate_category,
+    validate_amount,
+    validate_description,
+    validate_date,
+)
+from presentation.exceptions import (
+    ImportFileError,
+    DateError,
+    DescriptionError,
+    AmountError,
+    CategoryError,
+)
+
+
+FIELDS = ("date", "category", "amount", "description")
+
+
+def row_to_operation(row: dict[str, Any]) -> OperationDTO:
+    """
+    Validate an imported row and convert it to an operation.
+
+    The date is optional; an operation without it is dated at the time of
+    the import. It is either DD-MM-YYYY or ISO 8601 (as written by the
+    exporter, with the time of day); an ISO date with a time zone is
+    converted to local time.
+
+    Args:
+        row (dict[str, Any]): The row with "category", "amount",
+            "description" and optionally "date" values.
+
+    Returns:
+        OperationDTO: The operation data.
+
+    Raises:
+        CategoryError, AmountError, DescriptionError, DateError: If a value
+            is invalid.
+    """
+    category = str(row.get("category") or "")
+    amount = str(row.get("amount") or "")
+    description = str(row.get("description") or "")
+    date = str(row.get("date") or "")
+
+    validate_category(category=category)
+    validate_amount(amount=amount)
+    validate_description(description=description)
+
+    return OperationDTO(
+        category=category,
+        amount=float(amount),
+        description=description,
+        date=parse_date(date=date) if date else None,
+    )
+
+
+def parse_date(date: str) -> datetime:
+    """
+    Parse an imported date in ISO 8601 or DD-MM-YYYY.
+
+    Args:
+        date (str): The date.
+
+    Returns:
+        datetime: The naive local datetime.
+
+    Raises:
+        DateError: If the date is in neither format.
+    """
+    try:
+        value = datetime.fromisoformat(date)
+    except ValueError:
+        try:
+            validate_date(date=date)
+        except DateError:
+            raise DateError(
+                "The date must be in the format DD-MM-YYYY or ISO 8601 "
+                "(YYYY-MM-DDTHH:MM:SS)."
+            )
+        return datetime.strptime(date, "%d-%m-%Y")
+
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def read_operations(path: str) -> Iterator[OperationDTO]:
+    """
+    Read and validate the operations of a CSV or JSON Lines file.
+
+    A CSV file has a header row naming the columns (see `FIELDS`); a JSON
+    Lines file holds one object per line. Blank lines are skipped. The file
+    is read lazily, row by row.
+
+    Args:
+        path (str): Path to a ".csv" or ".jsonl" file.
+
+    Yields:
+        OperationDTO: The operations in file order.
+
+    Raises:
+        ImportFileError: If the file type is unsupported or a row is
+            invalid; the message names the line.
+    """
+    extension = splitext(path)[1].lower()
+    if extension not in (".csv", ".jsonl"):
+        raise ImportFileError(
+            f'Unsupported file type "{extension}", expected .csv or .jsonl.'
+        )
+
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if extension == ".csv":
+            reader = csv.DictReader(file)
+            if not reader.fieldnames or not set(FIELDS[1:]) <= set(
+                reader.fieldnames
+            ):
+                raise ImportFileError(
+                    "The CSV header must name the columns "
+                    f"{', '.join(FIELDS)} (date is optional)."
+                )
+            rows = ((reader.line_num, row) for row in reader)
+        else:
+            rows = (
+                (line_number, line)
+                for line_number, line in enumerate(file, start=1)
+                if line.strip()
+            )
+
+        for line_number, row in rows:
+            try:
+                if extension == ".jsonl":
+                    row = json.loads(row)
+                    if not isinstance(row, dict):
+                        raise ValueError("Expected a JSON object.")
+                yield row_to_operation(row=row)
+            except (
+                ValueError,
+                DateError,
+                DescriptionError,
+                CategoryError,
+                AmountError,
+            ) as err:
+                raise ImportFileError(f"Line {line_number}: {err}") from err
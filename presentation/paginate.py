@@ -16,16 +16,23 @@ from presentation.validators import (
 )
 
 
-def paginate_operation(filter: tuple[str, str | float] = None) -> None:
+def paginate_operation(
+    filter: tuple | list[tuple] = None,
+    order_by: str = "date",
+    descending: bool = False,
+) -> None:
     """
     Paginate and interact with operations based on provided filter.
 
     Args:
-        filter (tuple[str, str | float], optional): A filter tuple (key, value) to filter operations. Defaults to None.
+        filter (tuple | list[tuple], optional): A filter tuple (key, value) or (key, low, high), or a list of them, to filter operations. Defaults to None.
+        order_by (str, optional): The field to sort the operations by ("date", "amount" or "category"). Defaults to "date".
+        descending (bool, optional): Sort from the largest value to the smallest. Defaults to False.
     """
     page_number: int = 1
+    sort_order = {"order_by": order_by, "descending": descending}
     operation_text, ids, buttons = get_all_operation_paginate(
-        page_number=page_number, filter=filter
+        page_number=page_number, filter=filter, **sort_order
     )
     operation_choice: str = input(operation_text)
     validate_user_choice(
@@ -34,11 +41,13 @@ def paginate_operation(filter: tuple[str, str | float] = None) -> None:
     while operation_choice in ("prev", "next"):
         if operation_choice == "prev":
             page_number -= 1
+            cursor = {"before": ids[0]}
         else:
             page_number += 1
+            cursor = {"after": ids[-1]}
 
         operation_text, ids, buttons = get_all_operation_paginate(
-            page_number=page_number, filter=filter
+            page_number=page_number, filter=filter, **sort_order, **cursor
         )
         operation_choice = input(operation_text)
         validate_user_choice(
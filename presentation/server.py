@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+if TYPE_CHECKING:
+    from data_access.dao import DBJsonDAO
+
+from business_logic.dto import OperationDTO, OperationRecord
+from business_logic.exceptions import OperationDoesNotExistError
+from business_logic.services import (
+    create_operation,
+    delete_operation,
+    find_operation,
+    get_balance,
+    list_operations,
+    update_operation,
+)
+from business_logic.services.operation import dao as operation_dao
+from presentation.exceptions import (
+    AmountError,
+    CategoryError,
+    DateError,
+    DescriptionError,
+)
+from presentation.filters import build_filter
+from presentation.importer import row_to_operation
+from presentation.validators import (
+    validate_amount,
+    validate_category,
+    validate_date,
+    validate_description,
+)
+
+
+MAX_PER_PAGE = 100
+
+
+class RequestError(Exception):
+    pass
+
+
+class LedgerServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server sharing one DAO between all connections.
+
+    Requests are parsed and answered concurrently, while the calls into the
+    services are serialized by `ledger_lock`, because the DAO keeps the
+    ledger and its views in memory and is not thread-safe.
+
+    Args:
+        address (tuple[str, int]): The host and port to listen on.
+        dao (DBJsonDAO): Database access object shared by the requests.
+        log (bool): Log every request to stderr. Defaults to True.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, address: tuple[str, int], dao: DBJsonDAO, log: bool = True
+    ) -> None:
+        super().__init__(address, LedgerRequestHandler)
+        self.dao = dao
+        self.log = log
+        self.ledger_lock = threading.Lock()
+
+
+class LedgerRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API over the operation and balance services.
+
+    Endpoints:
+        GET /balance?as_of=
+        GET /operations?per_page=&page=&after=&before=&order_by=
+            &descending=&category=&from=&to=&min_amount=&max_amount=
+        POST /operations
+        GET /operations/<id>
+        PATCH /operations/<id>
+        DELETE /operations/<id>
+
+    Connections are kept alive (HTTP/1.1) between requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY the body
+    # of a keep-alive response waits for the client's delayed ACK.
+    disable_nagle_algorithm = True
+    server: LedgerServer
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.log:
+            super().log_message(format, *args)
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        path = [part for part in url.path.split("/") if part]
+
+        try:
+            # The body is always read so the connection can be reused.
+            body = self.rfile.read(self._content_length())
+            with self.server.ledger_lock:
+                status, response = self._route(
+                    method, path, parse_qs(url.query), body
+                )
+        except OperationDoesNotExistError as err:
+            status, response = HTTPStatus.NOT_FOUND, {"error": str(err)}
+        except (
+            RequestError,
+            CategoryError,
+            AmountError,
+            DescriptionError,
+            DateError,
+        ) as err:
+            status, response = HTTPStatus.BAD_REQUEST, {"error": str(err)}
+        except Exception as err:
+            # Answer instead of dropping the connection without a response.
+            self.log_error("Unhandled error: %r", err)
+            status, response = (
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": "Internal server error."},
+            )
+
+        self._send(status, response)
+
+    def _route(
+        self,
+        method: str,
+        path: list[str],
+        query: dict[str, list[str]],
+        body: bytes,
+    ) -> tuple[HTTPStatus, Optional[dict[str, Any]]]:
+        dao = self.server.dao
+
+        if path == ["balance"] and method == "GET":
+            as_of = query.get("as_of", [""])[-1]
+            if not as_of:
+                return HTTPStatus.OK, {"balance": get_balance(dao=dao)}
+            validate_date(date=as_of)
+            return HTTPStatus.OK, {
+                "balance": get_balance(
+                    as_of=datetime.strptime(as_of, "%d-%m-%Y"), dao=dao
+                )
+            }
+
+        if path == ["operations"] and method == "GET":
+            return HTTPStatus.OK, self._list(query)
+
+        if path == ["operations"] and method == "POST":
+            data = row_to_operation(row=self._json(body))
+            operation_id = create_operation(data=data, dao=dao)
+            return HTTPStatus.CREATED, self._operation(operation_id)
+
+        if len(path) == 2 and path[0] == "operations":
+            operation_id = path[1]
+            if method == "GET":
+                return HTTPStatus.OK, self._operation(operation_id)
+            if method == "PATCH":
+                update_operation(
+                    operation_id=operation_id,
+                    data=self._changes(self._json(body)),
+                    dao=dao,
+                )
+                return HTTPStatus.OK, self._operation(operation_id)
+            if method == "DELETE":
+                delete_operation(operation_id=operation_id, dao=dao)
+                return HTTPStatus.NO_CONTENT, None
+
+        raise RequestError(f"No endpoint for {method} {self.path}.")
+
+    def _list(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        def parameter(name: str, default: str = "") -> str:
+            return query.get(name, [default])[-1]
+
+        try:
+            per_page = int(parameter("per_page", "20"))
+            page_number = int(parameter("page", "1"))
+        except ValueError:
+            raise RequestError("per_page and page must be integers.")
+        if not 1 <= per_page <= MAX_PER_PAGE or page_number < 1:
+            raise RequestError(
+                f"per_page must be within 1 to {MAX_PER_PAGE} and page "
+                "must be positive."
+            )
+
+        order_by = parameter("order_by", "date")
+        if order_by not in ("date", "amount", "category"):
+            raise RequestError(
+                'order_by must be "date", "amount" or "category".'
+            )
+
+        operations, total = list_operations(
+            per_page=per_page,
+            page_number=page_number,
+            filter=build_filter(
+                category=parameter("category"),
+                start_date=parameter("from"),
+                end_date=parameter("to"),
+                min_amount=parameter("min_amount"),
+                max_amount=parameter("max_amount"),
+            ),
+            dao=self.server.dao,
+            after=parameter("after") or None,
+            before=parameter("before") or None,
+            order_by=order_by,
+            descending=parameter("descending") in ("1", "true"),
+        )
+        return {
+            "operations": [
+                self._record(operation) for operation in operations
+            ],
+            "total": total,
+        }
+
+    def _operation(self, operation_id: str) -> dict[str, Any]:
+        return self._record(
+            find_operation(operation_id=operation_id, dao=self.server.dao)
+        )
+
+    @staticmethod
+    def _record(operation: OperationDTO | OperationRecord) -> dict[str, Any]:
+        return {
+            "id": str(operation.id),
+            "date": operation.date.isoformat(timespec="microseconds"),
+            "category": operation.category,
+            "amount": operation.amount,
+            "description": operation.description,
+        }
+
+    @staticmethod
+    def _json(body: bytes) -> dict[str, Any]:
+        try:
+            data = json.loads(body)
+        except ValueError:
+            raise RequestError("The request body must be JSON.")
+        if not isinstance(data, dict):
+            raise RequestError("The request body must be a JSON object.")
+        return data
+
+    @staticmethod
+    def _changes(data: dict[str, Any]) -> OperationDTO:
+        category = str(data.get("category") or "")
+        amount = str(data.get("amount") or "")
+        description = str(data.get("description") or "")
+
+        if category:
+            validate_category(category=category)
+        if amount:
+            validate_amount(amount=amount)
+        if description:
+            validate_description(description=description)
+
+        return OperationDTO(
+            category=category,
+            amount=float(amount) if amount else 0.0,
+            description=description,
+        )
+
+    def _content_length(self) -> int:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be skipped, so the connection is not reused.
+            self.close_connection = True
+            raise RequestError("Invalid Content-Length header.")
+        return length
+
+    def _send(
+        self, status: HTTPStatus, response: Optional[dict[str, Any]]
+    ) -> None:
+        payload = b"" if response is None else json.dumps(response).encode()
+        self.send_response(status)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        if payload:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def serve(host: str, port: int, dao: DBJsonDAO = operation_dao) -> None:
+    """
+    Serve the JSON API until interrupted.
+
+    Args:
+        host (str): The host to listen on.
+        port (int): The port to listen on.
+        dao (DBJsonDAO, optional): Database access object shared by the
+            requests. Defaults to the one of the operation services.
+    """
+    with LedgerServer((host, port), dao=dao) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -1,11 +1,14 @@
 from time import sleep
 from datetime import datetime
+from typing import Optional
 
 from business_logic.dto import OperationDTO
 from business_logic.services import (
     get_balance,
     create_operation,
+    get_period_report_text,
 )
+from presentation.filters import build_filter
 from presentation.paginate import paginate_operation
 from presentation.validators import (
     validate_user_choice,
@@ -13,6 +16,8 @@ from presentation.validators import (
     validate_amount,
     validate_description,
     validate_date,
+    validate_date_range,
+    validate_amount_range,
 )
 from presentation.exceptions import (
     UserChoiceError,
@@ -23,18 +28,133 @@ from presentation.exceptions import (
 )
 
 
+def input_date_range() -> tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Ask the user for a date range where either bound may be left empty.
+
+    Returns:
+        tuple[Optional[datetime], Optional[datetime]]: The start and end
+            dates, None for an open bound.
+
+    Raises:
+        DateError: If the range is invalid.
+    """
+    start_date: str = input(
+        "Enter the start date in the format DD-MM-YYYY or leave the field "
+        "empty for no lower limit: "
+    )
+    end_date: str = input(
+        "Enter the end date in the format DD-MM-YYYY or leave the field "
+        "empty for no upper limit: "
+    )
+    validate_date_range(start_date=start_date, end_date=end_date)
+
+    return (
+        datetime.strptime(start_date, "%d-%m-%Y") if start_date else None,
+        datetime.strptime(end_date, "%d-%m-%Y") if end_date else None,
+    )
+
+
+def input_amount_range() -> tuple[Optional[float], Optional[float]]:
+    """
+    Ask the user for an amount range where either bound may be left empty.
+
+    Returns:
+        tuple[Optional[float], Optional[float]]: The minimum and maximum
+            amounts, None for an open bound.
+
+    Raises:
+        AmountError: If the range is invalid.
+    """
+    min_amount: str = input(
+        "Enter the minimum amount or leave the field empty for no lower "
+        "limit: "
+    )
+    max_amount: str = input(
+        "Enter the maximum amount or leave the field empty for no upper "
+        "limit: "
+    )
+    validate_amount_range(min_amount=min_amount, max_amount=max_amount)
+
+    return (
+        float(min_amount) if min_amount else None,
+        float(max_amount) if max_amount else None,
+    )
+
+
+SORT_ORDERS: dict[str, tuple[str, bool]] = {
+    "1": ("date", False),
+    "2": ("date", True),
+    "3": ("amount", False),
+    "4": ("amount", True),
+    "5": ("category", False),
+}
+
+
+def input_sort_order() -> Optional[tuple[str, bool]]:
+    """
+    Ask the user how the operations should be sorted.
+
+    Returns:
+        Optional[tuple[str, bool]]: The field to sort by and whether the
+            order is descending, None to go back to the main menu.
+
+    Raises:
+        UserChoiceError: If the choice is invalid.
+    """
+    sort_choice: str = input(
+        "\n------------------------------------"
+        "\nSort operations by:\n1 - Date, oldest first\n2 - Date, newest "
+        "first\n3 - Amount, smallest first\n4 - Amount, largest first"
+        "\n5 - Category\n0 - Back\nYour choice: "
+    )
+    validate_user_choice(choice=sort_choice, max_choice=len(SORT_ORDERS))
+
+    return SORT_ORDERS.get(sort_choice)
+
+
+REPORT_PERIODS: dict[str, str] = {
+    "1": "day",
+    "2": "week",
+    "3": "month",
+    "4": "year",
+}
+
+
+def input_report_period() -> Optional[str]:
+    """
+    Ask the user which periods the report should sum the operations by.
+
+    Returns:
+        Optional[str]: "day", "week", "month" or "year", None to go back to
+            the main menu.
+
+    Raises:
+        UserChoiceError: If the choice is invalid.
+    """
+    period_choice: str = input(
+        "\n------------------------------------"
+        "\nShow totals per:\n1 - Day\n2 - Week\n3 - Month\n4 - Year"
+        "\n0 - Back\nYour choice: "
+    )
+    validate_user_choice(choice=period_choice, max_choice=len(REPORT_PERIODS))
+
+    return REPORT_PERIODS.get(period_choice)
+
+
 def ui_func() -> None:
     """
     User interface function for interacting with the application.
 
     This function continuously prompts the user with a main menu and handles user inputs accordingly.
     It allows the user to perform various operations such as checking balance, viewing operations,
-    adding new operations, and finding operations based on different criteria.
+    adding new operations, finding operations based on different criteria and
+    viewing income, expense and balance reports per period.
     """
     main_menu: str = (
         "------------------------------------"
         "\nMain menu\n1 - Check balance\n2 - View operations\n3 - Add a new "
-        "operation\n4 - Find a operation\n0 - Exit\nYour choice: "
+        "operation\n4 - Find a operation\n5 - Reports\n0 - Exit\nYour choice: "
     )
     while True:
         choice: str = input(main_menu)
@@ -47,7 +167,23 @@ def ui_func() -> None:
             continue
 
         if choice == "1":
-            balance: float = get_balance()
+            as_of: str = input(
+                "\n------------------------------------"
+                "\nEnter a date in the format DD-MM-YYYY to see the balance "
+                "at the end of that day or leave the field empty for the "
+                "current balance: "
+            )
+            try:
+                if as_of:
+                    validate_date(date=as_of)
+            except DateError as err:
+                print(f"\n!!! {err} !!!\n")
+                sleep(2)
+                continue
+
+            balance: float = get_balance(
+                as_of=datetime.strptime(as_of, "%d-%m-%Y") if as_of else None
+            )
             print(
                 f"\n------------------------------------"
                 f"\n=== Your balance: {balance} ==="
@@ -57,7 +193,11 @@ def ui_func() -> None:
 
         if choice == "2":
             try:
-                paginate_operation()
+                sort_order = input_sort_order()
+                if sort_order is None:
+                    continue
+                order_by, descending = sort_order
+                paginate_operation(order_by=order_by, descending=descending)
             except (
                 UserChoiceError,
                 DescriptionError,
@@ -106,9 +246,11 @@ def ui_func() -> None:
             try:
                 find_choice: str = input(
                     "\n------------------------------------"
-                    "\nFind operation by:\n1 - Category\n2 - Date\n3 - Amount\nYour choice: "
+                    "\nFind operation by:\n1 - Category\n2 - Date\n3 - Amount"
+                    "\n4 - Date range\n5 - Amount range\n6 - Several criteria"
+                    "\nYour choice: "
                 )
-                validate_user_choice(choice=find_choice, max_choice=3)
+                validate_user_choice(choice=find_choice, max_choice=6)
 
                 if find_choice == "1":
                     filter_key: str = "category"
@@ -116,6 +258,7 @@ def ui_func() -> None:
                         'Enter the category of the operation you are interested in ("income" or "expense"): '
                     )
                     validate_category(category=filter_value)
+                    operation_filter = (filter_key, filter_value)
 
                 elif find_choice == "2":
                     filter_key: str = "date"
@@ -126,6 +269,7 @@ def ui_func() -> None:
                     filter_value: datetime = datetime.strptime(
                         input_date, "%d-%m-%Y"
                     )
+                    operation_filter = (filter_key, filter_value)
 
                 elif find_choice == "3":
                     filter_key: str = "amount"
@@ -134,8 +278,39 @@ def ui_func() -> None:
                     )
                     validate_amount(amount=filter_value)
                     filter_value: float = float(filter_value)
+                    operation_filter = (filter_key, filter_value)
+
+                elif find_choice == "4":
+                    operation_filter = ("date", *input_date_range())
+
+                elif find_choice == "5":
+                    operation_filter = ("amount", *input_amount_range())
+
+                elif find_choice == "6":
+                    operation_filter = build_filter(
+                        category=input(
+                            'Enter the category ("income" or "expense") or '
+                            "leave the field empty to skip it: "
+                        ),
+                        start_date=input(
+                            "Enter the start date in the format DD-MM-YYYY "
+                            "or leave the field empty for no lower limit: "
+                        ),
+                        end_date=input(
+                            "Enter the end date in the format DD-MM-YYYY or "
+                            "leave the field empty for no upper limit: "
+                        ),
+                        min_amount=input(
+                            "Enter the minimum amount or leave the field "
+                            "empty for no lower limit: "
+                        ),
+                        max_amount=input(
+                            "Enter the maximum amount or leave the field "
+                            "empty for no upper limit: "
+                        ),
+                    )
 
-                paginate_operation(filter=(filter_key, filter_value))
+                paginate_operation(filter=operation_filter)
 
             except (
                 UserChoiceError,
@@ -148,5 +323,23 @@ def ui_func() -> None:
                 sleep(2)
                 continue
 
+        if choice == "5":
+            try:
+                period = input_report_period()
+                if period is None:
+                    continue
+                start_date, end_date = input_date_range()
+            except (UserChoiceError, DateError) as err:
+                print(f"\n!!! {err} !!!\n")
+                sleep(2)
+                continue
+
+            print(
+                get_period_report_text(
+                    period=period, start=start_date, end=end_date
+                )
+            )
+            sleep(2)
+
         if choice == "0":
             break
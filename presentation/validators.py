@@ -110,3 +110,51 @@ def validate_date(date: str) -> None:
         datetime.strptime(date, "%d-%m-%Y")
     except ValueError:
         raise DateError("The date must be in the format DD-MM-YYYY.")
+
+
+def validate_date_range(start_date: str, end_date: str) -> None:
+    """
+    Validate a date range where either bound may be left empty.
+
+    Args:
+        start_date (str): The start date or an empty string.
+        end_date (str): The end date or an empty string.
+
+    Raises:
+        DateError: If a date is invalid or the start is after the end.
+    """
+    if start_date:
+        validate_date(date=start_date)
+    if end_date:
+        validate_date(date=end_date)
+
+    if (
+        start_date
+        and end_date
+        and datetime.strptime(start_date, "%d-%m-%Y")
+        > datetime.strptime(end_date, "%d-%m-%Y")
+    ):
+        raise DateError("The start date must not be after the end date.")
+
+
+def validate_amount_range(min_amount: str, max_amount: str) -> None:
+    """
+    Validate an amount range where either bound may be left empty.
+
+    Args:
+        min_amount (str): The minimum amount or an empty string.
+        max_amount (str): The maximum amount or an empty string.
+
+    Raises:
+        AmountError: If an amount is invalid or the minimum exceeds the
+            maximum.
+    """
+    if min_amount:
+        validate_amount(amount=min_amount)
+    if max_amount:
+        validate_amount(amount=max_amount)
+
+    if min_amount and max_amount and float(min_amount) > float(max_amount):
+        raise AmountError(
+            "The minimum amount must not exceed the maximum amount."
+        )
@@ -1,5 +1,8 @@
 import unittest
+from glob import glob
 from os import remove
+from os.path import isdir
+from shutil import rmtree
 import json
 
 from data_access.dao import db_provider
@@ -13,7 +16,11 @@ class BaseTests(unittest.TestCase):
         self.dao = db_provider(data_name="test_db", data_type=".json")
 
     def tearDown(self) -> None:
-        remove("test_db.json")
+        for path in glob("test_db*"):
+            if isdir(path):
+                rmtree(path)
+            else:
+                remove(path)
 
 
 if __name__ == "__main__":
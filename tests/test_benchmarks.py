@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+from benchmarks.bench import (
+    STORAGES,
+    format_report,
+    generate_ledger,
+    main,
+    run_benchmarks,
+)
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_ledger_is_reproducible(self) -> None:
+        self.assertEqual(generate_ledger(20, 1), generate_ledger(20, 1))
+        self.assertNotEqual(generate_ledger(20, 1), generate_ledger(20, 2))
+
+    def test_suite_runs_on_every_storage(self) -> None:
+        for storage in STORAGES:
+            with self.subTest(storage=storage):
+                report = run_benchmarks(
+                    sizes=(50,),
+                    storage=storage,
+                    repeat=3,
+                    write_repeat=3,
+                    time_limit=0,
+                    seed=0,
+                )
+
+                results = report["results"]["50"]
+                self.assertIn("read_compound", results)
+                self.assertEqual(results["create"]["calls"], 3)
+                self.assertIn(
+                    "read_by_id", format_report(report, baseline=report)
+                )
+
+    def test_table_written_to_stdout(self) -> None:
+        argv = ["--sizes", "20", "--repeat", "3", "--write-repeat", "3"]
+        argv += ["--time-limit", "0", "--only", "read_all"]
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                with redirect_stdout(StringIO()) as stdout, redirect_stderr(
+                    StringIO()
+                ):
+                    self.assertEqual(main(argv), 0)
+            finally:
+                os.chdir(cwd)
+
+            self.assertEqual(os.listdir(directory), [])
+        self.assertIn("read_all", stdout.getvalue())
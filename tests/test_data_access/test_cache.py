@@ -0,0 +1,51 @@
+import json
+from unittest.mock import patch
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from data_access.dao import DBJsonDAO
+from data_access.cache import DBCachedJsonDAO
+
+
+class CacheTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBCachedJsonDAO(data_name="test_db", data_type=".json")
+        self.dao.create(
+            OperationDTO(category="income", amount=100, description="test")
+        )
+
+    def test_unchanged_file_is_not_parsed_again(self) -> None:
+        with patch.object(
+            DBJsonDAO, "_load", side_effect=AssertionError
+        ) as load:
+            self.dao.read()
+            self.dao.read(filter=("category", "income"))
+
+        load.assert_not_called()
+
+    def test_own_write_keeps_cache(self) -> None:
+        self.dao.create(
+            OperationDTO(category="expense", amount=50, description="test")
+        )
+
+        with patch.object(DBJsonDAO, "_load") as load:
+            result = self.dao.read()
+
+        load.assert_not_called()
+        self.assertEqual(len(result), 2)
+
+    def test_external_change_reloads_file(self) -> None:
+        with open("test_db.json", "w") as file:
+            json.dump({}, file)
+
+        self.assertEqual(self.dao.read(), {})
+
+    def test_invalidate(self) -> None:
+        self.dao.invalidate()
+
+        with patch.object(DBJsonDAO, "_load", return_value={}) as load:
+            self.dao.read()
+
+        load.assert_called_once()
@@ -0,0 +1,116 @@
+from datetime import date, datetime
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import get_balance
+from data_access.columns import ColumnarLedger
+from data_access.dao import DBJsonDAO
+from data_access.sqlite import DBSqliteDAO
+
+
+OPERATIONS = (
+    (datetime(2024, 3, 31, 23, 59), "income", 100, "salary"),
+    (datetime(2024, 2, 10, 9), "expense", 30.5, "coffee"),
+    (datetime(2024, 3, 1), "expense", 20, "coffee"),
+    (datetime(2024, 3, 1, 18), "income", 5, "refund"),
+    (datetime(2024, 4, 2), "expense", 250, "rent"),
+)
+
+
+class ColumnarLedgerTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        self.dao.create_many(
+            OperationDTO(
+                date=date,
+                category=category,
+                amount=amount,
+                description=description,
+            )
+            for date, category, amount, description in OPERATIONS
+        )
+        self.ledger = self.dao.columns()
+
+    def test_columns_sorted_by_date_with_interned_strings(self) -> None:
+        self.assertEqual(len(self.ledger), 5)
+        self.assertEqual(list(self.ledger.days), sorted(self.ledger.days))
+        self.assertEqual(
+            sorted(self.ledger.description_names),
+            ["coffee", "refund", "rent", "salary"],
+        )
+        self.assertEqual(
+            self.ledger.description_names[self.ledger.descriptions[0]],
+            "coffee",
+        )
+
+    def test_balance_and_totals(self) -> None:
+        self.assertEqual(self.ledger.balance(), get_balance(dao=self.dao))
+        self.assertEqual(self.ledger.totals(), self.dao.totals())
+        self.assertEqual(
+            self.ledger.balance(start=date(2024, 3, 1), end=date(2024, 3, 31)),
+            85,
+        )
+        self.assertEqual(
+            self.ledger.totals(end=datetime(2024, 3, 1)),
+            {
+                "expense": {"amount": 50.5, "count": 2},
+                "income": {"amount": 5, "count": 1},
+            },
+        )
+
+    def test_daily_and_monthly_sums(self) -> None:
+        self.assertEqual(
+            self.ledger.daily_sums(),
+            {
+                date(2024, 2, 10): -30.5,
+                date(2024, 3, 1): -15,
+                date(2024, 3, 31): 100,
+                date(2024, 4, 2): -250,
+            },
+        )
+        self.assertEqual(
+            self.ledger.monthly_sums(category="expense"),
+            {
+                date(2024, 2, 1): 30.5,
+                date(2024, 3, 1): 20,
+                date(2024, 4, 1): 250,
+            },
+        )
+
+    def test_filtered_counts(self) -> None:
+        self.assertEqual(self.ledger.count(), 5)
+        self.assertEqual(self.ledger.count(category="expense"), 3)
+        self.assertEqual(self.ledger.count(category="unknown"), 0)
+        self.assertEqual(
+            self.ledger.count(
+                category="expense", start=date(2024, 3, 1), min_amount=20
+            ),
+            2,
+        )
+        self.assertEqual(self.ledger.count(min_amount=20, max_amount=100), 3)
+
+    def test_empty_ledger(self) -> None:
+        ledger = ColumnarLedger()
+
+        self.assertEqual(ledger.balance(), 0)
+        self.assertEqual(ledger.monthly_sums(), {})
+        self.assertEqual(ledger.count(category="income"), 0)
+
+    def test_filtered_sqlite_columns(self) -> None:
+        dao = DBSqliteDAO(data_name="test_db", data_type=".db")
+        dao.create_many(
+            OperationDTO(
+                date=date,
+                category=category,
+                amount=amount,
+                description=description,
+            )
+            for date, category, amount, description in OPERATIONS
+        )
+
+        ledger = dao.columns(filter=("category", "expense"))
+        dao.close()
+
+        self.assertEqual(ledger.balance(), -300.5)
@@ -0,0 +1,93 @@
+import json
+from datetime import datetime
+
+from tests.test_app import BaseTests
+
+from business_logic.services import get_all_operation_paginate, migrate_storage
+from data_access.dao import DBJsonDAO
+from data_access.dates import day_number, from_timestamp, to_timestamp
+from data_access.journal import DBJournalDAO
+from data_access.views import IndexView
+
+
+LEGACY_ID = "a5d569f8-3d3e-491d-a8b3-04996a89ed52"
+
+
+class DateTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        with open("test_db.json", "w") as file:
+            json.dump(
+                {
+                    LEGACY_ID: {
+                        "date": "2024-03-01T12:30:00.000001",
+                        "category": "income",
+                        "amount": 100,
+                        "description": "test",
+                    }
+                },
+                file,
+            )
+        self.dao = DBJsonDAO(data_name="test_db", data_type=".json")
+
+    def test_timestamp_round_trip(self) -> None:
+        date = datetime(2024, 3, 1, 12, 30, 0, 1)
+
+        self.assertEqual(from_timestamp(to_timestamp(date)), date)
+        self.assertEqual(to_timestamp(date.isoformat()), to_timestamp(date))
+        self.assertEqual(day_number(date), day_number(datetime(2024, 3, 1)))
+
+    def test_legacy_dates_read_as_timestamps(self) -> None:
+        operation = self.dao.read(operation_id=LEGACY_ID)
+
+        self.assertEqual(operation.date, datetime(2024, 3, 1, 12, 30, 0, 1))
+        self.assertEqual(
+            self.dao.read()[LEGACY_ID]["date"],
+            to_timestamp(datetime(2024, 3, 1, 12, 30, 0, 1)),
+        )
+        self.assertEqual(
+            list(self.dao.read(filter=("date", datetime(2024, 3, 1)))),
+            [LEGACY_ID],
+        )
+        self.assertIn(
+            "01-03-2024 12:30:00",
+            get_all_operation_paginate(dao=self.dao)[0],
+        )
+
+    def test_migrate_rewrites_dates(self) -> None:
+        migrate_storage(dao=self.dao)
+
+        with open("test_db.json") as file:
+            self.assertEqual(
+                json.load(file)[LEGACY_ID]["date"],
+                to_timestamp(datetime(2024, 3, 1, 12, 30, 0, 1)),
+            )
+        self.assertEqual(
+            self.dao.read(operation_id=LEGACY_ID).date,
+            datetime(2024, 3, 1, 12, 30, 0, 1),
+        )
+
+    def test_migrate_journal(self) -> None:
+        dao = DBJournalDAO(data_name="test_db", data_type=".json")
+
+        dao.migrate()
+
+        with open("test_db.json") as file:
+            self.assertIsInstance(json.load(file)[LEGACY_ID]["date"], int)
+
+    def test_view_of_another_version_rebuilt(self) -> None:
+        self.dao.rebuild()
+        with open("test_db.index.json") as file:
+            persisted = json.load(file)
+        persisted["version"] = 1
+        persisted["view"]["date"] = {"2024-03-01": [LEGACY_ID]}
+        with open("test_db.index.json", "w") as file:
+            json.dump(persisted, file)
+
+        index = DBJsonDAO(data_name="test_db", data_type=".json").view(
+            IndexView.name
+        )
+
+        self.assertEqual(
+            index.lookup("date", datetime(2024, 3, 1)), [LEGACY_ID]
+        )
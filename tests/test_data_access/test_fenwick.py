@@ -0,0 +1,31 @@
+import unittest
+from random import Random
+
+from data_access.fenwick import FenwickTree
+
+
+class FenwickTreeTests(unittest.TestCase):
+    def test_prefix_sums_after_updates(self) -> None:
+        rng = Random(0)
+        values = [rng.randint(-50, 50) for _ in range(37)]
+        tree = FenwickTree(values)
+
+        for _ in range(100):
+            position = rng.randrange(len(values))
+            change = rng.randint(-10, 10)
+            values[position] += change
+            tree.add(position, change)
+
+        self.assertEqual(
+            [tree.prefix_sum(position) for position in range(len(values))],
+            [sum(values[: position + 1]) for position in range(len(values))],
+        )
+
+    def test_out_of_range_positions(self) -> None:
+        tree = FenwickTree([1.0, 2.0, 3.0])
+
+        self.assertEqual(tree.prefix_sum(-1), 0)
+        self.assertEqual(tree.prefix_sum(10), 6)
+        self.assertEqual(FenwickTree().prefix_sum(0), 0)
+        with self.assertRaises(IndexError):
+            tree.add(3, 1.0)
@@ -0,0 +1,121 @@
+import os
+from datetime import datetime
+from io import BytesIO
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import convert_storage, get_balance
+from data_access.dao import DBJsonDAO, db_provider
+from data_access.formats import FORMATS, detect_format
+from data_access.sqlite import DBSqliteDAO
+
+
+class FormatTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        for category, amount, description in (
+            ("income", 100.5, "salary"),
+            ("expense", 30, "кофе"),
+            ("expense", 20, "кофе"),
+        ):
+            self.dao.create(
+                OperationDTO(
+                    category=category, amount=amount, description=description
+                )
+            )
+        self.json_data = self.dao.read()
+
+    def test_round_trip(self) -> None:
+        for name, data_format in FORMATS.items():
+            file = BytesIO()
+            data_format.dump(self.json_data, file)
+
+            file.seek(0)
+            self.assertIs(detect_format(file), data_format)
+            self.assertEqual(data_format.load(file), self.json_data)
+
+            file.seek(0)
+            self.assertEqual(
+                list(data_format.iterate(file)), list(self.json_data.items())
+            )
+
+    def test_compact_formats_are_smaller(self) -> None:
+        sizes = {}
+        for name, data_format in FORMATS.items():
+            file = BytesIO()
+            data_format.dump(self.json_data, file)
+            sizes[name] = len(file.getvalue())
+
+        self.assertLess(sizes["compact"], sizes["indent"])
+        self.assertLess(sizes["binary"], sizes["compact"])
+
+    def test_binary_requires_uuid_ids(self) -> None:
+        with self.assertRaises(ValueError):
+            FORMATS["binary"].dump(
+                {"not-a-uuid": next(iter(self.json_data.values()))},
+                BytesIO(),
+            )
+
+    def test_convert_storage(self) -> None:
+        size = os.path.getsize("test_db.json")
+
+        convert_storage(data_format="binary", dao=self.dao)
+
+        self.assertLess(os.path.getsize("test_db.json"), size)
+        self.assertEqual(self.dao.read(), self.json_data)
+        self.assertEqual(get_balance(dao=self.dao), 50.5)
+
+        self.dao.create(
+            OperationDTO(category="income", amount=1, description="new")
+        )
+        reopened = DBJsonDAO(data_name="test_db", data_type=".json")
+
+        self.assertEqual(len(list(reopened.iter_operations())), 4)
+        self.assertEqual(
+            len(reopened.read(filter=("description", "кофе"))), 2
+        )
+
+    def test_converted_format_kept_on_write(self) -> None:
+        for data_format in ("binary", "compact", "indent"):
+            with self.subTest(data_format=data_format):
+                convert_storage(data_format=data_format, dao=self.dao)
+                dao = DBJsonDAO(data_name="test_db", data_type=".json")
+                dao.create(
+                    OperationDTO(
+                        category="income", amount=1, description="new"
+                    )
+                )
+
+                with open("test_db.json", "rb") as file:
+                    self.assertIs(detect_format(file), FORMATS[data_format])
+
+    def test_partitions_keep_converted_format(self) -> None:
+        dao = db_provider(
+            data_name="test_db", data_type=".json", partitioned=True
+        )
+        dao.create(OperationDTO(category="income", amount=1, description=""))
+
+        convert_storage(data_format="binary", dao=dao)
+        db_provider(
+            data_name="test_db", data_type=".json", partitioned=True
+        ).create(
+            OperationDTO(
+                date=datetime(2020, 1, 1),
+                category="income",
+                amount=1,
+                description="",
+            )
+        )
+
+        with open(os.path.join(dao.directory, "2020-01.json"), "rb") as file:
+            self.assertIs(detect_format(file), FORMATS["binary"])
+
+    def test_sqlite_not_converted(self) -> None:
+        dao = DBSqliteDAO(data_name="test_db", data_type=".db")
+        try:
+            with self.assertRaises(ValueError):
+                convert_storage(data_format="binary", dao=dao)
+        finally:
+            dao.close()
@@ -0,0 +1,90 @@
+import json
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from data_access.journal import DBJournalDAO
+from data_access.exceptions import RecordDoesNotExistError
+
+
+class JournalTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBJournalDAO(
+            data_name="test_db", data_type=".json", compact_threshold=10
+        )
+        self.dao.create(
+            OperationDTO(
+                id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+                category="income",
+                amount=666,
+                description="test",
+            )
+        )
+
+    def test_create_appends_to_journal(self) -> None:
+        with open("test_db.json", "r") as file:
+            self.assertEqual(json.load(file), {})
+
+        with open("test_db.json.log", "r") as file:
+            entries = [json.loads(line) for line in file]
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(
+            entries[0]["id"], "a5d569f8-3d3e-491d-a8b3-04996a89ed52"
+        )
+
+    def test_journal_replayed_on_open(self) -> None:
+        self.dao.update(
+            operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+            data=OperationDTO(category="expense", amount=0, description=""),
+        )
+        self.dao.create(
+            OperationDTO(category="income", amount=1, description="test")
+        )
+
+        dao = DBJournalDAO(data_name="test_db", data_type=".json")
+        result = dao.read()
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(
+            result["a5d569f8-3d3e-491d-a8b3-04996a89ed52"]["category"],
+            "expense",
+        )
+
+    def test_delete_replayed_on_open(self) -> None:
+        self.dao.delete(operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52")
+
+        dao = DBJournalDAO(data_name="test_db", data_type=".json")
+
+        self.assertEqual(dao.read(), {})
+        with self.assertRaises(RecordDoesNotExistError):
+            dao.delete(operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52")
+
+    def test_compaction_folds_journal_into_snapshot(self) -> None:
+        for amount in range(1, 10):
+            self.dao.create(
+                OperationDTO(
+                    category="income", amount=amount, description="test"
+                )
+            )
+
+        with open("test_db.json", "r") as file:
+            self.assertEqual(len(json.load(file)), 10)
+
+        with open("test_db.json.log", "r") as file:
+            self.assertEqual(file.read(), "")
+
+        self.assertEqual(len(self.dao.read()), 10)
+
+    def test_torn_journal_line_is_skipped(self) -> None:
+        with open("test_db.json.log", "a") as file:
+            file.write('{"id": "broken", "rec')
+
+        self.dao.create(
+            OperationDTO(category="expense", amount=5, description="test")
+        )
+
+        dao = DBJournalDAO(data_name="test_db", data_type=".json")
+
+        self.assertEqual(len(dao.read()), 2)
@@ -0,0 +1,78 @@
+import json
+import os
+from glob import glob
+from multiprocessing import get_context
+from unittest.mock import patch
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import get_balance, verify_balance
+from data_access.dao import db_provider
+
+
+PROCESSES = 4
+WRITES = 25
+
+
+def write_operations(journal: bool) -> None:
+    dao = db_provider(data_name="test_db", data_type=".json", journal=journal)
+    for _ in range(WRITES):
+        dao.create(
+            OperationDTO(category="income", amount=1, description="test")
+        )
+
+
+class LockingTests(BaseTests):
+    def run_writers(self, journal: bool) -> None:
+        context = get_context("spawn")
+        processes = [
+            context.Process(target=write_operations, args=(journal,))
+            for _ in range(PROCESSES)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+    def test_concurrent_writers_lose_no_updates(self) -> None:
+        self.run_writers(journal=False)
+
+        dao = db_provider(data_name="test_db", data_type=".json", cache=False)
+        self.assertEqual(len(dao.read()), PROCESSES * WRITES)
+        self.assertEqual(get_balance(dao=dao), PROCESSES * WRITES)
+        self.assertTrue(verify_balance(dao=dao))
+
+    def test_concurrent_journal_writers_lose_no_updates(self) -> None:
+        self.run_writers(journal=True)
+
+        dao = db_provider(data_name="test_db", data_type=".json", journal=True)
+        self.assertEqual(len(dao.read()), PROCESSES * WRITES)
+        self.assertTrue(verify_balance(dao=dao))
+
+    def test_failed_write_keeps_the_database(self) -> None:
+        self.dao.create(
+            OperationDTO(category="income", amount=1, description="test")
+        )
+
+        with patch("json.dump", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.dao.create(
+                    OperationDTO(
+                        category="income", amount=2, description="test"
+                    )
+                )
+
+        with open("test_db.json") as file:
+            self.assertEqual(len(json.load(file)), 1)
+        self.assertEqual(glob("test_db.json.*.tmp"), [])
+
+    def test_write_keeps_file_mode(self) -> None:
+        os.chmod("test_db.json", 0o640)
+
+        self.dao.create(
+            OperationDTO(category="income", amount=1, description="test")
+        )
+
+        self.assertEqual(os.stat("test_db.json").st_mode & 0o777, 0o640)
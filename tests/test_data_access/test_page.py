@@ -0,0 +1,153 @@
+from unittest.mock import patch
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from data_access.dao import DBJsonDAO
+from data_access.exceptions import RecordDoesNotExistError
+
+
+class PageTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        for amount in range(1, 8):
+            self.dao.create(
+                OperationDTO(
+                    category="income" if amount % 2 else "expense",
+                    amount=amount,
+                    description="test",
+                )
+            )
+
+    def amounts(self, operations: dict) -> list[float]:
+        return [operation["amount"] for operation in operations.values()]
+
+    def test_pages_follow_date_order(self) -> None:
+        first, total = self.dao.page(per_page=3)
+        second, _ = self.dao.page(per_page=3, after=list(first)[-1])
+        last, _ = self.dao.page(per_page=3, after=list(second)[-1])
+
+        self.assertEqual(total, 7)
+        self.assertEqual(self.amounts(first), [1, 2, 3])
+        self.assertEqual(self.amounts(second), [4, 5, 6])
+        self.assertEqual(self.amounts(last), [7])
+
+    def test_previous_page(self) -> None:
+        second, _ = self.dao.page(per_page=3, offset=3)
+        first, _ = self.dao.page(per_page=3, before=list(second)[0])
+
+        self.assertEqual(self.amounts(first), [1, 2, 3])
+
+    def test_cursor_page_does_not_sort_operations(self) -> None:
+        first, _ = self.dao.page(per_page=3)
+
+        with patch("data_access.dao.sorted") as sort:
+            self.dao.page(per_page=3, after=list(first)[-1])
+
+        sort.assert_not_called()
+
+    def test_filtered_pages(self) -> None:
+        first, total = self.dao.page(
+            per_page=2, filter=("category", "income")
+        )
+        second, _ = self.dao.page(
+            per_page=2, after=list(first)[-1], filter=("category", "income")
+        )
+
+        self.assertEqual(total, 4)
+        self.assertEqual(self.amounts(first), [1, 3])
+        self.assertEqual(self.amounts(second), [5, 7])
+
+    def test_descending_pages(self) -> None:
+        first, _ = self.dao.page(per_page=3, descending=True)
+        second, _ = self.dao.page(
+            per_page=3, after=list(first)[-1], descending=True
+        )
+        previous, _ = self.dao.page(
+            per_page=3, before=list(second)[0], descending=True
+        )
+        last, _ = self.dao.page(per_page=3, offset=6, descending=True)
+
+        self.assertEqual(self.amounts(first), [7, 6, 5])
+        self.assertEqual(self.amounts(second), [4, 3, 2])
+        self.assertEqual(self.amounts(previous), [7, 6, 5])
+        self.assertEqual(self.amounts(last), [1])
+
+    def test_pages_sorted_by_amount(self) -> None:
+        self.dao.update(
+            list(self.dao.read())[0],
+            OperationDTO(category="", amount=10, description=""),
+        )
+
+        first, _ = self.dao.page(
+            per_page=3, order_by="amount", descending=True
+        )
+        second, _ = self.dao.page(
+            per_page=3,
+            after=list(first)[-1],
+            order_by="amount",
+            descending=True,
+        )
+
+        self.assertEqual(self.amounts(first), [10, 7, 6])
+        self.assertEqual(self.amounts(second), [5, 4, 3])
+
+    def test_pages_sorted_by_category(self) -> None:
+        first, _ = self.dao.page(per_page=3, order_by="category")
+        second, _ = self.dao.page(
+            per_page=3, after=list(first)[-1], order_by="category"
+        )
+
+        self.assertEqual(self.amounts(first), [2, 4, 6])
+        self.assertEqual(self.amounts(second), [1, 3, 5])
+
+    def test_filtered_pages_sorted_by_amount(self) -> None:
+        first, total = self.dao.page(
+            per_page=3,
+            filter=("category", "income"),
+            order_by="amount",
+            descending=True,
+        )
+
+        self.assertEqual(total, 4)
+        self.assertEqual(self.amounts(first), [7, 5, 3])
+
+    def test_unsortable_field(self) -> None:
+        with self.assertRaises(KeyError):
+            self.dao.page(per_page=3, order_by="description")
+
+    def test_missing_cursor(self) -> None:
+        with self.assertRaises(RecordDoesNotExistError):
+            self.dao.page(
+                per_page=3, after="96395705-58cf-4806-ab40-b6b7c31f0b20"
+            )
+
+    def test_page_reads_only_its_records(self) -> None:
+        first, _ = self.dao.page(per_page=3)
+
+        with patch.object(DBJsonDAO, "_load") as load:
+            second, _ = self.dao.page(per_page=2, after=list(first)[-1])
+            income, total = self.dao.page(
+                per_page=2, filter=("category", "income"), order_by="amount"
+            )
+
+        load.assert_not_called()
+        self.assertEqual(self.amounts(second), [4, 5])
+        self.assertEqual(self.amounts(income), [1, 3])
+        self.assertEqual(total, 4)
+
+    def test_scanned_filter_loads_once(self) -> None:
+        self.dao.page(per_page=3)
+
+        with patch.object(
+            DBJsonDAO, "_load", side_effect=self.dao._load
+        ) as load:
+            page, total = self.dao.page(
+                per_page=2,
+                filter=[("category", "income"), ("description", "test")],
+            )
+
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(self.amounts(page), [1, 3])
+        self.assertEqual(total, 4)
@@ -0,0 +1,161 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import (
+    find_parallel_operations,
+    get_balance,
+    get_parallel_balance,
+    get_parallel_period_report,
+    get_period_report,
+)
+from data_access.dao import DBJsonDAO, db_provider, to_record
+from data_access.parallel import ParallelLedger
+from data_access.shards import list_shards, write_shards
+
+
+OPERATIONS = (
+    (datetime(2023, 12, 31, 23), "income", 1000, "salary"),
+    (datetime(2024, 1, 1), "expense", 30, "coffee"),
+    (datetime(2024, 1, 31, 18), "expense", 20, "coffee"),
+    (datetime(2024, 2, 1), "income", 5, "refund"),
+    (datetime(2024, 3, 15), "expense", 250, "rent"),
+)
+
+
+class ParallelLedgerTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = db_provider(
+            data_name="test_db", data_type=".json", partitioned=True
+        )
+        self.dao.create_many(
+            OperationDTO(
+                date=date,
+                category=category,
+                amount=amount,
+                description=description,
+            )
+            for date, category, amount, description in OPERATIONS
+        )
+        self.ledger = ParallelLedger(self.dao.directory, max_workers=1)
+
+    def test_partitions_are_shards(self) -> None:
+        self.assertEqual(
+            list(list_shards(self.dao.directory)),
+            ["2023-12", "2024-01", "2024-02", "2024-03"],
+        )
+
+    def test_rewrite_removes_empty_months(self) -> None:
+        write_shards(
+            (
+                (operation_id, operation)
+                for operation_id, operation in self.dao.read().items()
+                if operation["category"] == "income"
+            ),
+            "test_db.shards",
+        )
+
+        self.assertEqual(
+            list(list_shards("test_db.shards")), ["2023-12", "2024-02"]
+        )
+
+    def test_totals_and_balance(self) -> None:
+        self.assertEqual(self.ledger.totals(), self.dao.totals())
+        self.assertEqual(self.ledger.balance(), get_balance(dao=self.dao))
+        self.assertEqual(
+            self.ledger.balance(start=date(2024, 1, 1), end=date(2024, 2, 1)),
+            -45,
+        )
+
+    def test_filtered_read_prunes_shards(self) -> None:
+        os.remove(list_shards(self.dao.directory)["2023-12"])
+
+        operations = self.ledger.read(
+            [("date", date(2024, 1, 1), None), ("category", "expense")]
+        )
+
+        self.assertEqual(
+            operations,
+            self.dao.read(
+                filter=[
+                    ("date", date(2024, 1, 1), None),
+                    ("category", "expense"),
+                ]
+            ),
+        )
+
+    def test_period_totals(self) -> None:
+        self.assertEqual(
+            self.ledger.period_totals("year"),
+            {
+                date(2023, 1, 1): {"income": {"amount": 1000, "count": 1}},
+                date(2024, 1, 1): {
+                    "expense": {"amount": 300, "count": 3},
+                    "income": {"amount": 5, "count": 1},
+                },
+            },
+        )
+        self.assertEqual(
+            list(self.ledger.period_totals("week", end=date(2024, 1, 31))),
+            [date(2023, 12, 25), date(2024, 1, 1), date(2024, 1, 29)],
+        )
+        with self.assertRaises(ValueError):
+            self.ledger.period_totals("decade")
+
+    def test_worker_processes(self) -> None:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            ledger = ParallelLedger(self.dao.directory, executor=executor)
+
+            self.assertEqual(ledger.totals(), self.dao.totals())
+            self.assertEqual(
+                ledger.period_totals("month"),
+                self.ledger.period_totals("month"),
+            )
+
+        self.assertEqual(
+            ParallelLedger(self.dao.directory, max_workers=2).balance(),
+            get_balance(dao=self.dao),
+        )
+
+    def test_services_read_live_partitions(self) -> None:
+        self.assertEqual(get_parallel_balance(dao=self.dao), 705)
+
+        self.dao.create(
+            OperationDTO(
+                date=datetime(2024, 3, 16),
+                category="income",
+                amount=10.1,
+                description="",
+            )
+        )
+
+        self.assertEqual(
+            get_parallel_balance(dao=self.dao), get_balance(dao=self.dao)
+        )
+        self.assertEqual(get_parallel_balance(dao=self.dao), 715.1)
+        filter = [("date", date(2024, 3, 1), None), ("category", "income")]
+        self.assertEqual(
+            find_parallel_operations(filter=filter, dao=self.dao),
+            [
+                to_record(operation_id, operation)
+                for operation_id, operation in self.dao.read(
+                    filter=filter
+                ).items()
+            ],
+        )
+        for options in ({}, {"period": "week", "start": date(2024, 1, 3)}):
+            with self.subTest(**options):
+                self.assertEqual(
+                    get_parallel_period_report(dao=self.dao, **options),
+                    get_period_report(dao=self.dao, **options),
+                )
+
+    def test_services_need_partitions(self) -> None:
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+
+        with self.assertRaises(ValueError):
+            get_parallel_balance(dao=dao)
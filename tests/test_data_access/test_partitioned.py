@@ -0,0 +1,198 @@
+import os
+from datetime import date, datetime
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import partition_storage
+from data_access.dao import DBJsonDAO, db_provider
+from data_access.exceptions import RecordDoesNotExistError
+from data_access.partitioned import DBPartitionedDAO
+from data_access.shards import list_shards, write_shards
+
+
+OPERATIONS = (
+    (datetime(2023, 12, 31, 23), "income", 1000, "salary"),
+    (datetime(2024, 1, 1), "expense", 30, "coffee"),
+    (datetime(2024, 1, 31, 18), "expense", 20, "coffee"),
+    (datetime(2024, 2, 1), "income", 5, "refund"),
+    (datetime(2024, 3, 15), "expense", 250, "rent"),
+    (datetime(2024, 3, 15), "expense", 30, "lunch"),
+)
+
+
+def operations():
+    return (
+        OperationDTO(
+            date=date, category=category, amount=amount, description=text
+        )
+        for date, category, amount, text in OPERATIONS
+    )
+
+
+class PartitionedDAOTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = db_provider(
+            data_name="test_db", data_type=".json", partitioned=True
+        )
+        self.dao.create_many(operations())
+
+    def test_operations_split_by_month(self) -> None:
+        self.assertIsInstance(self.dao, DBPartitionedDAO)
+        self.assertEqual(
+            self.dao.manifest(),
+            {"2023-12": 1, "2024-01": 2, "2024-02": 1, "2024-03": 2},
+        )
+        self.assertEqual(
+            list(list_shards("test_db.parts")), list(self.dao.manifest())
+        )
+        self.assertEqual(
+            list(self.dao.daily_totals(start=date(2024, 1, 15))),
+            [date(2024, 1, 31), date(2024, 2, 1), date(2024, 3, 15)],
+        )
+        self.assertEqual(
+            self.dao.totals(),
+            {
+                "income": {"amount": 1005, "count": 2},
+                "expense": {"amount": 330, "count": 4},
+            },
+        )
+
+    def test_read_update_delete_by_id(self) -> None:
+        operation_id = self.dao.create(
+            OperationDTO(
+                date=datetime(2024, 2, 29),
+                category="income",
+                amount=7,
+                description="",
+            )
+        )
+
+        self.assertEqual(self.dao.read(operation_id).amount, 7)
+        self.dao.update(
+            operation_id, OperationDTO(category="", amount=8, description="")
+        )
+        self.assertEqual(self.dao.read(operation_id).amount, 8)
+        self.assertEqual(self.dao.manifest()["2024-02"], 2)
+
+        self.dao.delete(operation_id)
+
+        self.assertEqual(self.dao.manifest()["2024-02"], 1)
+        with self.assertRaises(RecordDoesNotExistError):
+            self.dao.read(operation_id)
+        # The directory is shared through the file.
+        other = DBPartitionedDAO(data_name="test_db", data_type=".json")
+        with self.assertRaises(RecordDoesNotExistError):
+            other.delete(operation_id)
+
+    def test_filters_prune_partitions(self) -> None:
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        dao.create_many(operations())
+        filters = (
+            ("date", date(2024, 1, 15), date(2024, 2, 1)),
+            [("category", "expense"), ("date", date(2024, 3, 15))],
+            ("amount", 30),
+        )
+
+        for filter in filters:
+            with self.subTest(filter=filter):
+                self.assertEqual(
+                    sorted(
+                        operation["description"]
+                        for operation in self.dao.read(filter=filter).values()
+                    ),
+                    sorted(
+                        operation["description"]
+                        for operation in dao.read(filter=filter).values()
+                    ),
+                )
+
+        os.remove("test_db.parts/2023-12.json")
+        self.assertEqual(
+            len(self.dao.read(filter=("date", date(2024, 1, 1), None))), 5
+        )
+
+    def test_pages_match_single_file(self) -> None:
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        dao.create_many(map(self.dao.read, self.dao.read()))
+        cursor = self.dao.read(filter=("description", "coffee"))
+        cursor = next(iter(cursor))
+
+        for order_by in ("date", "amount", "category"):
+            for descending in (False, True):
+                for options in (
+                    {},
+                    {"offset": 2},
+                    {"after": cursor},
+                    {"before": cursor},
+                    {"filter": ("category", "expense"), "offset": 1},
+                ):
+                    with self.subTest(
+                        order_by=order_by, descending=descending, **options
+                    ):
+                        expected = dao.page(
+                            3,
+                            order_by=order_by,
+                            descending=descending,
+                            **options,
+                        )
+                        page = self.dao.page(
+                            3,
+                            order_by=order_by,
+                            descending=descending,
+                            **options,
+                        )
+
+                        self.assertEqual(list(page[0]), list(expected[0]))
+                        self.assertEqual(page[1], expected[1])
+
+    def test_failed_batch_writes_nothing(self) -> None:
+        with self.assertRaises(RecordDoesNotExistError):
+            with self.dao.batch() as batch:
+                batch.create(
+                    OperationDTO(
+                        date=datetime(2024, 5, 1),
+                        category="income",
+                        amount=1,
+                        description="",
+                    )
+                )
+                batch.delete("missing")
+
+        self.assertNotIn("2024-05", self.dao.manifest())
+        self.assertEqual(len(self.dao.read()), 6)
+
+    def test_empty_months_dropped_from_manifest(self) -> None:
+        operation_id = next(iter(self.dao.read(filter=("amount", 5))))
+
+        self.dao.delete(operation_id)
+
+        self.assertNotIn("2024-02", self.dao.manifest())
+        os.remove("test_db.parts/manifest.json")
+        self.assertNotIn("2024-02", self.dao.manifest())
+
+    def test_layout_rebuilt_from_partitions(self) -> None:
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        dao.create_many(operations())
+        operation_id, operation = next(iter(dao.read().items()))
+        write_shards(dao.iter_operations(), "test_db.parts")
+        os.remove("test_db.parts/manifest.json")
+
+        partitioned = DBPartitionedDAO(data_name="test_db", data_type=".json")
+
+        self.assertEqual(sum(partitioned.manifest().values()), 6)
+        self.assertEqual(
+            partitioned.read(operation_id).description,
+            operation["description"],
+        )
+
+        months = partition_storage(directory="test_db.parts", dao=dao)
+
+        self.assertEqual(sum(months.values()), 6)
+        self.assertEqual(
+            partitioned.read(operation_id).description,
+            operation["description"],
+        )
+        with self.assertRaises(ValueError):
+            partition_storage(directory="test_db.parts", dao=partitioned)
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from data_access.dao import DBJsonDAO
+
+
+class QueryTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        for category, amount in (
+            ("income", 1000),
+            ("expense", 50),
+            ("expense", 100),
+            ("expense", 300),
+            ("expense", 500),
+            ("expense", 900),
+        ):
+            self.dao.create(
+                OperationDTO(
+                    category=category, amount=amount, description="test"
+                )
+            )
+
+    def amounts(self, result: dict) -> list[float]:
+        return sorted(operation["amount"] for operation in result.values())
+
+    def test_amount_range(self) -> None:
+        result = self.dao.read(filter=("amount", 100, 500))
+
+        self.assertEqual(self.amounts(result), [100, 300, 500])
+
+    def test_open_ranges(self) -> None:
+        self.assertEqual(
+            self.amounts(self.dao.read(filter=("amount", 600, None))),
+            [900, 1000],
+        )
+        self.assertEqual(
+            self.amounts(self.dao.read(filter=("amount", None, 50))), [50]
+        )
+
+    def test_date_range_by_day(self) -> None:
+        today = datetime.now()
+
+        self.assertEqual(
+            len(self.dao.read(filter=("date", today, today))), 6
+        )
+        self.assertEqual(
+            self.dao.read(
+                filter=("date", None, today - timedelta(days=1))
+            ),
+            {},
+        )
+
+    def test_compound_filter(self) -> None:
+        today = datetime.now()
+        result = self.dao.read(
+            filter=[
+                ("category", "expense"),
+                ("amount", 100, 500),
+                ("date", today.replace(day=1), None),
+            ]
+        )
+
+        self.assertEqual(self.amounts(result), [100, 300, 500])
+
+    def test_range_maintained_after_mutations(self) -> None:
+        self.dao.read(filter=("amount", 0, None))
+        self.dao.create(
+            OperationDTO(category="expense", amount=200, description="new")
+        )
+        self.dao.create(
+            OperationDTO(category="income", amount=7, description="new")
+        )
+
+        result = self.dao.read(
+            filter=[("amount", 150, 250), ("description", "new")]
+        )
+
+        self.assertEqual(self.amounts(result), [200])
@@ -0,0 +1,62 @@
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+from uuid import UUID
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO, OperationRecord
+from business_logic.services import list_operations
+from data_access.dao import DBJsonDAO
+from data_access.sqlite import DBSqliteDAO
+
+
+OPERATION_ID = "a5d569f8-3d3e-491d-a8b3-04996a89ed52"
+
+
+class RecordTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.operation = OperationDTO(
+            id=OPERATION_ID,
+            date=datetime(2024, 3, 1, 12, 30),
+            category="income",
+            amount=100,
+            description="salary",
+        )
+        self.record = OperationRecord(
+            UUID(OPERATION_ID),
+            datetime(2024, 3, 1, 12, 30),
+            "income",
+            100,
+            "salary",
+        )
+
+    def test_records_are_slotted_and_frozen(self) -> None:
+        self.assertFalse(hasattr(self.record, "__dict__"))
+        self.assertFalse(hasattr(self.operation, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            self.record.amount = 0
+
+    def test_iter_records(self) -> None:
+        for dao in (
+            DBJsonDAO(data_name="test_db", data_type=".json"),
+            DBSqliteDAO(data_name="test_db", data_type=".db"),
+        ):
+            with self.subTest(dao=type(dao).__name__):
+                dao.create(self.operation)
+                dao.create(
+                    OperationDTO(
+                        category="expense", amount=5, description="coffee"
+                    )
+                )
+
+                records = list(dao.iter_records(filter=("category", "income")))
+
+                self.assertEqual(records, [self.record])
+
+    def test_listed_operations_are_records(self) -> None:
+        self.dao.create(self.operation)
+
+        operations, total = list_operations(dao=self.dao)
+
+        self.assertEqual((operations, total), ([self.record], 1))
@@ -0,0 +1,226 @@
+import unittest
+from os import remove
+from datetime import date, datetime
+
+from business_logic.dto import OperationDTO
+from business_logic.services import get_all_operation_paginate, get_balance
+from data_access.dao import db_provider
+from data_access.sqlite import DBSqliteDAO
+from data_access.exceptions import RecordDoesNotExistError
+
+
+class SqliteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dao = db_provider(data_name="test_db", data_type=".sqlite3")
+        self.dao.create(
+            OperationDTO(
+                id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+                category="income",
+                amount=666,
+                description="test",
+            )
+        )
+        self.dao.create(
+            OperationDTO(category="expense", amount=100, description="test")
+        )
+        self.dao.create(
+            OperationDTO(category="expense", amount=66, description="test")
+        )
+
+    def tearDown(self) -> None:
+        self.dao.close()
+        remove("test_db.sqlite3")
+
+    def test_provider_selects_sqlite(self) -> None:
+        self.assertIsInstance(self.dao, DBSqliteDAO)
+
+    def test_read_all_in_insertion_order(self) -> None:
+        result = self.dao.read()
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(
+            list(result)[0], "a5d569f8-3d3e-491d-a8b3-04996a89ed52"
+        )
+        self.assertEqual(
+            [operation["amount"] for operation in result.values()],
+            [666, 100, 66],
+        )
+
+    def test_read_by_id(self) -> None:
+        result = self.dao.read(
+            operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52"
+        )
+
+        self.assertIsInstance(result, OperationDTO)
+        self.assertEqual(result.amount, 666)
+
+    def test_read_with_filters(self) -> None:
+        self.assertEqual(
+            len(self.dao.read(filter=("category", "expense"))), 2
+        )
+        self.assertEqual(len(self.dao.read(filter=("amount", 100.0))), 1)
+        self.assertEqual(
+            len(self.dao.read(filter=("date", datetime.now()))), 3
+        )
+        self.assertEqual(
+            self.dao.read(filter=("date", datetime(2000, 1, 1))), {}
+        )
+
+    def test_update_keeps_unchanged_fields(self) -> None:
+        self.dao.update(
+            operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+            data=OperationDTO(category="", amount=1, description=""),
+        )
+        result = self.dao.read(
+            operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52"
+        )
+
+        self.assertEqual(result.category, "income")
+        self.assertEqual(result.amount, 1)
+
+    def test_missing_record(self) -> None:
+        with self.assertRaises(RecordDoesNotExistError):
+            self.dao.delete("96395705-58cf-4806-ab40-b6b7c31f0b20")
+
+        with self.assertRaises(RecordDoesNotExistError):
+            self.dao.update(
+                "96395705-58cf-4806-ab40-b6b7c31f0b20",
+                OperationDTO(category="income", amount=1, description="x"),
+            )
+
+    def test_services_with_sqlite(self) -> None:
+        self.assertEqual(get_balance(dao=self.dao), 500.0)
+
+        result = get_all_operation_paginate(per_page=2, dao=self.dao)
+
+        self.assertEqual(len(result[1]), 2)
+        self.assertEqual(result[2], {"next"})
+
+    def test_totals_maintained_by_triggers(self) -> None:
+        self.dao.update(
+            operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+            data=OperationDTO(category="expense", amount=0, description=""),
+        )
+
+        self.assertEqual(
+            self.dao.totals(), {"expense": {"amount": 832.0, "count": 3}}
+        )
+
+        self.dao.delete("a5d569f8-3d3e-491d-a8b3-04996a89ed52")
+        self.dao.rebuild()
+
+        self.assertEqual(
+            self.dao.totals(), {"expense": {"amount": 166.0, "count": 2}}
+        )
+
+    def test_past_balance_maintained_by_triggers(self) -> None:
+        self.dao.create_many(
+            OperationDTO(
+                date=datetime(2024, 3, day),
+                category="income",
+                amount=day,
+                description="test",
+            )
+            for day in range(1, 11)
+        )
+        self.dao.update(
+            operation_id=next(iter(self.dao.read(filter=("amount", 3.0)))),
+            data=OperationDTO(category="expense", amount=0, description=""),
+        )
+        self.dao.delete(
+            operation_id=next(iter(self.dao.read(filter=("amount", 2.0))))
+        )
+
+        # The rollup is not read for a past balance.
+        self.dao.connection.execute("DELETE FROM daily")
+
+        self.assertEqual(self.dao.balance(as_of=date(2024, 3, 4)), 2)
+        self.assertEqual(self.dao.balance(as_of=date(2024, 3, 5)), 7)
+        self.assertEqual(self.dao.balance(as_of=date(2024, 2, 29)), 0)
+
+        self.dao.rebuild()
+
+        self.assertEqual(self.dao.balance(as_of=date(2024, 3, 5)), 7)
+        self.assertEqual(self.dao.balance(as_of=date.today()), 547)
+
+    def test_read_with_compound_filter(self) -> None:
+        result = self.dao.read(
+            filter=[
+                ("category", "expense"),
+                ("amount", 70, None),
+                ("date", datetime.now(), datetime.now()),
+            ]
+        )
+
+        self.assertEqual(
+            [operation["amount"] for operation in result.values()], [100]
+        )
+
+    def test_page_with_cursor(self) -> None:
+        first, total = self.dao.page(per_page=2)
+        second, _ = self.dao.page(per_page=2, after=list(first)[-1])
+        previous, _ = self.dao.page(per_page=2, before=list(second)[0])
+
+        self.assertEqual(total, 3)
+        self.assertEqual(list(first), list(previous))
+        self.assertEqual(
+            [operation["amount"] for operation in second.values()], [66]
+        )
+
+    def test_page_sorted_by_amount_descending(self) -> None:
+        first, _ = self.dao.page(
+            per_page=2, order_by="amount", descending=True
+        )
+        second, _ = self.dao.page(
+            per_page=2,
+            after=list(first)[-1],
+            order_by="amount",
+            descending=True,
+        )
+        previous, _ = self.dao.page(
+            per_page=2,
+            before=list(second)[0],
+            order_by="amount",
+            descending=True,
+        )
+
+        self.assertEqual(
+            [operation["amount"] for operation in first.values()], [666, 100]
+        )
+        self.assertEqual(
+            [operation["amount"] for operation in second.values()], [66]
+        )
+        self.assertEqual(list(first), list(previous))
+
+    def test_create_many(self) -> None:
+        count = self.dao.create_many(
+            [
+                OperationDTO(
+                    category="income",
+                    amount=10,
+                    description="test",
+                    date=datetime(2024, 3, 1),
+                ),
+                OperationDTO(category="expense", amount=4, description="test"),
+            ]
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(get_balance(dao=self.dao), 506)
+        dated = self.dao.read(filter=("date", datetime(2024, 3, 1)))
+        self.assertEqual(
+            [operation["amount"] for operation in dated.values()], [10]
+        )
+
+    def test_failed_batch_is_rolled_back(self) -> None:
+        with self.assertRaises(RecordDoesNotExistError):
+            with self.dao.batch() as batch:
+                batch.create(
+                    OperationDTO(
+                        category="income", amount=1, description="test"
+                    )
+                )
+                batch.delete("96395705-58cf-4806-ab40-b6b7c31f0b20")
+
+        self.assertEqual(len(self.dao.read()), 3)
+        self.assertEqual(get_balance(dao=self.dao), 500)
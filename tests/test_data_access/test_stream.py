@@ -0,0 +1,69 @@
+import json
+import tracemalloc
+from io import StringIO
+from datetime import datetime
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from data_access.dao import DBJsonDAO
+from data_access.stream import iter_json_object
+
+
+class StreamTests(BaseTests):
+    def test_matches_json_load_for_any_chunk_size(self) -> None:
+        data = {
+            "a": {"amount": 12345, "description": 'quote " and }'},
+            "b": [1, 2.5, None, True],
+            "c": 1234567,
+            "ключ": "значение",
+        }
+        for indent in (None, 2):
+            text = json.dumps(data, indent=indent, ensure_ascii=False)
+            for chunk_size in (1, 2, 3, 7, 64):
+                result = dict(
+                    iter_json_object(StringIO(text), chunk_size=chunk_size)
+                )
+                self.assertEqual(result, data)
+
+    def test_empty_object(self) -> None:
+        self.assertEqual(list(iter_json_object(StringIO(" {} "))), [])
+
+    def test_invalid_document(self) -> None:
+        for text in ("[]", '{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}'):
+            with self.assertRaises(ValueError):
+                list(iter_json_object(StringIO(text), chunk_size=2))
+
+    def test_iter_operations_with_filter(self) -> None:
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        dao.create(
+            OperationDTO(category="income", amount=100, description="test")
+        )
+        dao.create(
+            OperationDTO(category="expense", amount=30, description="test")
+        )
+
+        self.assertEqual(len(list(dao.iter_operations())), 2)
+        operations = dao.iter_operations(
+            filter=[("date", datetime.now(), None), ("amount", 50, 200)]
+        )
+
+        self.assertEqual(
+            [operation["amount"] for _, operation in operations], [100]
+        )
+
+    def test_memory_bounded_by_record_size(self) -> None:
+        data = {
+            str(index): {"amount": index, "description": "x" * 40}
+            for index in range(20000)
+        }
+        text = json.dumps(data, indent=2)
+        file = StringIO(text)
+
+        tracemalloc.start()
+        count = sum(1 for _ in iter_json_object(file))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(count, 20000)
+        self.assertLess(peak, len(text) // 4)
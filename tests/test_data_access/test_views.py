@@ -0,0 +1,252 @@
+import json
+import os
+from datetime import date, datetime
+from unittest.mock import patch
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from data_access.dao import DBJsonDAO
+from data_access.fenwick import FenwickTree
+from data_access.journal import DBJournalDAO
+from data_access.sqlite import DBSqliteDAO
+
+
+class BalanceViewTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        self.dao.create(
+            OperationDTO(
+                id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+                category="income",
+                amount=100,
+                description="test",
+            )
+        )
+        self.dao.create(
+            OperationDTO(category="expense", amount=30, description="test")
+        )
+
+    def test_totals_maintained_on_mutations(self) -> None:
+        self.dao.update(
+            operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+            data=OperationDTO(category="expense", amount=0, description=""),
+        )
+
+        self.assertEqual(
+            self.dao.totals(), {"expense": {"amount": 130.0, "count": 2}}
+        )
+
+        self.dao.delete(operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52")
+
+        self.assertEqual(
+            self.dao.totals(), {"expense": {"amount": 30.0, "count": 1}}
+        )
+
+    def test_persisted_totals_read_without_loading_data(self) -> None:
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+
+        with patch.object(DBJsonDAO, "_load") as load:
+            totals = dao.totals()
+
+        load.assert_not_called()
+        self.assertEqual(totals["income"], {"amount": 100, "count": 1})
+
+    def test_stale_totals_rebuilt_after_external_change(self) -> None:
+        with open("test_db.json", "w") as file:
+            json.dump({}, file)
+
+        self.assertEqual(self.dao.totals(), {})
+
+    def test_journal_totals_include_journal_entries(self) -> None:
+        dao = DBJournalDAO(data_name="test_db", data_type=".json")
+        dao.create(
+            OperationDTO(category="expense", amount=20, description="test")
+        )
+
+        reopened = DBJournalDAO(data_name="test_db", data_type=".json")
+
+        self.assertEqual(reopened.totals()["expense"]["count"], 2)
+        self.assertEqual(reopened.totals()["expense"]["amount"], 50)
+
+
+class IndexViewTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        self.dao.create(
+            OperationDTO(
+                id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+                category="income",
+                amount=100,
+                description="test",
+            )
+        )
+        self.dao.create(
+            OperationDTO(category="expense", amount=30, description="test")
+        )
+
+    def test_filters_use_index(self) -> None:
+        index = self.dao.view("index").to_dict()
+
+        self.assertEqual(
+            index["category"]["income"],
+            ["a5d569f8-3d3e-491d-a8b3-04996a89ed52"],
+        )
+        self.assertEqual(len(index["date"]), 1)
+
+        result = self.dao.read(filter=("amount", 100))
+
+        self.assertEqual(
+            list(result), ["a5d569f8-3d3e-491d-a8b3-04996a89ed52"]
+        )
+        self.assertEqual(len(self.dao.read(filter=("category", "expense"))), 1)
+        self.assertEqual(
+            len(self.dao.read(filter=("date", datetime.now()))), 2
+        )
+
+    def test_index_maintained_on_update_and_delete(self) -> None:
+        self.dao.update(
+            operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+            data=OperationDTO(category="expense", amount=0, description=""),
+        )
+
+        self.assertEqual(len(self.dao.read(filter=("category", "income"))), 0)
+        self.assertEqual(len(self.dao.read(filter=("category", "expense"))), 2)
+        self.assertEqual(len(self.dao.read(filter=("amount", 100.0))), 1)
+
+        self.dao.delete(operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52")
+
+        self.assertEqual(self.dao.read(filter=("amount", 100.0)), {})
+
+    def test_unindexed_filter_scans(self) -> None:
+        result = self.dao.read(filter=("description", "test"))
+
+        self.assertEqual(len(result), 2)
+
+    def test_sort_orders_not_rewritten_on_writes(self) -> None:
+        self.dao.rebuild()
+        stats = {
+            path: os.stat(path).st_mtime_ns
+            for path in ("test_db.index.json", "test_db.order.json")
+        }
+
+        self.dao.create(
+            OperationDTO(category="income", amount=5, description="")
+        )
+
+        self.assertEqual(
+            {path: os.stat(path).st_mtime_ns for path in stats}, stats
+        )
+        self.assertEqual(len(self.dao.read(filter=("category", "income"))), 2)
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+        self.assertEqual(len(dao.read(filter=("category", "income"))), 2)
+        operations, _ = dao.page(per_page=3, order_by="amount")
+        self.assertEqual(
+            [operation["amount"] for operation in operations.values()],
+            [5, 30, 100],
+        )
+
+
+class DailyViewTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.operations = (
+            OperationDTO(
+                id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+                date=datetime(2024, 3, 1, 9),
+                category="income",
+                amount=100,
+                description="salary",
+            ),
+            OperationDTO(
+                date=datetime(2024, 3, 1, 18),
+                category="expense",
+                amount=30,
+                description="coffee",
+            ),
+            OperationDTO(
+                date=datetime(2024, 3, 5),
+                category="expense",
+                amount=20,
+                description="lunch",
+            ),
+        )
+
+    def test_daily_totals_maintained_on_mutations(self) -> None:
+        for dao in (
+            DBJsonDAO(data_name="test_db", data_type=".json"),
+            DBSqliteDAO(data_name="test_db", data_type=".db"),
+        ):
+            with self.subTest(dao=type(dao).__name__):
+                dao.create_many(self.operations)
+                dao.update(
+                    operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52",
+                    data=OperationDTO(
+                        category="expense", amount=10, description=""
+                    ),
+                )
+
+                self.assertEqual(
+                    dao.daily_totals(),
+                    {
+                        date(2024, 3, 1): {
+                            "expense": {"amount": 40, "count": 2}
+                        },
+                        date(2024, 3, 5): {
+                            "expense": {"amount": 20, "count": 1}
+                        },
+                    },
+                )
+
+                dao.delete(
+                    operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52"
+                )
+
+                self.assertEqual(
+                    dao.daily_totals(start=datetime(2024, 3, 1, 12)),
+                    {
+                        date(2024, 3, 1): {
+                            "expense": {"amount": 30, "count": 1}
+                        },
+                        date(2024, 3, 5): {
+                            "expense": {"amount": 20, "count": 1}
+                        },
+                    },
+                )
+                self.assertEqual(
+                    list(dao.daily_totals(end=date(2024, 3, 4))),
+                    [date(2024, 3, 1)],
+                )
+
+    def test_persisted_rollup_matches_rebuilt(self) -> None:
+        self.dao.create_many(self.operations)
+        self.dao.delete(operation_id="a5d569f8-3d3e-491d-a8b3-04996a89ed52")
+        daily = self.dao.daily_totals()
+
+        self.dao.rebuild()
+
+        self.assertEqual(
+            DBJsonDAO(data_name="test_db", data_type=".json").daily_totals(),
+            daily,
+        )
+        self.assertEqual(len(daily), 2)
+
+    def test_balance_tree_persisted(self) -> None:
+        self.dao.create_many(self.operations)
+        dao = DBJsonDAO(data_name="test_db", data_type=".json")
+
+        # The reloaded view restores the tree instead of building one.
+        with patch.object(FenwickTree, "__init__", side_effect=AssertionError):
+            self.assertEqual(dao.balance(as_of=date(2024, 3, 4)), 70)
+            dao.create(
+                OperationDTO(
+                    date=datetime(2024, 3, 2),
+                    category="income",
+                    amount=5,
+                    description="",
+                )
+            )
+            self.assertEqual(dao.balance(as_of=date(2024, 3, 4)), 75)
+            self.assertEqual(dao.balance(), 55)
@@ -0,0 +1,198 @@
+import json
+import threading
+from http.client import HTTPConnection, HTTPResponse
+from typing import Any, Optional
+from unittest.mock import patch
+
+from tests.test_app import BaseTests
+
+from data_access.dao import DBJsonDAO
+from data_access.sqlite import DBSqliteDAO
+from presentation.server import LedgerServer
+
+
+class ServerTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao = self.create_dao()
+        self.server = LedgerServer(("127.0.0.1", 0), dao=self.dao, log=False)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.connection = HTTPConnection(*self.server.server_address)
+
+    def tearDown(self) -> None:
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        super().tearDown()
+
+    def create_dao(self) -> DBJsonDAO | DBSqliteDAO:
+        return self.dao
+
+    def request(
+        self, method: str, path: str, body: Optional[Any] = None
+    ) -> tuple[HTTPResponse, Any]:
+        self.connection.request(
+            method,
+            path,
+            body=json.dumps(body) if body is not None else None,
+            headers={"Content-Type": "application/json"},
+        )
+        response = self.connection.getresponse()
+        payload = response.read()
+        return response, json.loads(payload) if payload else None
+
+    def create(self, category: str, amount: float) -> str:
+        response, operation = self.request(
+            "POST",
+            "/operations",
+            {"category": category, "amount": amount, "description": "test"},
+        )
+        self.assertEqual(response.status, 201)
+        return operation["id"]
+
+    def test_crud_over_one_connection(self) -> None:
+        operation_id = self.create("income", 100)
+        self.create("expense", 30)
+        socket = self.connection.sock
+
+        _, operation = self.request("GET", f"/operations/{operation_id}")
+        self.assertEqual(operation["amount"], 100)
+
+        response, operation = self.request(
+            "PATCH", f"/operations/{operation_id}", {"amount": 150}
+        )
+        self.assertEqual(response.status, 200)
+        self.assertEqual(operation["amount"], 150)
+        self.assertEqual(operation["category"], "income")
+
+        _, balance = self.request("GET", "/balance")
+        self.assertEqual(balance, {"balance": 120})
+        _, balance = self.request("GET", "/balance?as_of=01-01-2000")
+        self.assertEqual(balance, {"balance": 0})
+
+        response, _ = self.request("DELETE", f"/operations/{operation_id}")
+        self.assertEqual(response.status, 204)
+
+        response, error = self.request("GET", f"/operations/{operation_id}")
+        self.assertEqual(response.status, 404)
+        self.assertIn("error", error)
+
+        # Every request reused the same keep-alive connection.
+        self.assertIs(self.connection.sock, socket)
+
+    def test_list_with_filter_order_and_cursor(self) -> None:
+        for amount in (5, 50, 20, 10):
+            self.create("expense", amount)
+        self.create("income", 1000)
+
+        _, first = self.request(
+            "GET",
+            "/operations?category=expense&order_by=amount&descending=true"
+            "&per_page=2",
+        )
+        after = first["operations"][-1]["id"]
+        _, second = self.request(
+            "GET",
+            "/operations?category=expense&order_by=amount&descending=true"
+            f"&per_page=2&after={after}",
+        )
+
+        self.assertEqual(first["total"], 4)
+        self.assertEqual(
+            [operation["amount"] for operation in first["operations"]],
+            [50, 20],
+        )
+        self.assertEqual(
+            [operation["amount"] for operation in second["operations"]],
+            [10, 5],
+        )
+
+    def test_invalid_requests(self) -> None:
+        response, _ = self.request(
+            "POST",
+            "/operations",
+            {"category": "gift", "amount": 1, "description": "test"},
+        )
+        self.assertEqual(response.status, 400)
+
+        response, _ = self.request("GET", "/operations?per_page=0")
+        self.assertEqual(response.status, 400)
+
+        response, _ = self.request("GET", "/balance?as_of=2024-01-01")
+        self.assertEqual(response.status, 400)
+
+        response, _ = self.request("GET", "/unknown")
+        self.assertEqual(response.status, 400)
+
+    def test_invalid_content_length(self) -> None:
+        # A negative length used to block the handler on the body.
+        self.connection.timeout = 5
+        for length in ("abc", "-1"):
+            with self.subTest(length=length):
+                self.connection.putrequest("POST", "/operations")
+                self.connection.putheader("Content-Length", length)
+                self.connection.endheaders()
+                response = self.connection.getresponse()
+
+                self.assertEqual(response.status, 400)
+                self.assertIn("error", json.loads(response.read()))
+                self.assertEqual(response.getheader("Connection"), "close")
+                self.connection.close()
+
+        response, _ = self.request("GET", "/balance")
+        self.assertEqual(response.status, 200)
+
+    def test_unexpected_error_answered_with_500(self) -> None:
+        with patch(
+            "presentation.server.get_balance", side_effect=RuntimeError
+        ):
+            response, error = self.request("GET", "/balance")
+
+        self.assertEqual(response.status, 500)
+        self.assertIn("error", error)
+        # The connection is still usable.
+        response, _ = self.request("GET", "/balance")
+        self.assertEqual(response.status, 200)
+
+    def test_concurrent_clients(self) -> None:
+        def client() -> None:
+            connection = HTTPConnection(*self.server.server_address)
+            for _ in range(10):
+                connection.request(
+                    "POST",
+                    "/operations",
+                    body=json.dumps(
+                        {
+                            "category": "income",
+                            "amount": 1,
+                            "description": "test",
+                        }
+                    ),
+                )
+                connection.getresponse().read()
+            connection.close()
+
+        clients = [threading.Thread(target=client) for _ in range(4)]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+
+        _, balance = self.request("GET", "/balance")
+        self.assertEqual(balance, {"balance": 40})
+
+
+class SqliteServerTests(ServerTests):
+    """
+    The same API over SQLite, whose connection is used by the handler
+    threads in turn.
+    """
+
+    def create_dao(self) -> DBSqliteDAO:
+        return DBSqliteDAO(data_name="test_db", data_type=".db")
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.dao.close()
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import threading
+import unittest
+from glob import glob
+from os import remove
+
+from business_logic.dto import OperationDTO
+from business_logic.exceptions import OperationDoesNotExistError
+from business_logic.services import asynchronous
+from data_access.async_dao import AsyncDAO
+from data_access.dao import db_provider
+
+
+class AsyncServicesTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        with open("test_db.json", "w") as file:
+            json.dump({}, file)
+
+        self.dao = AsyncDAO(
+            db_provider(data_name="test_db", data_type=".json")
+        )
+
+    def tearDown(self) -> None:
+        self.dao.close()
+        for path in glob("test_db*"):
+            remove(path)
+
+    async def test_concurrent_creates(self) -> None:
+        await asyncio.gather(
+            *(
+                asynchronous.create_operation(
+                    OperationDTO(
+                        category="income", amount=amount, description="test"
+                    ),
+                    dao=self.dao,
+                )
+                for amount in range(1, 21)
+            )
+        )
+
+        self.assertEqual(len(await self.dao.read()), 20)
+        self.assertEqual(await asynchronous.get_balance(dao=self.dao), 210)
+        self.assertTrue(await asynchronous.verify_balance(dao=self.dao))
+
+    async def test_calls_run_off_the_event_loop(self) -> None:
+        thread = await self.dao.run(threading.get_ident)
+
+        self.assertNotEqual(thread, threading.get_ident())
+
+    async def test_page_and_errors(self) -> None:
+        await self.dao.create(
+            OperationDTO(category="expense", amount=5, description="test")
+        )
+
+        text, ids, _ = await asynchronous.get_all_operation_paginate(
+            dao=self.dao
+        )
+        self.assertIn("Amount: 5", text)
+
+        await asynchronous.delete_operation(ids[0], dao=self.dao)
+        with self.assertRaises(OperationDoesNotExistError):
+            await asynchronous.get_operation(ids[0], dao=self.dao)
+
+    async def test_batch(self) -> None:
+        def fill(batch) -> int:
+            for amount in (1, 2, 3):
+                batch.create(
+                    OperationDTO(
+                        category="income", amount=amount, description="test"
+                    )
+                )
+            return len(batch.changes)
+
+        self.assertEqual(await self.dao.batch(fill), 3)
+        self.assertEqual(await asynchronous.get_balance(dao=self.dao), 6)
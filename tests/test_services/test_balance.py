@@ -1,7 +1,15 @@
+from datetime import date, datetime, timedelta
+from random import Random
+
 from tests.test_app import BaseTests
 
-from business_logic.services import get_balance
+from business_logic.services import (
+    get_balance,
+    rebuild_balance,
+    verify_balance,
+)
 from business_logic.dto import OperationDTO
+from data_access.dao import db_provider
 
 
 class BalanceTests(BaseTests):
@@ -58,3 +66,129 @@ class BalanceTests(BaseTests):
 
         self.assertIsInstance(result, float)
         self.assertEqual(result, 0.0)
+
+    def test_verify_balance_successfully(self) -> None:
+        self.dao.create(
+            OperationDTO(
+                category="income", amount=100, description="description"
+            )
+        )
+
+        self.assertTrue(verify_balance(dao=self.dao))
+
+    def test_rebuild_corrupted_balance(self) -> None:
+        self.dao.create(
+            OperationDTO(
+                category="income", amount=100, description="description"
+            )
+        )
+        self.dao.totals()["income"]["amount"] = 1.0
+
+        self.assertFalse(verify_balance(dao=self.dao))
+        self.assertEqual(rebuild_balance(dao=self.dao), 100.0)
+        self.assertTrue(verify_balance(dao=self.dao))
+
+    def test_balance_as_of_past_days(self) -> None:
+        operations = (
+            (datetime(2023, 12, 31, 23), "income", 1000),
+            (datetime(2024, 1, 1), "expense", 30),
+            (datetime(2024, 1, 31, 18), "expense", 20),
+            (datetime(2024, 3, 15), "income", 5),
+        )
+        expected = {
+            date(2023, 12, 30): 0,
+            date(2023, 12, 31): 1000,
+            datetime(2024, 1, 31): 950,
+            date(2024, 2, 29): 950,
+            date(2030, 1, 1): 955,
+        }
+
+        for dao in (
+            self.dao,
+            db_provider("test_db", ".db"),
+            db_provider("test_db", ".json", partitioned=True),
+        ):
+            with self.subTest(dao=type(dao).__name__):
+                dao.create_many(
+                    OperationDTO(
+                        date=day,
+                        category=category,
+                        amount=amount,
+                        description="description",
+                    )
+                    for day, category, amount in operations
+                )
+
+                self.assertEqual(
+                    {
+                        as_of: get_balance(as_of=as_of, dao=dao)
+                        for as_of in expected
+                    },
+                    expected,
+                )
+
+    def test_balance_as_of_maintained_on_mutations(self) -> None:
+        rng = Random(0)
+        operations: dict[str, OperationDTO] = {}
+        first = date(2024, 1, 1)
+
+        for step in range(200):
+            if operations and rng.random() < 0.3:
+                operation_id = rng.choice(list(operations))
+                del operations[operation_id]
+                self.dao.delete(operation_id=operation_id)
+                continue
+            # Dates before and far after the first ones grow the range.
+            days = rng.randint(-30, 30) * (step // 50 + 1)
+            day = first + timedelta(days=days)
+            data = OperationDTO(
+                date=datetime(day.year, day.month, day.day),
+                category=rng.choice(("income", "expense")),
+                amount=rng.randint(1, 100),
+                description="description",
+            )
+            operations[self.dao.create(data)] = data
+
+            as_of = first + timedelta(days=rng.randint(-100, 100))
+            self.assertEqual(
+                get_balance(as_of=as_of, dao=self.dao),
+                sum(
+                    data.amount if data.category == "income" else -data.amount
+                    for data in operations.values()
+                    if data.date.date() <= as_of
+                ),
+            )
+
+    def test_fractional_amounts_after_create_and_delete(self) -> None:
+        for dao in (
+            self.dao,
+            db_provider("test_db", ".db"),
+            db_provider("test_db", ".json", partitioned=True),
+        ):
+            with self.subTest(dao=type(dao).__name__):
+                ids = [
+                    dao.create(
+                        OperationDTO(
+                            date=datetime(2024, 3, 1),
+                            category="income",
+                            amount=amount,
+                            description="description",
+                        )
+                    )
+                    for amount in (0.1, 0.2, 0.3)
+                ]
+                dao.create(
+                    OperationDTO(
+                        date=datetime(2024, 3, 2),
+                        category="expense",
+                        amount=0.7,
+                        description="description",
+                    )
+                )
+                dao.delete(operation_id=ids[0])
+
+                self.assertEqual(get_balance(dao=dao), -0.2)
+                self.assertEqual(get_balance(dao), -0.2)
+                self.assertEqual(
+                    get_balance(dao=dao, as_of=date(2024, 3, 1)), 0.5
+                )
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.exceptions import OperationDoesNotExistError
+from business_logic.services import get_balance, operation_batch
+from data_access.dao import DBJsonDAO
+
+
+class BatchTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao.create(
+            OperationDTO(category="income", amount=100, description="test")
+        )
+        self.operation_id = list(self.dao.read())[0]
+
+    def test_batch_writes_once(self) -> None:
+        with patch.object(
+            DBJsonDAO, "_dump", autospec=True, side_effect=DBJsonDAO._dump
+        ) as dump:
+            with operation_batch(dao=self.dao) as batch:
+                new_id = batch.create(
+                    OperationDTO(
+                        category="expense", amount=30, description="test"
+                    )
+                )
+                batch.update(
+                    operation_id=self.operation_id,
+                    data=OperationDTO(
+                        category="", amount=200, description=""
+                    ),
+                )
+                batch.update(
+                    operation_id=new_id,
+                    data=OperationDTO(category="", amount=50, description=""),
+                )
+
+        dump.assert_called_once()
+        self.assertEqual(get_balance(dao=self.dao), 150)
+        self.assertEqual(len(self.dao.read(filter=("amount", 50))), 1)
+
+    def test_failed_batch_changes_nothing(self) -> None:
+        with self.assertRaises(OperationDoesNotExistError):
+            with operation_batch(dao=self.dao) as batch:
+                batch.delete(operation_id=self.operation_id)
+                batch.create(
+                    OperationDTO(
+                        category="expense", amount=30, description="test"
+                    )
+                )
+                batch.delete(
+                    operation_id="96395705-58cf-4806-ab40-b6b7c31f0b20"
+                )
+
+        self.assertEqual(list(self.dao.read()), [self.operation_id])
+        self.assertEqual(get_balance(dao=self.dao), 100)
+
+    def test_empty_batch_does_not_write(self) -> None:
+        with patch.object(DBJsonDAO, "_dump") as dump:
+            with operation_batch(dao=self.dao):
+                pass
+
+        dump.assert_not_called()
@@ -0,0 +1,58 @@
+import csv
+import json
+from io import StringIO
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import export_operations
+from presentation.exporter import write_operations
+
+
+class ExportTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        for category, amount in (("income", 100), ("expense", 30.5)):
+            self.dao.create(
+                OperationDTO(
+                    category=category, amount=amount, description="тест"
+                )
+            )
+
+    def test_export_csv(self) -> None:
+        file = StringIO(newline="")
+
+        count = write_operations(export_operations(dao=self.dao), file, "csv")
+
+        rows = list(csv.DictReader(StringIO(file.getvalue())))
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            list(rows[0]), ["id", "date", "category", "amount", "description"]
+        )
+        self.assertEqual([row["amount"] for row in rows], ["100", "30.5"])
+        self.assertEqual(rows[1]["description"], "тест")
+
+    def test_export_filtered_jsonl(self) -> None:
+        file = StringIO()
+
+        count = write_operations(
+            export_operations(filter=("category", "expense"), dao=self.dao),
+            file,
+            "jsonl",
+        )
+
+        records = [json.loads(line) for line in file.getvalue().splitlines()]
+        self.assertEqual(count, 1)
+        self.assertEqual(records[0]["amount"], 30.5)
+        self.assertIn(records[0]["id"], self.dao.read())
+
+    def test_export_streams_operations(self) -> None:
+        operations = export_operations(dao=self.dao)
+
+        self.assertEqual(next(operations).amount, 100)
+
+    def test_unsupported_format(self) -> None:
+        with self.assertRaises(ValueError):
+            write_operations(
+                export_operations(dao=self.dao), StringIO(), "xml"
+            )
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import (
+    export_operations,
+    get_balance,
+    import_operations,
+)
+from data_access.dao import DBJsonDAO
+from data_access.dates import from_timestamp
+from presentation.exceptions import ImportFileError
+from presentation.exporter import EXPORT_FORMATS, write_operations
+from presentation.importer import read_operations
+
+
+class ImportTests(BaseTests):
+    def write(self, path: str, content: str) -> str:
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_import_csv(self) -> None:
+        path = self.write(
+            "test_db_import.csv",
+            "date,category,amount,description\n"
+            "01-03-2024,income,1000,salary\n"
+            ",expense,250.5,rent\n",
+        )
+
+        count = import_operations(read_operations(path), dao=self.dao)
+
+        operations = list(self.dao.read().values())
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            from_timestamp(operations[0]["date"]), datetime(2024, 3, 1)
+        )
+        self.assertEqual(operations[1]["amount"], 250.5)
+        self.assertEqual(get_balance(dao=self.dao), 749.5)
+
+    def test_import_jsonl(self) -> None:
+        path = self.write(
+            "test_db_import.jsonl",
+            '{"category": "income", "amount": 10, "description": "a"}\n'
+            "\n"
+            '{"category": "expense", "amount": "4", "description": "b"}\n',
+        )
+
+        count = import_operations(read_operations(path), dao=self.dao)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(get_balance(dao=self.dao), 6)
+
+    def test_export_import_round_trip(self) -> None:
+        for category, amount, date in (
+            ("income", 1000, datetime(2024, 3, 1, 9, 30, 15, 250)),
+            ("expense", 250.5, datetime(2024, 3, 2, 18)),
+        ):
+            self.dao.create(
+                OperationDTO(
+                    date=date,
+                    category=category,
+                    amount=amount,
+                    description="тест, \"кавычки\"",
+                )
+            )
+
+        for file_format in EXPORT_FORMATS:
+            with self.subTest(file_format=file_format):
+                path = f"test_db_export.{file_format}"
+                with open(path, "w", encoding="utf-8", newline="") as file:
+                    write_operations(
+                        export_operations(dao=self.dao), file, file_format
+                    )
+                with open(f"test_db_{file_format}.json", "w") as file:
+                    file.write("{}")
+                dao = DBJsonDAO(
+                    data_name=f"test_db_{file_format}", data_type=".json"
+                )
+
+                import_operations(read_operations(path), dao=dao)
+
+                self.assertEqual(
+                    [
+                        (record.date, record.category, record.amount)
+                        + (record.description,)
+                        for record in dao.iter_records()
+                    ],
+                    [
+                        (record.date, record.category, record.amount)
+                        + (record.description,)
+                        for record in self.dao.iter_records()
+                    ],
+                )
+
+    def test_iso_date_with_time_zone(self) -> None:
+        path = self.write(
+            "test_db_import.jsonl",
+            '{"date": "2024-03-01T12:00:00+00:00", "category": "income", '
+            '"amount": 1, "description": "a"}\n',
+        )
+
+        operation = next(read_operations(path))
+
+        self.assertEqual(
+            operation.date,
+            datetime(2024, 3, 1, 12, tzinfo=timezone.utc)
+            .astimezone()
+            .replace(tzinfo=None),
+        )
+
+    def test_invalid_row_imports_nothing(self) -> None:
+        path = self.write(
+            "test_db_import.jsonl",
+            '{"category": "income", "amount": 10, "description": "a"}\n'
+            '{"category": "gift", "amount": 4, "description": "b"}\n',
+        )
+
+        with self.assertRaisesRegex(ImportFileError, "^Line 2: "):
+            import_operations(read_operations(path), dao=self.dao)
+
+        self.assertEqual(self.dao.read(), {})
+
+    def test_csv_without_required_columns(self) -> None:
+        path = self.write("test_db_import.csv", "category,amount\n")
+
+        with self.assertRaises(ImportFileError):
+            list(read_operations(path))
+
+    def test_unsupported_file_type(self) -> None:
+        with self.assertRaises(ImportFileError):
+            list(read_operations("test_db_import.txt"))
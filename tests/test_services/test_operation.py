@@ -73,6 +73,20 @@ class OperationTests(BaseTests):
         self.assertIsInstance(result[1], list)
         self.assertEqual(result[2], {"prev"})
 
+    def test_get_next_2_operations_by_cursor_successfully(self) -> None:
+        _, ids, _ = get_all_operation_paginate(per_page=2, dao=self.dao)
+        result = get_all_operation_paginate(
+            per_page=2, page_number=2, dao=self.dao, after=ids[-1]
+        )
+        previous = get_all_operation_paginate(
+            per_page=2, page_number=1, dao=self.dao, before=result[1][0]
+        )
+
+        self.assertEqual(len(result[1]), 2)
+        self.assertNotIn(ids[-1], result[1])
+        self.assertEqual(result[2], {"prev", "next"})
+        self.assertEqual(previous[1], ids)
+
     def test_get_2_operations_with_filter_successfully(self) -> None:
         filter = ("category", "income")
         result = get_all_operation_paginate(
@@ -0,0 +1,120 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+from tests.test_app import BaseTests
+
+from business_logic.dto import OperationDTO
+from business_logic.services import (
+    get_period_report,
+    get_period_report_text,
+)
+
+
+OPERATIONS = (
+    (datetime(2023, 12, 31, 23), "income", 1000, "salary"),
+    (datetime(2024, 1, 1), "expense", 30, "coffee"),
+    (datetime(2024, 1, 7, 18), "expense", 20, "coffee"),
+    (datetime(2024, 1, 8), "income", 5, "refund"),
+    (datetime(2024, 3, 15), "expense", 250, "rent"),
+)
+
+
+class PeriodReportTests(BaseTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dao.create_many(
+            OperationDTO(
+                date=date,
+                category=category,
+                amount=amount,
+                description=description,
+            )
+            for date, category, amount, description in OPERATIONS
+        )
+
+    def test_monthly_totals_with_running_balance(self) -> None:
+        report = get_period_report(dao=self.dao)
+
+        self.assertEqual(
+            [
+                (totals.start, totals.amounts, totals.net, totals.balance)
+                for totals in report
+            ],
+            [
+                (date(2023, 12, 1), {"income": 1000}, 1000, 1000),
+                (
+                    date(2024, 1, 1),
+                    {"expense": 50, "income": 5},
+                    -45,
+                    955,
+                ),
+                (date(2024, 3, 1), {"expense": 250}, -250, 705),
+            ],
+        )
+        self.assertEqual(report[1].counts, {"expense": 2, "income": 1})
+
+    def test_weeks_start_on_monday_and_opening_balance(self) -> None:
+        report = get_period_report(
+            period="week",
+            start=date(2024, 1, 1),
+            end=date(2024, 1, 31),
+            dao=self.dao,
+        )
+
+        self.assertEqual(
+            [(totals.start, totals.balance) for totals in report],
+            [(date(2024, 1, 1), 950), (date(2024, 1, 8), 955)],
+        )
+
+    def test_days_before_start_not_summed(self) -> None:
+        with patch.object(
+            self.dao, "daily_totals", wraps=self.dao.daily_totals
+        ) as daily_totals:
+            report = get_period_report(
+                period="year", start=datetime(2024, 1, 8, 12), dao=self.dao
+            )
+
+        daily_totals.assert_called_once_with(
+            start=datetime(2024, 1, 8, 12), end=None
+        )
+        self.assertEqual(
+            [(totals.start, totals.net, totals.balance) for totals in report],
+            [(date(2024, 1, 1), -245, 705)],
+        )
+
+    def test_fractional_amounts_rounded_to_cents(self) -> None:
+        ids = [
+            self.dao.create(
+                OperationDTO(
+                    date=datetime(2024, 4, 1),
+                    category="income",
+                    amount=amount,
+                    description="description",
+                )
+            )
+            for amount in (0.1, 0.2, 0.3)
+        ]
+        self.dao.delete(operation_id=ids[0])
+
+        totals = get_period_report(
+            period="day", start=date(2024, 4, 1), dao=self.dao
+        )[0]
+
+        self.assertEqual(totals.amounts, {"income": 0.5})
+        self.assertEqual(totals.net, 0.5)
+        self.assertEqual(totals.balance, 705.5)
+
+    def test_unknown_period(self) -> None:
+        with self.assertRaises(ValueError):
+            get_period_report(period="decade", dao=self.dao)
+
+    def test_report_text(self) -> None:
+        text = get_period_report_text(period="year", dao=self.dao)
+
+        self.assertIn("Year from 01-01-2024", text)
+        self.assertIn("Expense: 300.0 (3 operations)", text)
+        self.assertIn("Balance: 705.0", text)
+        self.assertIn(
+            "No operations found.",
+            get_period_report_text(start=date(2025, 1, 1), dao=self.dao),
+        )
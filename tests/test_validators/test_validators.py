@@ -2,6 +2,8 @@ from tests.test_app import BaseTests
 
 from presentation.validators import (
     validate_amount,
+    validate_amount_range,
+    validate_date_range,
     validate_category,
     validate_date,
     validate_description,
@@ -128,3 +130,26 @@ class ValidatorsTests(BaseTests):
         )
 
         self.assertIsNone(result)
+
+    def test_validate_date_range_successfully(self) -> None:
+        self.assertIsNone(validate_date_range("01-03-2024", "31-03-2024"))
+        self.assertIsNone(validate_date_range("", "31-03-2024"))
+        self.assertIsNone(validate_date_range("", ""))
+
+    def test_validate_date_range_wrong(self) -> None:
+        with self.assertRaises(DateError):
+            validate_date_range("31-03-2024", "01-03-2024")
+
+        with self.assertRaises(DateError):
+            validate_date_range("2024-03-01", "")
+
+    def test_validate_amount_range_successfully(self) -> None:
+        self.assertIsNone(validate_amount_range("100", "500"))
+        self.assertIsNone(validate_amount_range("100", ""))
+
+    def test_validate_amount_range_wrong(self) -> None:
+        with self.assertRaises(AmountError):
+            validate_amount_range("500", "100")
+
+        with self.assertRaises(AmountError):
+            validate_amount_range("", "test")